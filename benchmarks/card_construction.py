@@ -0,0 +1,71 @@
+"""
+Benchmark the cost of constructing a Card from Scryfall JSON, and of the
+enum normalization that dominates it.
+
+Compares the previous linear scan over an Enum's values with the lookup
+tables `ExtendedEnum` now builds once per Enum.
+
+Usage:
+    python benchmarks/card_construction.py [--repeat N]
+"""
+
+import argparse
+import json
+import timeit
+from pathlib import Path
+
+from scooze.card import Card
+from scooze.catalogs import Format, Legality
+from scooze.utils import JsonNormalizer
+
+TEST_DATA_DIR = Path(__file__).parent.parent / "data" / "test"
+
+
+def load_card_jsons() -> list[dict]:
+    with (TEST_DATA_DIR / "test_cards.jsonl").open() as f:
+        card_jsons = [json.loads(line) for line in f]
+    with (TEST_DATA_DIR / "default_cards.json").open() as f:
+        card_jsons.extend(json.load(f))
+    return card_jsons
+
+
+def construct_cards(card_jsons: list[dict]) -> None:
+    for card_json in card_jsons:
+        Card(**card_json)
+
+
+def scan_legalities(legalities: list[dict]) -> None:
+    for card_legalities in legalities:
+        for k, v in card_legalities.items():
+            Format(k) if k in list(map(lambda c: c.value, Format)) else Format[k.upper()]
+            Legality(v) if v in list(map(lambda c: c.value, Legality)) else Legality[v.upper()]
+
+
+def look_up_legalities(legalities: list[dict]) -> None:
+    for card_legalities in legalities:
+        JsonNormalizer.to_frozendict(card_legalities, convert_key_to_enum=Format, convert_value_to_enum=Legality)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=20, help="Number of passes over the test cards.")
+    args = parser.parse_args()
+
+    card_jsons = load_card_jsons()
+    legalities = [card_json["legalities"] for card_json in card_jsons if "legalities" in card_json]
+    total_cards = len(card_jsons) * args.repeat
+
+    elapsed = min(timeit.repeat(lambda: construct_cards(card_jsons), number=args.repeat, repeat=3))
+    print(f"{'Card(**json)':<36} {elapsed / total_cards * 1e6:8.1f} us/card")
+
+    total_legalities = len(legalities) * args.repeat
+    for label, func in (
+        ("legalities, scanning Enum values", scan_legalities),
+        ("legalities, lookup tables", look_up_legalities),
+    ):
+        elapsed = min(timeit.repeat(lambda: func(legalities), number=args.repeat, repeat=3))
+        print(f"{label:<36} {elapsed / total_legalities * 1e6:8.1f} us/card")
+
+
+if __name__ == "__main__":
+    main()
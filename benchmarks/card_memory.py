@@ -0,0 +1,55 @@
+"""
+Benchmark the memory held by Card objects built from Scryfall JSON.
+
+Reports the bytes still allocated per Card once each has been built from a
+line of JSON, as measured by tracemalloc. This includes its card parts,
+normalized fields, and the strings it keeps from the JSON. Also reports the
+bytes each Card's cached hash adds once it has been hashed.
+
+Usage:
+    python benchmarks/card_memory.py [--repeat N]
+"""
+
+import argparse
+import json
+import tracemalloc
+from pathlib import Path
+
+from scooze.card import Card
+
+TEST_DATA_DIR = Path(__file__).parent.parent / "data" / "test"
+
+
+def load_card_jsons() -> list[dict]:
+    with (TEST_DATA_DIR / "test_cards.jsonl").open() as f:
+        card_jsons = [json.loads(line) for line in f]
+    with (TEST_DATA_DIR / "default_cards.json").open() as f:
+        card_jsons.extend(json.load(f))
+    return card_jsons
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=50, help="Number of copies of each test card to build.")
+    args = parser.parse_args()
+
+    card_lines = [json.dumps(card_json) for card_json in load_card_jsons()] * args.repeat
+    # Build one card first, so lazily created module state isn't counted
+    Card.from_json(card_lines[0])
+
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    cards = [Card.from_json(card_line) for card_line in card_lines]
+    after, _ = tracemalloc.get_traced_memory()
+    for card in cards:
+        hash(card)
+    hashed, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"{'cards':<24} {len(cards):8d}")
+    print(f"{'bytes/card':<24} {(after - before) / len(cards):8.0f}")
+    print(f"{'bytes/card for hash':<24} {(hashed - after) / len(cards):8.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Benchmark the cost of validating Scryfall JSON into an insert-ready CardModel.
+
+Compares the previous two-step path (CardModelData -> dict -> CardModel) with
+`CardModel.from_data`.
+
+Usage:
+    python benchmarks/card_validation.py [--repeat N]
+"""
+
+import argparse
+import asyncio
+import json
+import timeit
+from pathlib import Path
+
+from beanie import init_beanie
+from mongomock_motor import AsyncMongoMockClient
+from scooze.models.card import CardModel, CardModelData
+
+TEST_DATA_DIR = Path(__file__).parent.parent / "data" / "test"
+
+
+def load_card_jsons() -> list[dict]:
+    with (TEST_DATA_DIR / "test_cards.jsonl").open() as f:
+        card_jsons = [json.loads(line) for line in f]
+    with (TEST_DATA_DIR / "default_cards.json").open() as f:
+        card_jsons.extend(json.load(f))
+    return card_jsons
+
+
+def validate_twice(card_jsons: list[dict]) -> None:
+    for card_json in card_jsons:
+        CardModel.model_validate(CardModelData.model_validate(card_json).model_dump())
+
+
+def validate_once(card_jsons: list[dict]) -> None:
+    for card_json in card_jsons:
+        CardModel.from_data(card_json)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=20, help="Number of passes over the test cards.")
+    args = parser.parse_args()
+
+    asyncio.run(init_beanie(database=AsyncMongoMockClient()["benchmark"], document_models=[CardModel]))
+    card_jsons = load_card_jsons()
+    total_cards = len(card_jsons) * args.repeat
+
+    for label, func in (("CardModelData -> dict -> CardModel", validate_twice), ("CardModel.from_data", validate_once)):
+        elapsed = min(timeit.repeat(lambda: func(card_jsons), number=args.repeat, repeat=3))
+        print(f"{label:<36} {elapsed / total_cards * 1e6:8.1f} us/card")
+
+
+if __name__ == "__main__":
+    main()
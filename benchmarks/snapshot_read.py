@@ -0,0 +1,63 @@
+"""
+Benchmark building Cards from a snapshot, compared with validating each
+card's JSON as a model and building the Card from that.
+
+Usage:
+    python benchmarks/snapshot_read.py [--repeat N]
+"""
+
+import argparse
+import json
+import tempfile
+import timeit
+from pathlib import Path
+
+from scooze.card import Card
+from scooze.models.card import CardModelData
+from scooze.snapshot import CardSnapshot, build_snapshot
+
+TEST_DATA_DIR = Path(__file__).parent.parent / "data" / "test"
+
+
+def load_cards() -> list[Card]:
+    with (TEST_DATA_DIR / "test_cards.jsonl").open() as f:
+        cards = [Card.from_json(line) for line in f]
+    with (TEST_DATA_DIR / "default_cards.json").open() as f:
+        cards.extend(Card.from_json(card_json) for card_json in json.load(f))
+    return cards
+
+
+def validate_cards(card_jsons: list[str]) -> None:
+    for card_json in card_jsons:
+        Card(**CardModelData.model_validate_json(card_json).model_dump())
+
+
+def read_cards(snapshot: CardSnapshot) -> None:
+    for _ in snapshot:
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=20, help="Number of passes over the test cards.")
+    args = parser.parse_args()
+
+    cards = load_cards()
+    card_jsons = [CardModelData.model_validate(card.__dict__).model_dump_json() for card in cards]
+    total_cards = len(cards) * args.repeat
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = Path(tmp_dir) / "cards.snapshot"
+        build_snapshot(cards, path)
+        print(f"{'snapshot size':<24} {path.stat().st_size / len(cards):8.0f} bytes/card")
+        print(f"{'JSON size':<24} {sum(map(len, card_jsons)) / len(cards):8.0f} bytes/card")
+
+        elapsed = min(timeit.repeat(lambda: validate_cards(card_jsons), number=args.repeat, repeat=3))
+        print(f"{'validated JSON':<24} {elapsed / total_cards * 1e6:8.1f} us/card")
+        with CardSnapshot(path) as snapshot:
+            elapsed = min(timeit.repeat(lambda: read_cards(snapshot), number=args.repeat, repeat=3))
+        print(f"{'snapshot':<24} {elapsed / total_cards * 1e6:8.1f} us/card")
+
+
+if __name__ == "__main__":
+    main()
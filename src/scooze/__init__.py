@@ -1,11 +1,25 @@
-from scooze.api import AsyncScoozeApi, ScoozeApi
+from scooze.api import (
+    AsyncScoozeApi,
+    CardIndex,
+    MemoryBackend,
+    MongoBackend,
+    ScoozeApi,
+    SQLiteBackend,
+    StorageBackend,
+)
+from scooze.arrow import (
+    card_schema,
+    cards_to_table,
+    read_card_table_file,
+    write_card_table_file,
+)
 from scooze.bulkdata import (
     SCRYFALL_BULK_INFO_ENDPOINT,
     download_all_bulk_data_files,
     download_bulk_data_file,
     download_bulk_data_file_by_type,
 )
-from scooze.card import Card
+from scooze.card import Card, precompute_features
 from scooze.cardlist import CardList
 from scooze.cardparts import (
     CardFace,
@@ -16,10 +30,18 @@ from scooze.cardparts import (
     RelatedCard,
     RelatedUris,
 )
+from scooze.cardtable import CardTable
 from scooze.catalogs import *
 from scooze.config import CONFIG
 from scooze.deck import Deck, DeckDiff, DecklistFormatter, InThe
-from scooze.enums import DbCollection
+from scooze.enums import (
+    BulkFileCompression,
+    BulkLoadEngine,
+    CardTableFormat,
+    DbCollection,
+)
+from scooze.manacost import ParsedCost, parse_cost, parse_costs
+from scooze.snapshot import CardSnapshot, build_snapshot
 from scooze.utils import (
     attractions_size,
     cmdr_size,
@@ -37,6 +59,7 @@ __all__ = (
     "Card",
     "CardFace",
     "CardList",
+    "CardTable",
     "Deck",
     "DeckDiff",
     "DecklistFormatter",
@@ -67,14 +90,34 @@ __all__ = (
     "SetType",
     # api
     "AsyncScoozeApi",
+    "CardIndex",
+    "MemoryBackend",
+    "MongoBackend",
     "ScoozeApi",
+    "SQLiteBackend",
+    "StorageBackend",
     # enums
+    "BulkFileCompression",
+    "BulkLoadEngine",
+    "CardTableFormat",
     "DbCollection",
+    # arrow
+    "card_schema",
+    "cards_to_table",
+    "read_card_table_file",
+    "write_card_table_file",
     # bulkdata
     "download_all_bulk_data_files",
     "download_bulk_data_file_by_type",
     "download_bulk_data_file",
     "SCRYFALL_BULK_INFO_ENDPOINT",
+    # manacost
+    "parse_cost",
+    "parse_costs",
+    "ParsedCost",
+    # snapshot
+    "build_snapshot",
+    "CardSnapshot",
     # utils
     "attractions_size",
     "cmdr_size",
@@ -82,6 +125,7 @@ __all__ = (
     "max_card_quantity",
     "max_relentless_quantity",
     "parse_symbols",
+    "precompute_features",
     "side_size",
     "stickers_size",
 )
@@ -1,23 +1,52 @@
 import asyncio
 from contextlib import AbstractAsyncContextManager, AbstractContextManager
-from functools import cache
-from typing import Any
+from pathlib import Path
+from typing import Any, AsyncIterator, Iterator
 
 import scooze.api.bulkdata as bulkdata_api
 import scooze.api.card as card_api
-from beanie import PydanticObjectId, init_beanie
-from scooze.api.utils import _check_for_safe_context, _safe_cache
+import scooze.api.deck as deck_api
+import scooze.api.index as index_api
+from beanie import PydanticObjectId
+from scooze.api.backends import (
+    MemoryBackend,
+    MongoBackend,
+    SQLiteBackend,
+    StorageBackend,
+)
+from scooze.api.bulkdata import CardSyncResult
+from scooze.api.cache import CacheStats, QueryCache
+from scooze.api.cardindex import CardIndex
+from scooze.api.index import IndexStatus
+from scooze.api.utils import (
+    _cached_query,
+    _check_for_mongo_backend,
+    _check_for_safe_context,
+    _invalidates_cache,
+    _iterate_sync,
+)
 from scooze.card import Card
 from scooze.catalogs import ScryfallBulkFile
 from scooze.config import CONFIG
-from scooze.models.card import CardModel
-from scooze.mongo import db, mongo_close, mongo_connect
+from scooze.deck import Deck
+from scooze.enums import BulkLoadEngine, CardTableFormat, DbCollection
 
 
 class ScoozeApi(AbstractContextManager):
     """
     Context manager object for doing I/O from a local database.
 
+    Card lookups are cached per instance, and the cache is cleared whenever
+    cards are added, deleted, or loaded through this object.
+
+    Attributes:
+        backend: Where cards are stored. Defaults to MongoDB, at
+            `CONFIG.mongo_dsn`. Decks, indexes, and bulk data loading are only
+            supported by the Mongo backend.
+        cache: The query cache, limited to `cache_size` results that each
+            expire after `cache_ttl` seconds (or never, if None). Its `stats`
+            report hits, misses, and evictions.
+
     Example:
         ``` python
         with ScoozeApi() as s:
@@ -28,25 +57,30 @@ class ScoozeApi(AbstractContextManager):
         ```
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        backend: StorageBackend | None = None,
+        cache_size: int = 1024,
+        cache_ttl: float | None = 300,
+    ):
         self.safe_context = False
+        self.backend = backend if backend is not None else MongoBackend()
+        self.cache = QueryCache(maxsize=cache_size, ttl=cache_ttl)
 
     def __enter__(self):
         self.safe_context = True
-        asyncio.get_event_loop().run_until_complete(mongo_connect())
-        asyncio.get_event_loop().run_until_complete(
-            init_beanie(database=db.client[CONFIG.mongo_db], document_models=[CardModel])
-        )
+        asyncio.get_event_loop().run_until_complete(self.backend.connect())
 
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        asyncio.get_event_loop().run_until_complete(mongo_close())
+        asyncio.get_event_loop().run_until_complete(self.backend.close())
+        self.cache.clear()
 
     # region Card endpoints
 
-    @_safe_cache
     @_check_for_safe_context
+    @_cached_query
     def get_card_by(self, property_name: str, value: Any) -> Card:
         """
         Search the database for the first card that matches the given criteria.
@@ -63,10 +97,11 @@ class ScoozeApi(AbstractContextManager):
         """
 
         return asyncio.get_event_loop().run_until_complete(
-            card_api.get_card_by(property_name=property_name, value=value)
+            self.backend.get_card_by(property_name=property_name, value=value)
         )
 
     @_check_for_safe_context
+    @_cached_query
     def get_cards_by(
         self,
         property_name: str,
@@ -74,6 +109,7 @@ class ScoozeApi(AbstractContextManager):
         paginated: bool = False,
         page: int = 1,
         page_size: int = 10,
+        fields: list[str] | None = None,
     ) -> list[Card]:
         """
         Search the database for cards matching the given criteria, with options for
@@ -85,6 +121,9 @@ class ScoozeApi(AbstractContextManager):
             paginated: Whether to paginate the results.
             page: The page to look at, if paginated.
             page_size: The size of each page, if paginated.
+            fields: The properties to fetch for each card. If given, all other
+                properties are left at their defaults. If None, the whole card
+                is fetched.
 
         Returns:
             A list of cards matching the search criteria, or empty list if none
@@ -95,19 +134,20 @@ class ScoozeApi(AbstractContextManager):
         """
 
         return asyncio.get_event_loop().run_until_complete(
-            card_api.get_cards_by(
+            self.backend.get_cards_by(
                 property_name=property_name,
                 values=values,
                 paginated=paginated,
                 page=page,
                 page_size=page_size,
+                fields=fields,
             )
         )
 
     # region Convenience methods for single-card lookup
 
-    @cache
     @_check_for_safe_context
+    @_cached_query
     def get_card_by_name(self, name: str) -> Card:
         """
         Search the database for a card with the given name.
@@ -123,14 +163,14 @@ class ScoozeApi(AbstractContextManager):
         """
 
         return asyncio.get_event_loop().run_until_complete(
-            card_api.get_card_by(
+            self.backend.get_card_by(
                 property_name="name",
                 value=name,
             )
         )
 
-    @cache
     @_check_for_safe_context
+    @_cached_query
     def get_card_by_oracle_id(self, oracle_id: str) -> Card:
         """
         Search the database for a card with the given Oracle ID.
@@ -146,14 +186,14 @@ class ScoozeApi(AbstractContextManager):
         """
 
         return asyncio.get_event_loop().run_until_complete(
-            card_api.get_card_by(
+            self.backend.get_card_by(
                 property_name="oracle_id",
                 value=oracle_id,
             )
         )
 
-    @cache
     @_check_for_safe_context
+    @_cached_query
     def get_card_by_scryfall_id(self, scryfall_id: str) -> Card:
         """
         Search the database for a card with the given Scryfall ID.
@@ -169,7 +209,7 @@ class ScoozeApi(AbstractContextManager):
         """
 
         return asyncio.get_event_loop().run_until_complete(
-            card_api.get_card_by(
+            self.backend.get_card_by(
                 property_name="scryfall_id",
                 value=scryfall_id,
             )
@@ -180,6 +220,7 @@ class ScoozeApi(AbstractContextManager):
     # region Convenience methods for multiple card lookup
 
     @_check_for_safe_context
+    @_cached_query
     def get_cards_by_set(self, set_code: str) -> list[Card]:
         """
          Search the database for all cards in the given set.
@@ -197,7 +238,7 @@ class ScoozeApi(AbstractContextManager):
         """
 
         return asyncio.get_event_loop().run_until_complete(
-            card_api.get_cards_by(
+            self.backend.get_cards_by(
                 property_name="set",
                 values=[set_code],
             )
@@ -215,13 +256,68 @@ class ScoozeApi(AbstractContextManager):
             RuntimeError: If used outside a `with` context.
         """
 
-        return asyncio.get_event_loop().run_until_complete(card_api.get_cards_all())
+        return asyncio.get_event_loop().run_until_complete(self.backend.get_cards_all())
+
+    @_check_for_safe_context
+    def iter_cards_by(
+        self,
+        property_name: str,
+        values: list[Any],
+        batch_size: int = 1000,
+        fields: list[str] | None = None,
+    ) -> Iterator[Card]:
+        """
+        Stream cards matching the given criteria from the database, fetching
+        them in batches and converting each to a Card only as it is reached.
+
+        Args:
+            property_name: The property to check.
+            values: A list of values to match on.
+            batch_size: The number of cards to fetch from the database at a
+                time.
+            fields: The properties to fetch for each card. If given, all other
+                properties are left at their defaults. If None, the whole card
+                is fetched.
+
+        Returns:
+            An iterator over the cards matching the search criteria.
+
+        Raises:
+            RuntimeError: If used outside a `with` context.
+        """
+
+        return _iterate_sync(
+            self.backend.iter_cards_by(property_name=property_name, values=values, batch_size=batch_size, fields=fields)
+        )
+
+    @_check_for_safe_context
+    def iter_cards_all(self, batch_size: int = 1000, fields: list[str] | None = None) -> Iterator[Card]:
+        """
+        Stream all cards from the database, fetching them in batches and
+        converting each to a Card only as it is reached.
+
+        Args:
+            batch_size: The number of cards to fetch from the database at a
+                time.
+            fields: The properties to fetch for each card. If given, all other
+                properties are left at their defaults. If None, the whole card
+                is fetched.
+
+        Returns:
+            An iterator over all cards in the database.
+
+        Raises:
+            RuntimeError: If used outside a `with` context.
+        """
+
+        return _iterate_sync(self.backend.iter_cards_all(batch_size=batch_size, fields=fields))
 
     # TODO(#146): add function get_cards_by_format (format, legality)
 
     # endregion
 
     @_check_for_safe_context
+    @_invalidates_cache
     def add_card(self, card: Card) -> PydanticObjectId:
         """
         Add a card to the database.
@@ -236,9 +332,10 @@ class ScoozeApi(AbstractContextManager):
             RuntimeError: If used outside a `with` context.
         """
 
-        return asyncio.get_event_loop().run_until_complete(card_api.add_card(card=card))
+        return asyncio.get_event_loop().run_until_complete(self.backend.add_card(card=card))
 
     @_check_for_safe_context
+    @_invalidates_cache
     def add_cards(self, cards: list[Card]) -> list[PydanticObjectId]:
         """
         Add a list of cards to the database.
@@ -253,9 +350,10 @@ class ScoozeApi(AbstractContextManager):
             RuntimeError: If used outside a `with` context.
         """
 
-        return asyncio.get_event_loop().run_until_complete(card_api.add_cards(cards=cards))
+        return asyncio.get_event_loop().run_until_complete(self.backend.add_cards(cards=cards))
 
     @_check_for_safe_context
+    @_invalidates_cache
     def delete_card(self, id: str) -> bool:
         """
         Delete a card from the database.
@@ -270,9 +368,10 @@ class ScoozeApi(AbstractContextManager):
             RuntimeError: If used outside a `with` context.
         """
 
-        return asyncio.get_event_loop().run_until_complete(card_api.delete_card(id=id))
+        return asyncio.get_event_loop().run_until_complete(self.backend.delete_card(id=id))
 
     @_check_for_safe_context
+    @_invalidates_cache
     def delete_cards_all(self) -> int:
         """
         Delete all cards in the database.
@@ -284,20 +383,129 @@ class ScoozeApi(AbstractContextManager):
             RuntimeError: If used outside a `with` context.
         """
 
-        return asyncio.get_event_loop().run_until_complete(card_api.delete_cards_all())
+        return asyncio.get_event_loop().run_until_complete(self.backend.delete_cards_all())
 
     # endregion
 
     # region Deck endpoints
 
-    # TODO(#145): add deck endpoints to python api
+    @_check_for_safe_context
+    @_check_for_mongo_backend
+    def get_deck(self, id: str | PydanticObjectId) -> Deck | None:
+        """
+        Get a deck from the database, along with all of its cards.
+
+        Args:
+            id: The ID of the deck to get.
+
+        Returns:
+            The deck, or None if it was not found.
+
+        Raises:
+            RuntimeError: If used outside a `with` context.
+        """
+
+        return asyncio.get_event_loop().run_until_complete(deck_api.get_deck(id=id))
+
+    @_check_for_safe_context
+    @_check_for_mongo_backend
+    def get_decks(self, ids: list[str | PydanticObjectId]) -> list[Deck]:
+        """
+        Get decks from the database, along with all of their cards. The cards
+        of every deck are fetched together in a single query.
+
+        Args:
+            ids: The IDs of the decks to get.
+
+        Returns:
+            The decks that were found, in the order they were requested.
+
+        Raises:
+            RuntimeError: If used outside a `with` context.
+        """
+
+        return asyncio.get_event_loop().run_until_complete(deck_api.get_decks(ids=ids))
+
+    # TODO(#145): add remaining deck endpoints to python api
+
+    # endregion
+
+    # region Index management
+
+    @_check_for_safe_context
+    @_check_for_mongo_backend
+    def build_indexes(self, collection: DbCollection) -> list[str]:
+        """
+        Build the indexes declared for a collection in the local database.
+        Indexes that already exist are left as they are.
+
+        Args:
+            collection: The collection to build indexes on.
+
+        Returns:
+            The names of the declared indexes.
+
+        Raises:
+            RuntimeError: If used outside a `with` context.
+        """
+
+        return asyncio.get_event_loop().run_until_complete(index_api.build_indexes(collection=collection))
+
+    @_check_for_safe_context
+    @_check_for_mongo_backend
+    def drop_indexes(self, collection: DbCollection) -> list[str]:
+        """
+        Drop the indexes declared for a collection in the local database.
+
+        Args:
+            collection: The collection to drop indexes from.
+
+        Returns:
+            The names of the indexes that were dropped.
+
+        Raises:
+            RuntimeError: If used outside a `with` context.
+        """
+
+        return asyncio.get_event_loop().run_until_complete(index_api.drop_indexes(collection=collection))
+
+    @_check_for_safe_context
+    @_check_for_mongo_backend
+    def get_index_status(self, collection: DbCollection) -> list[IndexStatus]:
+        """
+        Compare the indexes declared for a collection with those in the local
+        database.
+
+        Args:
+            collection: The collection to check.
+
+        Returns:
+            The status of every declared or built index.
+
+        Raises:
+            RuntimeError: If used outside a `with` context.
+        """
+
+        return asyncio.get_event_loop().run_until_complete(index_api.get_index_status(collection=collection))
 
     # endregion
 
     # region Bulk data I/O
 
     @_check_for_safe_context
-    def load_card_file(self, file_type: ScryfallBulkFile, bulk_file_dir: str, show_progress: bool = True) -> int:
+    @_invalidates_cache
+    @_check_for_mongo_backend
+    def load_card_file(
+        self,
+        file_type: ScryfallBulkFile,
+        bulk_file_dir: str,
+        show_progress: bool = True,
+        batch_size: int = 5000,
+        max_concurrent_inserts: int = 2,
+        workers: int = 0,
+        engine: BulkLoadEngine = BulkLoadEngine.BEANIE,
+        swap: bool = False,
+    ) -> int:
         """
         Loads the desired file from the given directory into a local database.
 
@@ -306,16 +514,215 @@ class ScoozeApi(AbstractContextManager):
                 to insert into the database.
             bulk_file_dir: The path to the folder containing the ScryfallBulkFile.
             show_progress: Flag to log progress while loading a file.
+            batch_size: The number of cards to send to the database per insert.
+            max_concurrent_inserts: The maximum number of inserts in flight at
+                once.
+            workers: The number of processes to validate cards with. If 0,
+                cards are validated in this process.
+            engine: How validated cards are written to the database. Ignored
+                with `swap`, which always writes raw documents.
+            swap: Flag to load into a staging collection and then swap it in
+                for the cards collection, replacing the existing cards without
+                ever serving a partial load.
+
+        Returns:
+            The total number of cards loaded into the database.
+
+        Raises:
+            RuntimeError: If used outside a `with` context.
+        """
+
+        return asyncio.get_event_loop().run_until_complete(
+            bulkdata_api.load_card_file(
+                file_type=file_type,
+                bulk_file_dir=bulk_file_dir,
+                show_progress=show_progress,
+                batch_size=batch_size,
+                max_concurrent_inserts=max_concurrent_inserts,
+                workers=workers,
+                engine=engine,
+                swap=swap,
+            )
+        )
+
+    @_check_for_safe_context
+    @_invalidates_cache
+    @_check_for_mongo_backend
+    def stream_card_file(
+        self,
+        file_type: ScryfallBulkFile,
+        bulk_file_dir: str | None = None,
+        show_progress: bool = True,
+        batch_size: int = 5000,
+        max_concurrent_inserts: int = 2,
+        workers: int = 0,
+        engine: BulkLoadEngine = BulkLoadEngine.BEANIE,
+    ) -> int:
+        """
+        Loads the desired file into a local database while it downloads from
+        Scryfall, optionally saving it to the given directory as well.
+
+        Args:
+            file_type: The type of [ScryfallBulkFile](https://scryfall.com/docs/api/bulk-data)
+                to insert into the database.
+            bulk_file_dir: The path to a folder to also save the
+                ScryfallBulkFile to. If None, the file is not saved.
+            show_progress: Flag to log progress while loading a file.
+            batch_size: The number of cards to send to the database per insert.
+            max_concurrent_inserts: The maximum number of inserts in flight at
+                once.
+            workers: The number of processes to validate cards with. If 0,
+                cards are validated in this process.
+            engine: How validated cards are written to the database.
+
+        Returns:
+            The total number of cards loaded into the database.
+
+        Raises:
+            RuntimeError: If used outside a `with` context.
+        """
+
+        return asyncio.get_event_loop().run_until_complete(
+            bulkdata_api.stream_card_file(
+                file_type=file_type,
+                bulk_file_dir=bulk_file_dir,
+                show_progress=show_progress,
+                batch_size=batch_size,
+                max_concurrent_inserts=max_concurrent_inserts,
+                workers=workers,
+                engine=engine,
+            )
+        )
+
+    @_check_for_safe_context
+    @_invalidates_cache
+    @_check_for_mongo_backend
+    def sync_card_file(
+        self,
+        file_type: ScryfallBulkFile,
+        bulk_file_dir: str,
+        show_progress: bool = True,
+        batch_size: int = 5000,
+        max_concurrent_inserts: int = 2,
+        workers: int = 0,
+    ) -> CardSyncResult:
+        """
+        Syncs the local database with the desired file from the given
+        directory, inserting new cards, replacing changed cards, and deleting
+        cards that are no longer in the file.
+
+        Args:
+            file_type: The type of [ScryfallBulkFile](https://scryfall.com/docs/api/bulk-data)
+                to sync the database with.
+            bulk_file_dir: The path to the folder containing the ScryfallBulkFile.
+            show_progress: Flag to log progress while syncing a file.
+            batch_size: The number of cards to send to the database per write.
+            max_concurrent_inserts: The maximum number of writes in flight at
+                once.
+            workers: The number of processes to validate cards with. If 0,
+                cards are validated in this process.
+
+        Returns:
+            The number of cards inserted, updated, left unchanged, and deleted.
+
+        Raises:
+            RuntimeError: If used outside a `with` context.
+        """
+
+        return asyncio.get_event_loop().run_until_complete(
+            bulkdata_api.sync_card_file(
+                file_type=file_type,
+                bulk_file_dir=bulk_file_dir,
+                show_progress=show_progress,
+                batch_size=batch_size,
+                max_concurrent_inserts=max_concurrent_inserts,
+                workers=workers,
+            )
+        )
+
+    @_check_for_safe_context
+    @_check_for_mongo_backend
+    def export_card_file(
+        self,
+        path: Path,
+        format: CardTableFormat = CardTableFormat.PARQUET,
+        file_type: ScryfallBulkFile | None = None,
+        bulk_file_dir: str = CONFIG.bulk_file_dir,
+        batch_size: int = 10000,
+    ) -> int:
+        """
+        Exports cards to a Parquet or Arrow IPC card table file, from the
+        local database or from a bulk data file.
+
+        Args:
+            path: Where to write the file.
+            format: The file format to write.
+            file_type: The type of [ScryfallBulkFile](https://scryfall.com/docs/api/bulk-data)
+                to export. If None, the cards collection is exported.
+            bulk_file_dir: The path to the folder containing the ScryfallBulkFile.
+            batch_size: The number of cards to convert and write at a time.
+
+        Returns:
+            The total number of cards exported.
+
+        Raises:
+            ImportError: If `pyarrow` is not installed.
+            RuntimeError: If used outside a `with` context.
+        """
+
+        return asyncio.get_event_loop().run_until_complete(
+            bulkdata_api.export_card_file(
+                path=path,
+                format=format,
+                file_type=file_type,
+                bulk_file_dir=bulk_file_dir,
+                batch_size=batch_size,
+            )
+        )
+
+    @_check_for_safe_context
+    @_invalidates_cache
+    @_check_for_mongo_backend
+    def load_card_table_file(
+        self,
+        path: Path,
+        show_progress: bool = True,
+        batch_size: int = 5000,
+        max_concurrent_inserts: int = 2,
+        workers: int = 0,
+        engine: BulkLoadEngine = BulkLoadEngine.BEANIE,
+    ) -> int:
+        """
+        Loads a Parquet or Arrow IPC card table file, as written by
+        `export_card_file`, into a local database.
+
+        Args:
+            path: The card table file to load.
+            show_progress: Flag to log progress while loading a file.
+            batch_size: The number of cards to send to the database per insert.
+            max_concurrent_inserts: The maximum number of inserts in flight at
+                once.
+            workers: The number of processes to validate cards with. If 0,
+                cards are validated in this process.
+            engine: How validated cards are written to the database.
 
         Returns:
             The total number of cards loaded into the database.
 
         Raises:
+            ImportError: If `pyarrow` is not installed.
             RuntimeError: If used outside a `with` context.
         """
 
         return asyncio.get_event_loop().run_until_complete(
-            bulkdata_api.load_card_file(file_type=file_type, bulk_file_dir=bulk_file_dir, show_progress=show_progress)
+            bulkdata_api.load_card_table_file(
+                path=path,
+                show_progress=show_progress,
+                batch_size=batch_size,
+                max_concurrent_inserts=max_concurrent_inserts,
+                workers=workers,
+                engine=engine,
+            )
         )
 
     # endregion
@@ -327,6 +734,17 @@ class AsyncScoozeApi(AbstractAsyncContextManager):
     Most commonly used in asynchronous contexts like Jupyter Notebooks or other
     web applications.
 
+    Card lookups are cached per instance, and the cache is cleared whenever
+    cards are added, deleted, or loaded through this object.
+
+    Attributes:
+        backend: Where cards are stored. Defaults to MongoDB, at
+            `CONFIG.mongo_dsn`. Decks, indexes, and bulk data loading are only
+            supported by the Mongo backend.
+        cache: The query cache, limited to `cache_size` results that each
+            expire after `cache_ttl` seconds (or never, if None). Its `stats`
+            report hits, misses, and evictions.
+
     Example:
         ``` python
         async with AsyncScoozeApi() as s:
@@ -337,23 +755,30 @@ class AsyncScoozeApi(AbstractAsyncContextManager):
         ```
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        backend: StorageBackend | None = None,
+        cache_size: int = 1024,
+        cache_ttl: float | None = 300,
+    ):
         self.safe_context = False
+        self.backend = backend if backend is not None else MongoBackend()
+        self.cache = QueryCache(maxsize=cache_size, ttl=cache_ttl)
 
     async def __aenter__(self):
         self.safe_context = True
-        await mongo_connect()
-        await init_beanie(database=db.client[CONFIG.mongo_db], document_models=[CardModel])
+        await self.backend.connect()
 
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        await mongo_close()
+        await self.backend.close()
+        self.cache.clear()
 
     # region Card endpoints
 
-    @_safe_cache
     @_check_for_safe_context
+    @_cached_query
     async def get_card_by(self, property_name: str, value: Any) -> Card:
         """
         Search the database for the first card that matches the given criteria.
@@ -369,9 +794,10 @@ class AsyncScoozeApi(AbstractAsyncContextManager):
             RuntimeError: If used outside an `async with` context.
         """
 
-        return await card_api.get_card_by(property_name=property_name, value=value)
+        return await self.backend.get_card_by(property_name=property_name, value=value)
 
     @_check_for_safe_context
+    @_cached_query
     async def get_cards_by(
         self,
         property_name: str,
@@ -379,6 +805,7 @@ class AsyncScoozeApi(AbstractAsyncContextManager):
         paginated: bool = False,
         page: int = 1,
         page_size: int = 10,
+        fields: list[str] | None = None,
     ) -> list[Card]:
         """
         Search the database for cards matching the given criteria, with options for
@@ -390,6 +817,9 @@ class AsyncScoozeApi(AbstractAsyncContextManager):
             paginated: Whether to paginate the results.
             page: The page to look at, if paginated.
             page_size: The size of each page, if paginated.
+            fields: The properties to fetch for each card. If given, all other
+                properties are left at their defaults. If None, the whole card
+                is fetched.
 
         Returns:
             A list of cards matching the search criteria, or empty list if none
@@ -399,18 +829,19 @@ class AsyncScoozeApi(AbstractAsyncContextManager):
             RuntimeError: If used outside an `async with` context.
         """
 
-        return await card_api.get_cards_by(
+        return await self.backend.get_cards_by(
             property_name=property_name,
             values=values,
             paginated=paginated,
             page=page,
             page_size=page_size,
+            fields=fields,
         )
 
     # region Convenience methods for single-card lookup
 
-    @cache
     @_check_for_safe_context
+    @_cached_query
     async def get_card_by_name(self, name: str) -> Card:
         """
         Search the database for a card with the given name.
@@ -425,13 +856,13 @@ class AsyncScoozeApi(AbstractAsyncContextManager):
             RuntimeError: If used outside an `async with` context.
         """
 
-        return await card_api.get_card_by(
+        return await self.backend.get_card_by(
             property_name="name",
             value=name,
         )
 
-    @cache
     @_check_for_safe_context
+    @_cached_query
     async def get_card_by_oracle_id(self, oracle_id: str) -> Card:
         """
         Search the database for a card with the given Oracle ID.
@@ -446,13 +877,13 @@ class AsyncScoozeApi(AbstractAsyncContextManager):
             RuntimeError: If used outside an `async with` context.
         """
 
-        return await card_api.get_card_by(
+        return await self.backend.get_card_by(
             property_name="oracle_id",
             value=oracle_id,
         )
 
-    @cache
     @_check_for_safe_context
+    @_cached_query
     async def get_card_by_scryfall_id(self, scryfall_id: str) -> Card:
         """
         Search the database for a card with the given Scryfall ID.
@@ -467,7 +898,7 @@ class AsyncScoozeApi(AbstractAsyncContextManager):
             RuntimeError: If used outside an `async with` context.
         """
 
-        return await card_api.get_card_by(
+        return await self.backend.get_card_by(
             property_name="scryfall_id",
             value=scryfall_id,
         )
@@ -477,6 +908,7 @@ class AsyncScoozeApi(AbstractAsyncContextManager):
     # region Convenience methods for multiple card lookup
 
     @_check_for_safe_context
+    @_cached_query
     async def get_cards_by_set(self, set_code: str) -> list[Card]:
         """
         Search the database for all cards in the given set.
@@ -493,7 +925,7 @@ class AsyncScoozeApi(AbstractAsyncContextManager):
             RuntimeError: If used outside an `async with` context.
         """
 
-        return await card_api.get_cards_by(
+        return await self.backend.get_cards_by(
             property_name="set",
             values=[set_code],
         )
@@ -510,13 +942,68 @@ class AsyncScoozeApi(AbstractAsyncContextManager):
             RuntimeError: If used outside an `async with` context.
         """
 
-        return await card_api.get_cards_all()
+        return await self.backend.get_cards_all()
+
+    @_check_for_safe_context
+    def iter_cards_by(
+        self,
+        property_name: str,
+        values: list[Any],
+        batch_size: int = 1000,
+        fields: list[str] | None = None,
+    ) -> AsyncIterator[Card]:
+        """
+        Stream cards matching the given criteria from the database, fetching
+        them in batches and converting each to a Card only as it is reached.
+
+        Args:
+            property_name: The property to check.
+            values: A list of values to match on.
+            batch_size: The number of cards to fetch from the database at a
+                time.
+            fields: The properties to fetch for each card. If given, all other
+                properties are left at their defaults. If None, the whole card
+                is fetched.
+
+        Returns:
+            An iterator over the cards matching the search criteria.
+
+        Raises:
+            RuntimeError: If used outside an `async with` context.
+        """
+
+        return self.backend.iter_cards_by(
+            property_name=property_name, values=values, batch_size=batch_size, fields=fields
+        )
+
+    @_check_for_safe_context
+    def iter_cards_all(self, batch_size: int = 1000, fields: list[str] | None = None) -> AsyncIterator[Card]:
+        """
+        Stream all cards from the database, fetching them in batches and
+        converting each to a Card only as it is reached.
+
+        Args:
+            batch_size: The number of cards to fetch from the database at a
+                time.
+            fields: The properties to fetch for each card. If given, all other
+                properties are left at their defaults. If None, the whole card
+                is fetched.
+
+        Returns:
+            An iterator over all cards in the database.
+
+        Raises:
+            RuntimeError: If used outside an `async with` context.
+        """
+
+        return self.backend.iter_cards_all(batch_size=batch_size, fields=fields)
 
     # TODO(#146): add function get_cards_by_format (format, legality)
 
     # endregion
 
     @_check_for_safe_context
+    @_invalidates_cache
     async def add_card(self, card: Card) -> PydanticObjectId:
         """
         Add a card to the database.
@@ -531,9 +1018,10 @@ class AsyncScoozeApi(AbstractAsyncContextManager):
             RuntimeError: If used outside an `async with` context.
         """
 
-        return await card_api.add_card(card=card)
+        return await self.backend.add_card(card=card)
 
     @_check_for_safe_context
+    @_invalidates_cache
     async def add_cards(self, cards: list[Card]) -> list[PydanticObjectId]:
         """
         Add a list of cards to the database.
@@ -548,9 +1036,10 @@ class AsyncScoozeApi(AbstractAsyncContextManager):
             RuntimeError: If used outside an `async with` context.
         """
 
-        return await card_api.add_cards(cards=cards)
+        return await self.backend.add_cards(cards=cards)
 
     @_check_for_safe_context
+    @_invalidates_cache
     async def delete_card(self, id: str) -> bool | None:
         """
         Delete a card from the database.
@@ -565,9 +1054,10 @@ class AsyncScoozeApi(AbstractAsyncContextManager):
             RuntimeError: If used outside an `async with` context.
         """
 
-        return await card_api.delete_card(id=id)
+        return await self.backend.delete_card(id=id)
 
     @_check_for_safe_context
+    @_invalidates_cache
     async def delete_cards_all(self) -> int | None:
         """
         Delete all cards in the database.
@@ -579,20 +1069,129 @@ class AsyncScoozeApi(AbstractAsyncContextManager):
             RuntimeError: If used outside an `async with` context.
         """
 
-        return await card_api.delete_cards_all()
+        return await self.backend.delete_cards_all()
 
     # endregion
 
     # region Deck endpoints
 
-    # TODO(#145): add deck endpoints to python api
+    @_check_for_safe_context
+    @_check_for_mongo_backend
+    async def get_deck(self, id: str | PydanticObjectId) -> Deck | None:
+        """
+        Get a deck from the database, along with all of its cards.
+
+        Args:
+            id: The ID of the deck to get.
+
+        Returns:
+            The deck, or None if it was not found.
+
+        Raises:
+            RuntimeError: If used outside an `async with` context.
+        """
+
+        return await deck_api.get_deck(id=id)
+
+    @_check_for_safe_context
+    @_check_for_mongo_backend
+    async def get_decks(self, ids: list[str | PydanticObjectId]) -> list[Deck]:
+        """
+        Get decks from the database, along with all of their cards. The cards
+        of every deck are fetched together in a single query.
+
+        Args:
+            ids: The IDs of the decks to get.
+
+        Returns:
+            The decks that were found, in the order they were requested.
+
+        Raises:
+            RuntimeError: If used outside an `async with` context.
+        """
+
+        return await deck_api.get_decks(ids=ids)
+
+    # TODO(#145): add remaining deck endpoints to python api
+
+    # endregion
+
+    # region Index management
+
+    @_check_for_safe_context
+    @_check_for_mongo_backend
+    async def build_indexes(self, collection: DbCollection) -> list[str]:
+        """
+        Build the indexes declared for a collection in the local database.
+        Indexes that already exist are left as they are.
+
+        Args:
+            collection: The collection to build indexes on.
+
+        Returns:
+            The names of the declared indexes.
+
+        Raises:
+            RuntimeError: If used outside an `async with` context.
+        """
+
+        return await index_api.build_indexes(collection=collection)
+
+    @_check_for_safe_context
+    @_check_for_mongo_backend
+    async def drop_indexes(self, collection: DbCollection) -> list[str]:
+        """
+        Drop the indexes declared for a collection in the local database.
+
+        Args:
+            collection: The collection to drop indexes from.
+
+        Returns:
+            The names of the indexes that were dropped.
+
+        Raises:
+            RuntimeError: If used outside an `async with` context.
+        """
+
+        return await index_api.drop_indexes(collection=collection)
+
+    @_check_for_safe_context
+    @_check_for_mongo_backend
+    async def get_index_status(self, collection: DbCollection) -> list[IndexStatus]:
+        """
+        Compare the indexes declared for a collection with those in the local
+        database.
+
+        Args:
+            collection: The collection to check.
+
+        Returns:
+            The status of every declared or built index.
+
+        Raises:
+            RuntimeError: If used outside an `async with` context.
+        """
+
+        return await index_api.get_index_status(collection=collection)
 
     # endregion
 
     # region Bulk data I/O
 
     @_check_for_safe_context
-    async def load_card_file(self, file_type: ScryfallBulkFile, bulk_file_dir: str, show_progress: bool = True) -> int:
+    @_invalidates_cache
+    @_check_for_mongo_backend
+    async def load_card_file(
+        self,
+        file_type: ScryfallBulkFile,
+        bulk_file_dir: str,
+        show_progress: bool = True,
+        batch_size: int = 5000,
+        max_concurrent_inserts: int = 2,
+        workers: int = 0,
+        engine: BulkLoadEngine = BulkLoadEngine.BEANIE,
+        swap: bool = False,
+    ) -> int:
         """
         Loads the desired file from the given directory into a local database.
 
@@ -601,6 +1200,16 @@ class AsyncScoozeApi(AbstractAsyncContextManager):
                 to insert into the database.
             bulk_file_dir: The path to the folder containing the ScryfallBulkFile.
             show_progress: Flag to log progress while loading a file.
+            batch_size: The number of cards to send to the database per insert.
+            max_concurrent_inserts: The maximum number of inserts in flight at
+                once.
+            workers: The number of processes to validate cards with. If 0,
+                cards are validated in this process.
+            engine: How validated cards are written to the database. Ignored
+                with `swap`, which always writes raw documents.
+            swap: Flag to load into a staging collection and then swap it in
+                for the cards collection, replacing the existing cards without
+                ever serving a partial load.
 
         Returns:
             The total number of cards loaded into the database.
@@ -610,7 +1219,186 @@ class AsyncScoozeApi(AbstractAsyncContextManager):
         """
 
         return await bulkdata_api.load_card_file(
-            file_type=file_type, bulk_file_dir=bulk_file_dir, show_progress=show_progress
+            file_type=file_type,
+            bulk_file_dir=bulk_file_dir,
+            show_progress=show_progress,
+            batch_size=batch_size,
+            max_concurrent_inserts=max_concurrent_inserts,
+            workers=workers,
+            engine=engine,
+            swap=swap,
+        )
+
+    @_check_for_safe_context
+    @_invalidates_cache
+    @_check_for_mongo_backend
+    async def stream_card_file(
+        self,
+        file_type: ScryfallBulkFile,
+        bulk_file_dir: str | None = None,
+        show_progress: bool = True,
+        batch_size: int = 5000,
+        max_concurrent_inserts: int = 2,
+        workers: int = 0,
+        engine: BulkLoadEngine = BulkLoadEngine.BEANIE,
+    ) -> int:
+        """
+        Loads the desired file into a local database while it downloads from
+        Scryfall, optionally saving it to the given directory as well.
+
+        Args:
+            file_type: The type of [ScryfallBulkFile](https://scryfall.com/docs/api/bulk-data)
+                to insert into the database.
+            bulk_file_dir: The path to a folder to also save the
+                ScryfallBulkFile to. If None, the file is not saved.
+            show_progress: Flag to log progress while loading a file.
+            batch_size: The number of cards to send to the database per insert.
+            max_concurrent_inserts: The maximum number of inserts in flight at
+                once.
+            workers: The number of processes to validate cards with. If 0,
+                cards are validated in this process.
+            engine: How validated cards are written to the database.
+
+        Returns:
+            The total number of cards loaded into the database.
+
+        Raises:
+            RuntimeError: If used outside an `async with` context.
+        """
+
+        return await bulkdata_api.stream_card_file(
+            file_type=file_type,
+            bulk_file_dir=bulk_file_dir,
+            show_progress=show_progress,
+            batch_size=batch_size,
+            max_concurrent_inserts=max_concurrent_inserts,
+            workers=workers,
+            engine=engine,
+        )
+
+    @_check_for_safe_context
+    @_invalidates_cache
+    @_check_for_mongo_backend
+    async def sync_card_file(
+        self,
+        file_type: ScryfallBulkFile,
+        bulk_file_dir: str,
+        show_progress: bool = True,
+        batch_size: int = 5000,
+        max_concurrent_inserts: int = 2,
+        workers: int = 0,
+    ) -> CardSyncResult:
+        """
+        Syncs the local database with the desired file from the given
+        directory, inserting new cards, replacing changed cards, and deleting
+        cards that are no longer in the file.
+
+        Args:
+            file_type: The type of [ScryfallBulkFile](https://scryfall.com/docs/api/bulk-data)
+                to sync the database with.
+            bulk_file_dir: The path to the folder containing the ScryfallBulkFile.
+            show_progress: Flag to log progress while syncing a file.
+            batch_size: The number of cards to send to the database per write.
+            max_concurrent_inserts: The maximum number of writes in flight at
+                once.
+            workers: The number of processes to validate cards with. If 0,
+                cards are validated in this process.
+
+        Returns:
+            The number of cards inserted, updated, left unchanged, and deleted.
+
+        Raises:
+            RuntimeError: If used outside an `async with` context.
+        """
+
+        return await bulkdata_api.sync_card_file(
+            file_type=file_type,
+            bulk_file_dir=bulk_file_dir,
+            show_progress=show_progress,
+            batch_size=batch_size,
+            max_concurrent_inserts=max_concurrent_inserts,
+            workers=workers,
+        )
+
+    @_check_for_safe_context
+    @_check_for_mongo_backend
+    async def export_card_file(
+        self,
+        path: Path,
+        format: CardTableFormat = CardTableFormat.PARQUET,
+        file_type: ScryfallBulkFile | None = None,
+        bulk_file_dir: str = CONFIG.bulk_file_dir,
+        batch_size: int = 10000,
+    ) -> int:
+        """
+        Exports cards to a Parquet or Arrow IPC card table file, from the
+        local database or from a bulk data file.
+
+        Args:
+            path: Where to write the file.
+            format: The file format to write.
+            file_type: The type of [ScryfallBulkFile](https://scryfall.com/docs/api/bulk-data)
+                to export. If None, the cards collection is exported.
+            bulk_file_dir: The path to the folder containing the ScryfallBulkFile.
+            batch_size: The number of cards to convert and write at a time.
+
+        Returns:
+            The total number of cards exported.
+
+        Raises:
+            ImportError: If `pyarrow` is not installed.
+            RuntimeError: If used outside an `async with` context.
+        """
+
+        return await bulkdata_api.export_card_file(
+            path=path,
+            format=format,
+            file_type=file_type,
+            bulk_file_dir=bulk_file_dir,
+            batch_size=batch_size,
+        )
+
+    @_check_for_safe_context
+    @_invalidates_cache
+    @_check_for_mongo_backend
+    async def load_card_table_file(
+        self,
+        path: Path,
+        show_progress: bool = True,
+        batch_size: int = 5000,
+        max_concurrent_inserts: int = 2,
+        workers: int = 0,
+        engine: BulkLoadEngine = BulkLoadEngine.BEANIE,
+    ) -> int:
+        """
+        Loads a Parquet or Arrow IPC card table file, as written by
+        `export_card_file`, into a local database.
+
+        Args:
+            path: The card table file to load.
+            show_progress: Flag to log progress while loading a file.
+            batch_size: The number of cards to send to the database per insert.
+            max_concurrent_inserts: The maximum number of inserts in flight at
+                once.
+            workers: The number of processes to validate cards with. If 0,
+                cards are validated in this process.
+            engine: How validated cards are written to the database.
+
+        Returns:
+            The total number of cards loaded into the database.
+
+        Raises:
+            ImportError: If `pyarrow` is not installed.
+            RuntimeError: If used outside an `async with` context.
+        """
+
+        return await bulkdata_api.load_card_table_file(
+            path=path,
+            show_progress=show_progress,
+            batch_size=batch_size,
+            max_concurrent_inserts=max_concurrent_inserts,
+            workers=workers,
+            engine=engine,
         )
 
     # endregion
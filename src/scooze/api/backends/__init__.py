@@ -0,0 +1,11 @@
+from scooze.api.backends.base import StorageBackend
+from scooze.api.backends.memory import MemoryBackend
+from scooze.api.backends.mongo import MongoBackend
+from scooze.api.backends.sqlite import SQLiteBackend
+
+__all__ = (
+    "MemoryBackend",
+    "MongoBackend",
+    "SQLiteBackend",
+    "StorageBackend",
+)
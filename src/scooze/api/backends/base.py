@@ -0,0 +1,167 @@
+from abc import ABC, abstractmethod
+from typing import Any, AsyncIterator
+
+from beanie import PydanticObjectId
+from scooze.card import Card
+
+
+class StorageBackend(ABC):
+    """
+    Where ScoozeApi and AsyncScoozeApi store cards. Every method is a
+    coroutine, or an async generator for the streaming lookups, so that
+    backends with a network client and embedded backends share one interface.
+    """
+
+    @abstractmethod
+    async def connect(self) -> None:
+        """
+        Open the backend's connection to its store.
+        """
+
+    @abstractmethod
+    async def close(self) -> None:
+        """
+        Close the backend's connection to its store.
+        """
+
+    # region Card lookups
+
+    @abstractmethod
+    async def get_card_by(self, property_name: str, value: Any) -> Card | None:
+        """
+        Search the store for the first card that matches the given criteria.
+
+        Args:
+            property_name: The property to check.
+            value: The value to match on.
+
+        Returns:
+            The first matching card, or None if none were found.
+        """
+
+    @abstractmethod
+    async def get_cards_by(
+        self,
+        property_name: str,
+        values: list[Any],
+        paginated: bool = False,
+        page: int = 1,
+        page_size: int = 10,
+        fields: list[str] | None = None,
+    ) -> list[Card]:
+        """
+        Search the store for cards matching the given criteria, with options
+        for pagination.
+
+        Args:
+            property_name: The property to check.
+            values: A list of values to match on.
+            paginated: Whether to paginate the results.
+            page: The page to look at, if paginated.
+            page_size: The size of each page, if paginated.
+            fields: The properties to fetch for each card. If given, all other
+                properties are left at their defaults. If None, the whole card
+                is fetched.
+
+        Returns:
+            A list of cards matching the search criteria, or empty list if none
+                were found.
+        """
+
+    @abstractmethod
+    async def get_cards_all(self) -> list[Card]:
+        """
+        Get all cards from the store. WARNING: may be extremely large.
+
+        Returns:
+            A list of all cards in the store.
+        """
+
+    @abstractmethod
+    def iter_cards_by(
+        self,
+        property_name: str,
+        values: list[Any],
+        batch_size: int = 1000,
+        fields: list[str] | None = None,
+    ) -> AsyncIterator[Card]:
+        """
+        Stream cards matching the given criteria from the store, without
+        holding more than one batch of them in memory at a time.
+
+        Args:
+            property_name: The property to check.
+            values: A list of values to match on.
+            batch_size: The number of cards to fetch from the store at a time.
+            fields: The properties to fetch for each card. If given, all other
+                properties are left at their defaults. If None, the whole card
+                is fetched.
+        """
+
+    @abstractmethod
+    def iter_cards_all(self, batch_size: int = 1000, fields: list[str] | None = None) -> AsyncIterator[Card]:
+        """
+        Stream all cards from the store, without holding more than one batch
+        of them in memory at a time.
+
+        Args:
+            batch_size: The number of cards to fetch from the store at a time.
+            fields: The properties to fetch for each card. If given, all other
+                properties are left at their defaults. If None, the whole card
+                is fetched.
+        """
+
+    # endregion
+
+    # region Card writes
+
+    @abstractmethod
+    async def add_card(self, card: Card) -> PydanticObjectId | None:
+        """
+        Add a card to the store, and assign the resulting ID to it.
+
+        Args:
+            card: The card to insert.
+
+        Returns:
+            The ID of the inserted card, or None if it was unable.
+        """
+
+    @abstractmethod
+    async def add_cards(self, cards: list[Card]) -> list[PydanticObjectId]:
+        """
+        Add a list of cards to the store, and assign the resulting IDs to
+        them.
+
+        Args:
+            cards: The list of cards to insert.
+
+        Returns:
+            The IDs of the inserted cards, or empty list if no cards provided.
+
+        Raises:
+            BulkAddError: If not all cards are successfully inserted.
+        """
+
+    @abstractmethod
+    async def delete_card(self, id: str) -> bool:
+        """
+        Delete a card from the store.
+
+        Args:
+            id: The ID of the card to delete.
+
+        Returns:
+            True if the card is deleted, False otherwise.
+        """
+
+    @abstractmethod
+    async def delete_cards_all(self) -> int | None:
+        """
+        Delete all cards in the store.
+
+        Returns:
+            The number of cards deleted, or None if none could be deleted.
+        """
+
+    # endregion
@@ -0,0 +1,129 @@
+from pathlib import Path
+from typing import Any, AsyncIterator, Iterable, Iterator
+
+from beanie import PydanticObjectId
+from scooze.api.backends.base import StorageBackend
+from scooze.api.backends.mongo import MongoBackend
+from scooze.api.cardindex import CardIndex
+from scooze.card import Card
+from scooze.catalogs import ScryfallBulkFile
+from scooze.config import CONFIG
+
+
+async def _iterate_async(cards: Iterator[Card], batch_size: int) -> AsyncIterator[Card]:
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1.")
+
+    for card in cards:
+        yield card
+
+
+class MemoryBackend(StorageBackend):
+    """
+    Stores cards in an in-process `CardIndex`, so that lookups by ID, name,
+    and set are answered from hash indexes without a database round trip.
+
+    Cards are loaded when the backend connects: from the given `cards` if
+    there are any, otherwise from the bulk file of the given `bulk_file_type`
+    if there is one, and otherwise from MongoDB. Cards added or deleted
+    through the backend only change the index in memory.
+
+    Attributes:
+        index: The `CardIndex` holding the cards, or None until the backend
+            connects.
+
+    Example:
+        ``` python
+        with ScoozeApi(backend=MemoryBackend(bulk_file_type=ScryfallBulkFile.ORACLE)) as s:
+            black_lotus = s.get_card_by_name("Black Lotus")
+        ```
+    """
+
+    def __init__(
+        self,
+        cards: Iterable[Card] | None = None,
+        bulk_file_type: ScryfallBulkFile | None = None,
+        bulk_file_dir: Path = CONFIG.bulk_file_dir,
+    ):
+        self.index: CardIndex | None = None
+        self._cards = cards
+        self._bulk_file_type = bulk_file_type
+        self._bulk_file_dir = bulk_file_dir
+
+    async def connect(self) -> None:
+        if self.index is not None:
+            return
+
+        if self._cards is not None:
+            self.index = CardIndex(cards=self._cards)
+        elif self._bulk_file_type is not None:
+            self.index = CardIndex(bulk_file_type=self._bulk_file_type, bulk_file_dir=self._bulk_file_dir)
+            self.index.load()
+        else:
+            # NOTE: CardIndex loads from the database through ScoozeApi, which can't run inside this event loop
+            mongo = MongoBackend()
+            await mongo.connect()
+            try:
+                self.index = CardIndex(cards=[card async for card in mongo.iter_cards_all()])
+            finally:
+                await mongo.close()
+        self._cards = None
+
+    async def close(self) -> None:
+        pass
+
+    # region Card lookups
+
+    async def get_card_by(self, property_name: str, value: Any) -> Card | None:
+        return self.index.get_card_by(property_name=property_name, value=value)
+
+    async def get_cards_by(
+        self,
+        property_name: str,
+        values: list[Any],
+        paginated: bool = False,
+        page: int = 1,
+        page_size: int = 10,
+        fields: list[str] | None = None,
+    ) -> list[Card]:
+        # NOTE: cards are already in memory, so whole cards are returned whatever the fields
+        return self.index.get_cards_by(
+            property_name=property_name,
+            values=values,
+            paginated=paginated,
+            page=page,
+            page_size=page_size,
+        )
+
+    async def get_cards_all(self) -> list[Card]:
+        return self.index.get_cards_all()
+
+    def iter_cards_by(
+        self,
+        property_name: str,
+        values: list[Any],
+        batch_size: int = 1000,
+        fields: list[str] | None = None,
+    ) -> AsyncIterator[Card]:
+        return _iterate_async(self.index.iter_cards_by(property_name=property_name, values=values), batch_size)
+
+    def iter_cards_all(self, batch_size: int = 1000, fields: list[str] | None = None) -> AsyncIterator[Card]:
+        return _iterate_async(iter(self.index.get_cards_all()), batch_size)
+
+    # endregion
+
+    # region Card writes
+
+    async def add_card(self, card: Card) -> PydanticObjectId | None:
+        return self.index.add_card(card)
+
+    async def add_cards(self, cards: list[Card]) -> list[PydanticObjectId]:
+        return self.index.add_cards(cards)
+
+    async def delete_card(self, id: str) -> bool:
+        return self.index.delete_card(id)
+
+    async def delete_cards_all(self) -> int | None:
+        return self.index.delete_cards_all()
+
+    # endregion
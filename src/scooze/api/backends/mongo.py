@@ -0,0 +1,84 @@
+from typing import Any, AsyncIterator
+
+import scooze.api.card as card_api
+from beanie import PydanticObjectId, init_beanie
+from scooze.api.backends.base import StorageBackend
+from scooze.card import Card
+from scooze.config import CONFIG
+from scooze.models.card import CardModel
+from scooze.models.deck import DeckModel
+from scooze.mongo import db, mongo_close, mongo_connect
+
+
+class MongoBackend(StorageBackend):
+    """
+    Stores cards in MongoDB, at `CONFIG.mongo_dsn`, through Beanie.
+    """
+
+    async def connect(self) -> None:
+        await mongo_connect()
+        await init_beanie(
+            database=db.client[CONFIG.mongo_db],
+            document_models=[CardModel, DeckModel],
+            # NOTE: indexes are only built by scooze.api.index, so dropped indexes stay dropped
+            skip_indexes=True,
+        )
+
+    async def close(self) -> None:
+        await mongo_close()
+
+    # region Card lookups
+
+    async def get_card_by(self, property_name: str, value: Any) -> Card | None:
+        return await card_api.get_card_by(property_name=property_name, value=value)
+
+    async def get_cards_by(
+        self,
+        property_name: str,
+        values: list[Any],
+        paginated: bool = False,
+        page: int = 1,
+        page_size: int = 10,
+        fields: list[str] | None = None,
+    ) -> list[Card]:
+        return await card_api.get_cards_by(
+            property_name=property_name,
+            values=values,
+            paginated=paginated,
+            page=page,
+            page_size=page_size,
+            fields=fields,
+        )
+
+    async def get_cards_all(self) -> list[Card]:
+        return await card_api.get_cards_all()
+
+    def iter_cards_by(
+        self,
+        property_name: str,
+        values: list[Any],
+        batch_size: int = 1000,
+        fields: list[str] | None = None,
+    ) -> AsyncIterator[Card]:
+        return card_api.iter_cards_by(property_name=property_name, values=values, batch_size=batch_size, fields=fields)
+
+    def iter_cards_all(self, batch_size: int = 1000, fields: list[str] | None = None) -> AsyncIterator[Card]:
+        return card_api.iter_cards_all(batch_size=batch_size, fields=fields)
+
+    # endregion
+
+    # region Card writes
+
+    async def add_card(self, card: Card) -> PydanticObjectId | None:
+        return await card_api.add_card(card=card)
+
+    async def add_cards(self, cards: list[Card]) -> list[PydanticObjectId]:
+        return await card_api.add_cards(cards=cards)
+
+    async def delete_card(self, id: str) -> bool:
+        return await card_api.delete_card(id=id)
+
+    async def delete_cards_all(self) -> int | None:
+        return await card_api.delete_cards_all()
+
+    # endregion
@@ -0,0 +1,259 @@
+import json
+import sqlite3
+from enum import Enum
+from pathlib import Path
+from typing import Any, AsyncIterator
+
+from beanie import PydanticObjectId
+from scooze.api.backends.base import StorageBackend
+from scooze.card import Card
+from scooze.config import CONFIG
+from scooze.errors import BulkAddError
+from scooze.logger import logger
+from scooze.models.card import CardModelData
+from scooze.utils import to_lower_camel
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS cards (
+    id TEXT PRIMARY KEY,
+    name TEXT,
+    scryfall_id TEXT,
+    oracle_id TEXT,
+    set_code TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS cards_name ON cards (name);
+CREATE INDEX IF NOT EXISTS cards_scryfall_id ON cards (scryfall_id);
+CREATE INDEX IF NOT EXISTS cards_oracle_id ON cards (oracle_id);
+CREATE INDEX IF NOT EXISTS cards_set_code ON cards (set_code);
+
+CREATE TABLE IF NOT EXISTS card_legalities (
+    card_id TEXT NOT NULL REFERENCES cards (id) ON DELETE CASCADE,
+    format TEXT NOT NULL,
+    legality TEXT NOT NULL,
+    PRIMARY KEY (card_id, format)
+);
+CREATE INDEX IF NOT EXISTS card_legalities_format_legality ON card_legalities (format, legality);
+"""
+
+# Card JSON properties that are stored in their own indexed column.
+INDEXED_COLUMNS = {
+    "_id": "id",
+    "name": "name",
+    "scryfallId": "scryfall_id",
+    "oracleId": "oracle_id",
+    "set": "set_code",
+}
+
+
+def _property_for(property_name: str) -> str:
+    match property_name:
+        case "_id" | "id" | "scooze_id":
+            return "_id"
+        case _:
+            return to_lower_camel(property_name)
+
+
+def _to_param(value: Any) -> Any:
+    match value:
+        case PydanticObjectId():
+            return str(value)
+        case Enum():
+            return value.value
+        case list() | tuple() | set() | frozenset() | dict():
+            return json.dumps(value, separators=(",", ":"), default=_to_param)
+        case _:
+            return value
+
+
+def _where(property_name: str, values: list[Any]) -> tuple[str, list[Any]]:
+    prop = _property_for(property_name)
+    placeholders = ", ".join("?" * len(values))
+
+    if prop == "_id":
+        return f"id IN ({placeholders})", [str(PydanticObjectId(value)) for value in values]
+    if column := INDEXED_COLUMNS.get(prop):
+        return f"{column} IN ({placeholders})", [_to_param(value) for value in values]
+    if prop.startswith("legalities."):
+        fmt = prop.removeprefix("legalities.")
+        clause = f"id IN (SELECT card_id FROM card_legalities WHERE format = ? AND legality IN ({placeholders}))"
+        return clause, [fmt, *(_to_param(value) for value in values)]
+
+    # Like a Mongo query, a value matches a multi-valued property if it is one of its elements, and a list of values
+    # matches if it is the whole property.
+    path = f"$.{prop}"
+    scalars = [_to_param(value) for value in values if not isinstance(value, (list, tuple, set, frozenset, dict))]
+    composites = [_to_param(value) for value in values if isinstance(value, (list, tuple, set, frozenset, dict))]
+    clauses, params = [], []
+    if scalars:
+        clauses.append(f"EXISTS (SELECT 1 FROM json_each(data, ?) WHERE value IN ({', '.join('?' * len(scalars))}))")
+        params.extend([path, *scalars])
+    for composite in composites:
+        clauses.append("json_extract(data, ?) = json(?)")
+        params.extend([path, composite])
+
+    return f"({' OR '.join(clauses) or '0'})", params
+
+
+def _to_card(id: str, data: str, fields: list[str] | None = None) -> Card:
+    card_json = json.loads(data)
+    if fields is not None:
+        # NOTE: only the projected fields are validated; the rest take their defaults
+        projection = {_property_for(field) for field in fields}
+        card_json = {k: v for k, v in card_json.items() if k in projection}
+
+    return Card(**CardModelData.model_validate(card_json).model_dump(), id=id)
+
+
+class SQLiteBackend(StorageBackend):
+    """
+    Stores cards in an embedded SQLite database, so that scooze can run
+    without a MongoDB server.
+
+    Each card is stored as JSON, with its name, IDs, and set in indexed
+    columns and its legalities in an indexed table of their own. Queries run
+    on the calling thread, since SQLite answers them from local disk.
+
+    Attributes:
+        path: The database file, or ":memory:" for a database that only lasts
+            until the backend is closed.
+    """
+
+    def __init__(self, path: Path | str = CONFIG.sqlite_path):
+        self.path = path
+        self._connection: sqlite3.Connection | None = None
+
+    async def connect(self) -> None:
+        if str(self.path) != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(self.path)
+        self._connection.execute("PRAGMA foreign_keys = ON")
+        self._connection.executescript(SCHEMA)
+
+    async def close(self) -> None:
+        self._connection.close()
+        self._connection = None
+
+    # region Card lookups
+
+    async def get_card_by(self, property_name: str, value: Any) -> Card | None:
+        where, params = _where(property_name, [value])
+        row = self._connection.execute(f"SELECT id, data FROM cards WHERE {where} ORDER BY rowid LIMIT 1", params)
+        if (result := row.fetchone()) is not None:
+            return _to_card(*result)
+
+    async def get_cards_by(
+        self,
+        property_name: str,
+        values: list[Any],
+        paginated: bool = False,
+        page: int = 1,
+        page_size: int = 10,
+        fields: list[str] | None = None,
+    ) -> list[Card]:
+        where, params = _where(property_name, values)
+        query = f"SELECT id, data FROM cards WHERE {where} ORDER BY rowid"
+        if paginated:
+            query += " LIMIT ? OFFSET ?"
+            params.extend([page_size, (page - 1) * page_size])
+
+        return [_to_card(id, data, fields) for id, data in self._connection.execute(query, params)]
+
+    async def get_cards_all(self) -> list[Card]:
+        return [
+            _to_card(id, data) for id, data in self._connection.execute("SELECT id, data FROM cards ORDER BY rowid")
+        ]
+
+    async def iter_cards_by(
+        self,
+        property_name: str,
+        values: list[Any],
+        batch_size: int = 1000,
+        fields: list[str] | None = None,
+    ) -> AsyncIterator[Card]:
+        where, params = _where(property_name, values)
+        async for card in self._iter_cards(f"WHERE {where}", params, batch_size=batch_size, fields=fields):
+            yield card
+
+    async def iter_cards_all(self, batch_size: int = 1000, fields: list[str] | None = None) -> AsyncIterator[Card]:
+        async for card in self._iter_cards("", [], batch_size=batch_size, fields=fields):
+            yield card
+
+    async def _iter_cards(
+        self,
+        where: str,
+        params: list[Any],
+        batch_size: int,
+        fields: list[str] | None,
+    ) -> AsyncIterator[Card]:
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1.")
+
+        cursor = self._connection.execute(f"SELECT id, data FROM cards {where} ORDER BY rowid", params)
+        try:
+            while rows := cursor.fetchmany(batch_size):
+                for id, data in rows:
+                    yield _to_card(id, data, fields)
+        finally:
+            cursor.close()
+
+    # endregion
+
+    # region Card writes
+
+    async def add_card(self, card: Card) -> PydanticObjectId | None:
+        try:
+            return self._insert_cards([card])[0]
+        except Exception as e:
+            logger.exception("Failed to add card.", extra={"card": card}, exc_info=e)
+
+    async def add_cards(self, cards: list[Card]) -> list[PydanticObjectId]:
+        if not cards:
+            return []
+
+        try:
+            return self._insert_cards(cards)
+        except Exception:
+            raise BulkAddError("Failed to add all cards to the database.")
+
+    def _insert_cards(self, cards: list[Card]) -> list[PydanticObjectId]:
+        rows, legalities = [], []
+        for card in cards:
+            card_data = CardModelData.model_validate(card.__dict__)
+            id = str(PydanticObjectId())
+            rows.append(
+                (
+                    id,
+                    card_data.name,
+                    card_data.scryfall_id,
+                    card_data.oracle_id,
+                    card_data.set_code,
+                    card_data.model_dump_json(by_alias=True),
+                )
+            )
+            legalities.extend((id, fmt, legality) for fmt, legality in (card_data.legalities or {}).items())
+
+        # All cards are inserted in one transaction, so either all of them are added or none are
+        with self._connection:
+            self._connection.executemany("INSERT INTO cards VALUES (?, ?, ?, ?, ?, ?)", rows)
+            self._connection.executemany("INSERT INTO card_legalities VALUES (?, ?, ?)", legalities)
+
+        card_ids = [PydanticObjectId(row[0]) for row in rows]
+        for card, card_id in zip(cards, card_ids):
+            card.scooze_id = card_id
+        return card_ids
+
+    async def delete_card(self, id: str) -> bool:
+        if not PydanticObjectId.is_valid(id):
+            return False
+
+        with self._connection:
+            cursor = self._connection.execute("DELETE FROM cards WHERE id = ?", [str(PydanticObjectId(id))])
+        return cursor.rowcount > 0
+
+    async def delete_cards_all(self) -> int | None:
+        with self._connection:
+            cursor = self._connection.execute("DELETE FROM cards")
+        return cursor.rowcount
+
+    # endregion
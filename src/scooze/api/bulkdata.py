@@ -1,76 +1,845 @@
+import asyncio
+import hashlib
+import json
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import aclosing, asynccontextmanager
+from functools import partial
+from itertools import islice
 from pathlib import Path
+from typing import (
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    NamedTuple,
+)
 
 import ijson
+import scooze.api.index as index_api
+from motor.motor_asyncio import AsyncIOMotorCollection
 from pydantic_core import ValidationError
+from pymongo import IndexModel, InsertOne, ReplaceOne
+from scooze.arrow import (
+    cards_to_record_batch,
+    open_card_table_writer,
+    read_card_table_file,
+    record_batch_to_card_jsons,
+)
+from scooze.bulkdata import (
+    find_bulk_data_file,
+    get_bulk_metadata,
+    open_bulk_data_file,
+    stream_bulk_data_file,
+)
 from scooze.catalogs import ScryfallBulkFile
+from scooze.config import CONFIG
 from scooze.console import logger as cli_logger
+from scooze.enums import BulkLoadEngine, CardTableFormat, DbCollection
 from scooze.models.card import CardModel, CardModelData
+from scooze.mongo import db
 
+# Number of cards sent to a worker process at a time when validating with a process pool.
+VALIDATION_CHUNK_SIZE = 500
 
-async def load_card_file(file_type: ScryfallBulkFile, bulk_file_dir: str, show_progress: bool = True) -> int:
+# Collection that cards are loaded into before being swapped in by `load_card_file(swap=True)`.
+STAGING_CARDS_COLLECTION = f"{DbCollection.CARDS}_staging"
+
+# Field holding a hash of each card's content, written by `sync_card_file` to detect unchanged cards.
+CONTENT_HASH_FIELD = "_contentHash"
+
+
+class CardSyncResult(NamedTuple):
+    """
+    Counts of the changes made to the cards collection by `sync_card_file`.
+    """
+
+    inserted: int
+    updated: int
+    unchanged: int
+    deleted: int
+
+
+async def load_card_file(
+    file_type: ScryfallBulkFile,
+    bulk_file_dir: str,
+    show_progress: bool = True,
+    batch_size: int = 5000,
+    max_concurrent_inserts: int = 2,
+    workers: int = 0,
+    engine: BulkLoadEngine = BulkLoadEngine.BEANIE,
+    swap: bool = False,
+) -> int:
     """
     Loads the desired file from the given directory into a local Mongo
     database.
 
+    Parsing and validation run concurrently with database writes; validated
+    cards are grouped into batches and handed to a bounded queue that is
+    drained by up to `max_concurrent_inserts` inserters. If `workers` is
+    given, validation is spread across that many worker processes while
+    cards are still inserted in file order.
+
+    The file may be stored uncompressed or gzip- or zstd-compressed, in which
+    case it is decompressed as it is parsed.
+
+    With `BulkLoadEngine.RAW`, validated cards are written to the cards
+    collection as plain dicts with an unordered `insert_many`, skipping the
+    construction and state tracking of Beanie documents.
+
+    With `swap`, the file is loaded into a staging collection that is given
+    the same indexes as the cards collection and then renamed over it, so
+    readers see either the old cards or the new ones, never a partial load.
+    The staging collection is dropped if anything goes wrong, leaving the
+    existing cards in place.
+
     Args:
         file_type: The type of [ScryfallBulkFile](https://scryfall.com/docs/api/bulk-data)
         to insert into the database.
         bulk_file_dir: The path to the folder containing the ScryfallBulkFile.
         show_progress: Flag to log progress while loading a file.
+        batch_size: The number of cards to send to the database per insert.
+        max_concurrent_inserts: The maximum number of inserts in flight at
+            once.
+        workers: The number of processes to validate cards with. If 0,
+            cards are validated in this process.
+        engine: How validated cards are written to the database. Ignored
+            with `swap`, which always writes raw documents.
+        swap: Flag to replace the cards collection with the contents of the
+            file in a single step, rather than adding to it.
 
     Returns:
         The total number of cards loaded into the database.
     """
 
-    file_path = Path(bulk_file_dir) / f"{file_type}.json"
-    batch_size = 5000
-    current_batch_count = 0
-    results_count = 0
-    current_batch: list[CardModel] = []
+    if workers < 0:
+        raise ValueError("workers must not be negative.")
+
+    if swap:
+        return await _load_and_swap_card_file(
+            file_type=file_type,
+            bulk_file_dir=bulk_file_dir,
+            show_progress=show_progress,
+            batch_size=batch_size,
+            max_concurrent_inserts=max_concurrent_inserts,
+            workers=workers,
+        )
 
-    with file_path.open(mode="rb") as cards_file:
+    file_path = find_bulk_data_file(file_type, bulk_file_dir)
+
+    with open_bulk_data_file(file_path) as cards_file:
         card_jsons = ijson.items(cards_file, "item")
+        validated_cards = _validate(card_jsons, workers=workers, engine=engine)
+        async with _deferred_card_indexes():
+            return await _load_cards(
+                validated_cards=validated_cards,
+                write_batch=partial(_insert_batch, engine=engine),
+                show_progress=show_progress,
+                batch_size=batch_size,
+                max_concurrent_inserts=max_concurrent_inserts,
+            )
 
-        async def load_batch(batch: list[CardModel]) -> int:
-            batch_results = await CardModel.insert_many(batch)
-            if batch_results is not None:
-                return len(batch_results.inserted_ids)
-            return 0
 
-        for card_json in card_jsons:
-            if (validated_card := _try_validate_card(card_json)) is not None:
+async def _load_and_swap_card_file(
+    file_type: ScryfallBulkFile,
+    bulk_file_dir: str,
+    show_progress: bool,
+    batch_size: int,
+    max_concurrent_inserts: int,
+    workers: int,
+) -> int:
+    """
+    Load the desired file into the staging collection, then rename it over the
+    cards collection.
+
+    Args:
+        file_type: The type of ScryfallBulkFile to load.
+        bulk_file_dir: The path to the folder containing the ScryfallBulkFile.
+        show_progress: Flag to log progress while loading a file.
+        batch_size: The number of cards to send to the database per insert.
+        max_concurrent_inserts: The maximum number of inserts in flight at
+            once.
+        workers: The number of processes to validate cards with.
+
+    Returns:
+        The total number of cards loaded into the database.
+    """
+
+    database = db.client[CONFIG.mongo_db]
+    staging = database[STAGING_CARDS_COLLECTION]
+    # Clear out anything left behind by an interrupted swap
+    await staging.drop()
+
+    try:
+        file_path = find_bulk_data_file(file_type, bulk_file_dir)
+        with open_bulk_data_file(file_path) as cards_file:
+            card_jsons = ijson.items(cards_file, "item")
+            validated_cards = _validate(card_jsons, workers=workers, engine=BulkLoadEngine.RAW)
+            loaded_count = await _load_cards(
+                validated_cards=validated_cards,
+                write_batch=partial(_insert_batch, engine=BulkLoadEngine.RAW, collection=staging),
+                show_progress=show_progress,
+                batch_size=batch_size,
+                max_concurrent_inserts=max_concurrent_inserts,
+            )
+
+        # Index the staging collection only once it is fully loaded
+        await staging.create_indexes(index_api.DECLARED_INDEXES[DbCollection.CARDS])
+        await _copy_indexes(source=database[DbCollection.CARDS], target=staging)
+        # NOTE: renaming with dropTarget replaces the cards collection atomically
+        await staging.rename(DbCollection.CARDS, dropTarget=True)
+    except BaseException:
+        await staging.drop()
+        raise
+
+    return loaded_count
+
+
+async def _copy_indexes(source: AsyncIOMotorCollection, target: AsyncIOMotorCollection) -> None:
+    """
+    Create the indexes of one collection on another.
+
+    Args:
+        source: The collection to read indexes from.
+        target: The collection to create indexes on.
+    """
+
+    index_models = [
+        IndexModel(info.pop("key"), name=name, **{k: v for k, v in info.items() if k not in ("v", "ns")})
+        for name, info in (await source.index_information()).items()
+        if name != "_id_"
+    ]
+    if index_models:
+        await target.create_indexes(index_models)
+
+
+async def stream_card_file(
+    file_type: ScryfallBulkFile,
+    bulk_file_dir: str | None = None,
+    show_progress: bool = True,
+    batch_size: int = 5000,
+    max_concurrent_inserts: int = 2,
+    workers: int = 0,
+    engine: BulkLoadEngine = BulkLoadEngine.BEANIE,
+    uri: str | None = None,
+) -> int:
+    """
+    Loads the desired file into a local Mongo database as it is downloaded
+    from Scryfall, rather than downloading it to disk first.
+
+    The response body feeds the same parsing, validation, and insert pipeline
+    as `load_card_file`, so loading finishes about when the download does.
+
+    Args:
+        file_type: The type of [ScryfallBulkFile](https://scryfall.com/docs/api/bulk-data)
+        to insert into the database.
+        bulk_file_dir: The path to a folder to also save the ScryfallBulkFile
+            to. If None, the file is not saved.
+        show_progress: Flag to log progress while loading a file.
+        batch_size: The number of cards to send to the database per insert.
+        max_concurrent_inserts: The maximum number of inserts in flight at
+            once.
+        workers: The number of processes to validate cards with. If 0,
+            cards are validated in this process.
+        engine: How validated cards are written to the database.
+        uri: Location of the bulk data file. If None, it is looked up from
+            the bulk info endpoint.
+
+    Returns:
+        The total number of cards loaded into the database.
+
+    Raises:
+        HTTPError: If request for bulk file not successful.
+    """
+
+    if workers < 0:
+        raise ValueError("workers must not be negative.")
+
+    if uri is None:
+        bulk_metadata = await asyncio.get_running_loop().run_in_executor(None, get_bulk_metadata)
+        uri = bulk_metadata[file_type]["download_uri"]
+    tee_file = Path(bulk_file_dir) / f"{file_type}.json" if bulk_file_dir is not None else None
+
+    async with stream_bulk_data_file(uri, tee_file=tee_file) as cards_stream, _deferred_card_indexes():
+        card_jsons = ijson.items_async(cards_stream, "item")
+        return await _load_cards(
+            validated_cards=_validate(card_jsons, workers=workers, engine=engine),
+            write_batch=partial(_insert_batch, engine=engine),
+            show_progress=show_progress,
+            batch_size=batch_size,
+            max_concurrent_inserts=max_concurrent_inserts,
+        )
+
+
+async def sync_card_file(
+    file_type: ScryfallBulkFile,
+    bulk_file_dir: str,
+    show_progress: bool = True,
+    batch_size: int = 5000,
+    max_concurrent_inserts: int = 2,
+    workers: int = 0,
+) -> CardSyncResult:
+    """
+    Brings the cards collection in line with the desired file from the given
+    directory, writing only what changed since the last sync.
+
+    Cards are matched by Scryfall ID. New cards are inserted, cards whose
+    content hash differs from the stored one are replaced, and cards that are
+    no longer in the file are deleted. Cards are written as raw documents, as
+    with `BulkLoadEngine.RAW`.
+
+    Args:
+        file_type: The type of [ScryfallBulkFile](https://scryfall.com/docs/api/bulk-data)
+        to sync the database with.
+        bulk_file_dir: The path to the folder containing the ScryfallBulkFile.
+        show_progress: Flag to log progress while syncing a file.
+        batch_size: The number of cards to send to the database per write.
+        max_concurrent_inserts: The maximum number of writes in flight at
+            once.
+        workers: The number of processes to validate cards with. If 0,
+            cards are validated in this process.
+
+    Returns:
+        The number of cards inserted, updated, left unchanged, and deleted.
+    """
+
+    if workers < 0:
+        raise ValueError("workers must not be negative.")
+
+    collection = db.client[CONFIG.mongo_db][DbCollection.CARDS]
+    stored_hashes: dict[str, str | None] = {
+        doc["scryfallId"]: doc.get(CONTENT_HASH_FIELD)
+        async for doc in collection.find({}, {"_id": 0, "scryfallId": 1, CONTENT_HASH_FIELD: 1})
+        if "scryfallId" in doc
+    }
+    seen_ids: set[str] = set()
+    inserted = updated = unchanged = 0
+
+    async def write_batch(batch: list[dict]) -> int:
+        nonlocal inserted, updated, unchanged
+        requests: list[InsertOne | ReplaceOne] = []
+        for doc in batch:
+            scryfall_id = doc["scryfallId"]
+            doc[CONTENT_HASH_FIELD] = _content_hash(doc)
+            seen_ids.add(scryfall_id)
+            if scryfall_id not in stored_hashes:
+                requests.append(InsertOne(doc))
+                inserted += 1
+            elif stored_hashes[scryfall_id] != doc[CONTENT_HASH_FIELD]:
+                requests.append(ReplaceOne({"scryfallId": scryfall_id}, doc))
+                updated += 1
+            else:
+                unchanged += 1
+        if requests:
+            await collection.bulk_write(requests, ordered=False)
+        return len(batch)
+
+    file_path = find_bulk_data_file(file_type, bulk_file_dir)
+
+    with open_bulk_data_file(file_path) as cards_file:
+        card_jsons = ijson.items(cards_file, "item")
+        validated_cards = _validate(card_jsons, workers=workers, engine=BulkLoadEngine.RAW)
+        async with _deferred_card_indexes():
+            await _load_cards(
+                validated_cards=validated_cards,
+                write_batch=write_batch,
+                show_progress=show_progress,
+                batch_size=batch_size,
+                max_concurrent_inserts=max_concurrent_inserts,
+            )
+
+    vanished_ids = [scryfall_id for scryfall_id in stored_hashes if scryfall_id not in seen_ids]
+    deleted = 0
+    for i in range(0, len(vanished_ids), batch_size):
+        delete_result = await collection.delete_many({"scryfallId": {"$in": vanished_ids[i : i + batch_size]}})
+        deleted += delete_result.deleted_count
+
+    result = CardSyncResult(inserted=inserted, updated=updated, unchanged=unchanged, deleted=deleted)
+    if show_progress:
+        print(
+            f"Synced {file_type}: {result.inserted} inserted, {result.updated} updated, "
+            f"{result.unchanged} unchanged, {result.deleted} deleted."
+        )
+    return result
+
+
+async def export_card_file(
+    path: Path,
+    format: CardTableFormat = CardTableFormat.PARQUET,
+    file_type: ScryfallBulkFile | None = None,
+    bulk_file_dir: str = CONFIG.bulk_file_dir,
+    batch_size: int = 10000,
+) -> int:
+    """
+    Export cards to a Parquet or Arrow IPC card table file. Cards are read
+    from the local Mongo database, or from a bulk data file if `file_type` is
+    given, and written a batch at a time, so the whole collection is never
+    held in memory.
+
+    Args:
+        path: Where to write the file.
+        format: The file format to write.
+        file_type: The type of [ScryfallBulkFile](https://scryfall.com/docs/api/bulk-data)
+            to export. If None, the cards collection is exported.
+        bulk_file_dir: The path to the folder containing the ScryfallBulkFile.
+        batch_size: The number of cards to convert and write at a time.
+
+    Returns:
+        The total number of cards exported.
+
+    Raises:
+        ImportError: If `pyarrow` is not installed.
+    """
+
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1.")
+
+    total = 0
+    with open_card_table_writer(path, format) as writer:
+        if file_type is None:
+            cards = db.client[CONFIG.mongo_db][DbCollection.CARDS].find({})
+            async for chunk in _chunked(cards, batch_size):
+                writer.write_batch(cards_to_record_batch(chunk))
+                total += len(chunk)
+        else:
+            with open_bulk_data_file(find_bulk_data_file(file_type, bulk_file_dir)) as cards_file:
+                async for chunk in _chunked(ijson.items(cards_file, "item"), batch_size):
+                    validated_cards = [card for card in map(_try_validate_card_data, chunk) if card is not None]
+                    writer.write_batch(cards_to_record_batch(validated_cards))
+                    total += len(validated_cards)
+    return total
+
+
+async def load_card_table_file(
+    path: Path,
+    show_progress: bool = True,
+    batch_size: int = 5000,
+    max_concurrent_inserts: int = 2,
+    workers: int = 0,
+    engine: BulkLoadEngine = BulkLoadEngine.BEANIE,
+) -> int:
+    """
+    Loads a Parquet or Arrow IPC card table file, as written by
+    `export_card_file`, into a local Mongo database.
+
+    Rows are converted back to card JSON and fed through the same validation
+    and insert pipeline as `load_card_file`. Cards are given new IDs.
+
+    Args:
+        path: The card table file to load.
+        show_progress: Flag to log progress while loading a file.
+        batch_size: The number of cards to send to the database per insert.
+        max_concurrent_inserts: The maximum number of inserts in flight at
+            once.
+        workers: The number of processes to validate cards with. If 0,
+            cards are validated in this process.
+        engine: How validated cards are written to the database.
+
+    Returns:
+        The total number of cards loaded into the database.
+
+    Raises:
+        ImportError: If `pyarrow` is not installed.
+    """
+
+    if workers < 0:
+        raise ValueError("workers must not be negative.")
+
+    card_jsons = (
+        card_json
+        for record_batch in read_card_table_file(path, batch_size=batch_size)
+        for card_json in record_batch_to_card_jsons(record_batch)
+    )
+    async with _deferred_card_indexes():
+        return await _load_cards(
+            validated_cards=_validate(card_jsons, workers=workers, engine=engine),
+            write_batch=partial(_insert_batch, engine=engine),
+            show_progress=show_progress,
+            batch_size=batch_size,
+            max_concurrent_inserts=max_concurrent_inserts,
+        )
+
+
+@asynccontextmanager
+async def _deferred_card_indexes() -> AsyncIterator[None]:
+    """
+    Defer building the declared card indexes while loading into an empty
+    cards collection. Building an index once over loaded data is much faster
+    than updating it on every insert.
+
+    If the cards collection already holds cards, its indexes are left in
+    place so that they keep serving queries during the load.
+    """
+
+    if await db.client[CONFIG.mongo_db][DbCollection.CARDS].find_one({}, {"_id": 1}) is not None:
+        yield
+        return
+
+    await index_api.drop_indexes(DbCollection.CARDS)
+    try:
+        yield
+    finally:
+        await index_api.build_indexes(DbCollection.CARDS)
+
+
+async def _load_cards(
+    validated_cards: AsyncIterator[CardModel | dict],
+    write_batch: Callable[[list[CardModel | dict]], Awaitable[int]],
+    show_progress: bool,
+    batch_size: int,
+    max_concurrent_inserts: int,
+) -> int:
+    """
+    Write the given validated cards to the database, with validation and
+    writing joined by a bounded queue.
+
+    Args:
+        validated_cards: Validated cards, in load order.
+        write_batch: Writes a batch of validated cards to the database and
+            returns the number of cards processed.
+        show_progress: Flag to log progress and throughput while loading.
+        batch_size: The number of cards to send to the database per insert.
+        max_concurrent_inserts: The maximum number of inserts in flight at
+            once.
+
+    Returns:
+        The total number of cards loaded into the database.
+    """
+
+    if batch_size < 1 or max_concurrent_inserts < 1:
+        raise ValueError("batch_size and max_concurrent_inserts must be at least 1.")
+
+    # NOTE: bounding the queue applies backpressure to parsing when the database falls behind
+    queue: asyncio.Queue[list[CardModel | dict] | None] = asyncio.Queue(maxsize=max_concurrent_inserts)
+    results_count = 0
+    start_time = time.perf_counter()
+
+    async def produce_batches() -> None:
+        current_batch: list[CardModel | dict] = []
+        async with aclosing(validated_cards):
+            async for validated_card in validated_cards:
                 current_batch.append(validated_card)
-                current_batch_count += 1
-                if current_batch_count >= batch_size:
-                    results_count += await load_batch(current_batch)
+                if len(current_batch) >= batch_size:
+                    await queue.put(current_batch)
                     current_batch = []
-                    current_batch_count = 0
-                    if show_progress:
-                        print(f"Finished processing {results_count} cards...", end="\r")
-        results_count += await load_batch(current_batch)
+                    # Yield so an idle inserter can start on the batch before parsing continues
+                    await asyncio.sleep(0)
+        if current_batch:
+            await queue.put(current_batch)
+        for _ in range(max_concurrent_inserts):
+            await queue.put(None)
+
+    async def insert_batches() -> None:
+        nonlocal results_count
+        while (batch := await queue.get()) is not None:
+            results_count += await write_batch(batch)
+            if show_progress:
+                rate = results_count / max(time.perf_counter() - start_time, 1e-9)
+                print(f"Finished processing {results_count} cards ({rate:.0f} cards/s)...", end="\r")
+
+    try:
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(produce_batches())
+            for _ in range(max_concurrent_inserts):
+                tg.create_task(insert_batches())
+    except ExceptionGroup as eg:
+        # Surface the first error rather than the TaskGroup wrapper, keeping any others as its cause
+        raise eg.exceptions[0] from eg
+
+    if show_progress:
+        elapsed = time.perf_counter() - start_time
+        print(f"Loaded {results_count} cards in {elapsed:.2f}s ({results_count / max(elapsed, 1e-9):.0f} cards/s).")
 
     return results_count
 
 
-def _try_validate_card(card_json: dict) -> CardModel | None:
+async def _insert_batch(
+    batch: list[CardModel | dict],
+    engine: BulkLoadEngine,
+    collection: AsyncIOMotorCollection | None = None,
+) -> int:
+    """
+    Insert a single batch of validated cards into the database.
+
+    Args:
+        batch: The validated cards to insert.
+        engine: How validated cards are written to the database.
+        collection: The collection raw documents are written to. Defaults to
+            the cards collection.
+
+    Returns:
+        The number of cards inserted.
+    """
+
+    match engine:
+        case BulkLoadEngine.RAW:
+            if collection is None:
+                collection = db.client[CONFIG.mongo_db][DbCollection.CARDS]
+            batch_results = await collection.insert_many(batch, ordered=False)
+        case _:
+            batch_results = await CardModel.insert_many(batch)
+    if batch_results is not None:
+        return len(batch_results.inserted_ids)
+    return 0
+
+
+def _validate(
+    card_jsons: Iterable[dict] | AsyncIterable[dict],
+    workers: int,
+    engine: BulkLoadEngine,
+) -> AsyncIterator[CardModel | dict]:
+    """
+    Validate card JSONs, in this process or across a pool of worker processes.
+
+    Args:
+        card_jsons: JSON representations of cards, in load order.
+        workers: The number of worker processes to use. If 0, cards are
+            validated in this process.
+        engine: How validated cards will be written to the database.
+
+    Returns:
+        Validated models, in load order.
+    """
+
+    if workers:
+        return _validate_in_processes(card_jsons, workers=workers, engine=engine)
+    return _validate_serially(card_jsons, engine=engine)
+
+
+async def _validate_serially(
+    card_jsons: Iterable[dict] | AsyncIterable[dict],
+    engine: BulkLoadEngine = BulkLoadEngine.BEANIE,
+) -> AsyncIterator[CardModel | dict]:
+    """
+    Validate card JSONs one at a time in this process.
+
+    Args:
+        card_jsons: JSON representations of cards, in load order.
+        engine: How validated cards will be written to the database.
+
+    Yields:
+        Validated models, in load order. Cards that fail validation are
+        logged and skipped.
+    """
+
+    async for card_json in _aiterate(card_jsons):
+        if (validated_card := _try_validate_card(card_json, engine=engine)) is not None:
+            yield validated_card
+
+
+async def _validate_in_processes(
+    card_jsons: Iterable[dict] | AsyncIterable[dict],
+    workers: int,
+    engine: BulkLoadEngine = BulkLoadEngine.BEANIE,
+) -> AsyncIterator[CardModel | dict]:
+    """
+    Validate card JSONs in chunks across a pool of worker processes.
+
+    Chunks are submitted ahead of time so that workers stay busy, but results
+    are consumed in submission order so cards come back in load order.
+
+    Args:
+        card_jsons: JSON representations of cards, in load order.
+        workers: The number of worker processes to use.
+        engine: How validated cards will be written to the database.
+
+    Yields:
+        Validated models, in load order. Cards that fail validation are
+        logged and skipped.
+    """
+
+    loop = asyncio.get_running_loop()
+    chunks = _chunked(card_jsons, VALIDATION_CHUNK_SIZE)
+    pending: deque[tuple[list[dict], asyncio.Future]] = deque()
+    pool = ProcessPoolExecutor(max_workers=workers)
+
+    async def submit_next_chunk() -> bool:
+        if (chunk := await anext(chunks, None)) is None:
+            return False
+        pending.append((chunk, loop.run_in_executor(pool, _validate_card_chunk, chunk, engine)))
+        return True
+
+    try:
+        # Keep twice as many chunks in flight as there are workers so none of them sit idle
+        while len(pending) < 2 * workers and await submit_next_chunk():
+            pass
+
+        while pending:
+            chunk, future = pending.popleft()
+            results = await future
+            await submit_next_chunk()
+            for card_json, result in zip(chunk, results):
+                if isinstance(result, ValidationError):
+                    _log_validation_error(card_json, result)
+                elif isinstance(result, dict):
+                    yield result
+                else:
+                    yield CardModel.from_data(result)
+    finally:
+        for _, future in pending:
+            future.cancel()
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+async def _aiterate(items: Iterable[dict] | AsyncIterable[dict]) -> AsyncIterator[dict]:
+    """
+    Iterate over items from either a sync or an async source.
+
+    Args:
+        items: The items to iterate over.
+
+    Yields:
+        Each item, in order.
+    """
+
+    if isinstance(items, AsyncIterable):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
+
+
+async def _chunked(items: Iterable[dict] | AsyncIterable[dict], size: int) -> AsyncIterator[list[dict]]:
+    """
+    Group items from either a sync or an async source into lists.
+
+    Args:
+        items: The items to group.
+        size: The maximum number of items per list.
+
+    Yields:
+        Lists of up to `size` items, in order.
+    """
+
+    if not isinstance(items, AsyncIterable):
+        iterator = iter(items)
+        for chunk in iter(lambda: list(islice(iterator, size)), []):
+            yield chunk
+        return
+
+    chunk: list[dict] = []
+    async for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _validate_card_chunk(
+    card_jsons: list[dict],
+    engine: BulkLoadEngine,
+) -> list[CardModelData | dict | ValidationError]:
+    """
+    Validate a chunk of card JSONs. Runs in a worker process, so validation
+    errors are returned rather than logged to be reported by the caller.
+
+    Args:
+        card_jsons: JSON representations of cards.
+        engine: How validated cards will be written to the database.
+
+    Returns:
+        A validated model (or raw document) or the validation error for each
+        card, in order.
+    """
+
+    results: list[CardModelData | dict | ValidationError] = []
+    for card_json in card_jsons:
+        try:
+            card = CardModelData.model_validate(card_json)
+            results.append(_to_raw_document(card) if engine == BulkLoadEngine.RAW else card)
+        except ValidationError as e:
+            results.append(e)
+    return results
+
+
+def _content_hash(doc: dict) -> str:
+    """
+    Hash a raw card document, so that changes to a card can be detected
+    without comparing whole documents.
+
+    Args:
+        doc: A raw card document, without its content hash.
+
+    Returns:
+        A hex digest of the document's content.
+    """
+
+    content = {k: v for k, v in doc.items() if k not in ("_id", CONTENT_HASH_FIELD)}
+    return hashlib.sha1(json.dumps(content, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def _to_raw_document(card: CardModelData) -> dict:
+    """
+    Convert a validated card to the document stored in the cards collection.
+
+    Args:
+        card: A validated card.
+
+    Returns:
+        A camelCased dict, matching what Beanie would store for this card.
+    """
+
+    return card.model_dump(by_alias=True)
+
+
+def _log_validation_error(card_json: dict, e: ValidationError) -> None:
+    """
+    Report a card that could not be loaded due to a validation error.
+
+    Args:
+        card_json: JSON representation of the card that failed validation.
+        e: The error raised during validation.
+    """
+
+    cli_logger.exception(
+        f"{card_json['name']} not loaded due to validation error.", exc_info=e, extra={"card": card_json}
+    )
+
+
+def _try_validate_card(card_json: dict, engine: BulkLoadEngine = BulkLoadEngine.BEANIE) -> CardModel | dict | None:
     """
     Attempt to convert a single card's JSON to a model for DB import, and
     report validation errors that arise in conversion.
 
     Args:
         card_json: JSON representation of a single card object.
+        engine: How the validated card will be written to the database.
 
     Returns:
-        A validated model, or None if validation failed.
+        A validated model (or raw document), or None if validation failed.
     """
 
     try:
-        card = CardModelData.model_validate(card_json)
-        return CardModel.model_validate(card.model_dump())
+        match engine:
+            case BulkLoadEngine.RAW:
+                return _to_raw_document(CardModelData.model_validate(card_json))
+            case _:
+                return CardModel.from_data(card_json)
 
     except ValidationError as e:
-        cli_logger.exception(
-            f"{card_json['name']} not loaded due to validation error.", exc_info=e, extra={"card": card_json}
-        )
+        _log_validation_error(card_json, e)
 
         return
+
+
+def _try_validate_card_data(card_json: dict) -> CardModelData | None:
+    """
+    Attempt to validate a single card's JSON, and report validation errors
+    that arise.
+
+    Args:
+        card_json: JSON representation of a single card object.
+
+    Returns:
+        The validated card data, or None if validation failed.
+    """
+
+    try:
+        return CardModelData.model_validate(card_json)
+    except ValidationError as e:
+        _log_validation_error(card_json, e)
@@ -0,0 +1,135 @@
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any, NamedTuple
+
+# Returned by QueryCache.get when there is no usable entry for a key.
+MISSING = object()
+
+
+class CacheStats(NamedTuple):
+    """
+    Counters describing how a QueryCache has been used.
+
+    Attributes:
+        hits: The number of lookups answered from the cache.
+        misses: The number of lookups that had to go to the database.
+        evictions: The number of entries removed to make room for new ones or
+            because they outlived the cache's TTL.
+        size: The number of entries currently in the cache.
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+
+
+class QueryCache:
+    """
+    A least-recently-used cache of query results, bounded in both size and
+    age.
+
+    Attributes:
+        maxsize: The most entries to keep. A size of 0 disables the cache.
+        ttl: How long, in seconds, an entry stays valid. If None, entries
+            never expire.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float | None = 300):
+        if maxsize < 0:
+            raise ValueError("maxsize must not be negative.")
+
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def stats(self) -> CacheStats:
+        return CacheStats(hits=self._hits, misses=self._misses, evictions=self._evictions, size=len(self._entries))
+
+    def get(self, key: Hashable) -> Any:
+        """
+        Look up a cached result.
+
+        Args:
+            key: The key the result was stored under.
+
+        Returns:
+            The cached result, or MISSING if there is no unexpired entry for
+                the key.
+        """
+
+        entry = self._entries.get(key)
+        if entry is None:
+            self._misses += 1
+            return MISSING
+
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            self._evictions += 1
+            self._misses += 1
+            return MISSING
+
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Store a result, evicting the least recently used entries if the cache
+        is full.
+
+        Args:
+            key: The key to store the result under.
+            value: The result to store.
+        """
+
+        if self.maxsize == 0:
+            return
+
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else float("inf")
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def clear(self) -> None:
+        """
+        Remove every entry from the cache. Counters are kept.
+        """
+
+        self._entries.clear()
+
+
+def make_key(*parts: Any) -> Hashable:
+    """
+    Build a hashable cache key, converting lists, sets, and dicts among the
+    given parts into hashable equivalents.
+
+    Raises:
+        TypeError: If any part cannot be made hashable.
+    """
+
+    return tuple(_to_hashable(part) for part in parts)
+
+
+def _to_hashable(value: Any) -> Hashable:
+    match value:
+        case list() | tuple():
+            return (type(value).__name__, tuple(_to_hashable(item) for item in value))
+        case set() | frozenset():
+            return ("set", frozenset(_to_hashable(item) for item in value))
+        case dict():
+            return ("dict", frozenset((_to_hashable(k), _to_hashable(v)) for k, v in value.items()))
+        case _:
+            hash(value)
+            return value
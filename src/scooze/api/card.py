@@ -1,10 +1,10 @@
-from typing import Any
+from typing import Any, AsyncIterator
 
 from beanie import PydanticObjectId
 from scooze.card import Card
 from scooze.errors import BulkAddError
 from scooze.logger import logger
-from scooze.models.card import CardModel, CardModelData
+from scooze.models.card import CardModel
 from scooze.utils import to_lower_camel
 
 
@@ -18,6 +18,10 @@ def _normalize_for_ids(property_name: str, value, is_many: bool = False) -> tupl
             return to_lower_camel(property_name), value
 
 
+def _field_projection(fields: list[str]) -> dict[str, int]:
+    return {_normalize_for_ids(field, None)[0]: 1 for field in fields}
+
+
 async def get_card_by(property_name: str, value: Any) -> Card:
     """
     Search the database for the first card that matches the given criteria.
@@ -43,6 +47,7 @@ async def get_cards_by(
     paginated: bool = False,
     page: int = 1,
     page_size: int = 10,
+    fields: list[str] | None = None,
 ) -> list[Card]:
     """
     Search the database for cards matching the given criteria, with options for
@@ -54,16 +59,26 @@ async def get_cards_by(
         paginated: Whether to paginate the results.
         page: The page to look at, if paginated.
         page_size: The size of each page, if paginated.
+        fields: The properties to fetch for each card. If given, all other
+            properties are left at their defaults. If None, the whole card is
+            fetched.
 
     Returns:
         A list of cards matching the search criteria, or empty list if none
         were found.
     """
 
-    prop_name, vals = _normalize_for_ids(property_name, values)
+    prop_name, vals = _normalize_for_ids(property_name, values, is_many=True)
+    query = {prop_name: {"$in": vals}}
     skip = (page - 1) * page_size if paginated else 0
     limit = page_size if paginated else None
-    card_models = await CardModel.find({"$or": [{prop_name: v} for v in vals]}, skip=skip, limit=limit).to_list()
+
+    if fields is None:
+        card_models = await CardModel.find(query, skip=skip, limit=limit).to_list()
+    else:
+        # NOTE: only the projected fields are fetched and validated; the rest take their defaults
+        cursor = CardModel.get_motor_collection().find(query, _field_projection(fields), skip=skip, limit=limit or 0)
+        card_models = [CardModel.model_validate(doc) async for doc in cursor]
 
     return [Card.from_model(m) for m in card_models]
 
@@ -81,6 +96,62 @@ async def get_cards_all() -> list[Card]:
     return [Card.from_model(m) for m in card_models]
 
 
+async def iter_cards_by(
+    property_name: str,
+    values: list[Any],
+    batch_size: int = 1000,
+    fields: list[str] | None = None,
+) -> AsyncIterator[Card]:
+    """
+    Stream cards matching the given criteria from the database, without
+    holding more than one batch of them in memory at a time.
+
+    Args:
+        property_name: The property to check.
+        values: A list of values to match on.
+        batch_size: The number of cards to fetch from the database at a time.
+        fields: The properties to fetch for each card. If given, all other
+            properties are left at their defaults. If None, the whole card is
+            fetched.
+
+    Yields:
+        Each card matching the search criteria.
+    """
+
+    prop_name, vals = _normalize_for_ids(property_name, values, is_many=True)
+    async for card in _iter_cards({prop_name: {"$in": vals}}, batch_size=batch_size, fields=fields):
+        yield card
+
+
+async def iter_cards_all(batch_size: int = 1000, fields: list[str] | None = None) -> AsyncIterator[Card]:
+    """
+    Stream all cards from the database, without holding more than one batch
+    of them in memory at a time.
+
+    Args:
+        batch_size: The number of cards to fetch from the database at a time.
+        fields: The properties to fetch for each card. If given, all other
+            properties are left at their defaults. If None, the whole card is
+            fetched.
+
+    Yields:
+        Each card in the database.
+    """
+
+    async for card in _iter_cards({}, batch_size=batch_size, fields=fields):
+        yield card
+
+
+async def _iter_cards(query: dict, batch_size: int, fields: list[str] | None) -> AsyncIterator[Card]:
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1.")
+
+    projection = _field_projection(fields) if fields is not None else None
+    cursor = CardModel.get_motor_collection().find(query, projection, batch_size=batch_size)
+    async for doc in cursor:
+        yield Card.from_model(CardModel.model_validate(doc))
+
+
 async def add_card(card: Card) -> PydanticObjectId:
     """
     Add a card to the database.
@@ -95,8 +166,7 @@ async def add_card(card: Card) -> PydanticObjectId:
     """
 
     try:
-        card_data = CardModelData.model_validate(card.__dict__)
-        card_model = CardModel.model_validate(card_data.model_dump())
+        card_model = CardModel.from_data(card.__dict__)
         await card_model.create()
         card.scooze_id = card_model.id
         return card_model.id
@@ -124,8 +194,7 @@ async def add_cards(cards: list[Card]) -> list[PydanticObjectId]:
         return []
 
     try:
-        card_models = [CardModelData.model_validate(card.__dict__) for card in cards]
-        cards_to_insert = [CardModel.model_validate(card_model.model_dump()) for card_model in card_models]
+        cards_to_insert = [CardModel.from_data(card.__dict__) for card in cards]
         insert_result = await CardModel.insert_many(cards_to_insert)
         card_ids = insert_result.inserted_ids
 
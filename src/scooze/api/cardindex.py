@@ -0,0 +1,424 @@
+from collections import defaultdict
+from collections.abc import Collection, Iterable, Iterator, Mapping
+from contextlib import AbstractContextManager
+from itertools import islice
+from pathlib import Path
+from typing import Any
+
+import ijson
+from beanie import PydanticObjectId
+from pydantic.alias_generators import to_snake
+from scooze.bulkdata import find_bulk_data_file, open_bulk_data_file
+from scooze.card import Card
+from scooze.catalogs import ScryfallBulkFile
+from scooze.config import CONFIG
+
+# Card attributes looked up through a hash index rather than a scan.
+INDEXED_ATTRIBUTES = ("scooze_id", "name", "scryfall_id", "oracle_id", "set_code")
+
+
+def _path_for(property_name: str) -> tuple[str, ...]:
+    match property_name:
+        case "_id" | "id":
+            return ("scooze_id",)
+        case "set":
+            return ("set_code",)
+        case _:
+            # Like a Mongo query, a dotted property name is a path into a card's nested properties
+            return tuple(property_name.split("."))
+
+
+def _resolve(value: Any, path: tuple[str, ...]) -> Any:
+    for i, part in enumerate(path):
+        match value:
+            case None:
+                return None
+            case Mapping():
+                value = value.get(part)
+            case tuple() | list():
+                # A path through a list of card parts resolves to the values of all of them
+                return [item_value for item in value if (item_value := _resolve(item, path[i:])) is not None]
+            case _:
+                value = getattr(value, to_snake(part), None)
+    return value
+
+
+def _normalize_value(path: tuple[str, ...], value: Any) -> Any:
+    if path == ("scooze_id",) and isinstance(value, str) and PydanticObjectId.is_valid(value):
+        return PydanticObjectId(value)
+    return value
+
+
+def _matches(card_value: Any, value: Any) -> bool:
+    if card_value == value:
+        return True
+    # Like a Mongo query, a value matches a multi-valued property if it is one of its elements,
+    # or if it lists the same elements.
+    if isinstance(card_value, Collection) and not isinstance(card_value, (str, Mapping)):
+        if isinstance(value, Collection) and not isinstance(value, (str, Mapping)):
+            return list(card_value) == list(value) or set(card_value) == set(value)
+        return value in card_value
+    return False
+
+
+class CardIndex(AbstractContextManager):
+    """
+    An in-memory collection of cards, with the same card methods as
+    ScoozeApi. Lookups by ID, name, and set are answered from hash indexes
+    without touching the database. To use it through ScoozeApi, see
+    `MemoryBackend`.
+
+    Cards are loaded from the given `cards` if there are any, otherwise from
+    the bulk file of the given `bulk_file_type` if there is one, and otherwise
+    from the database. Loading happens when the index is entered as a
+    context manager, or on an explicit call to `load()`.
+
+    Example:
+        ``` python
+        with CardIndex(bulk_file_type=ScryfallBulkFile.ORACLE) as s:
+            woe_cards = s.get_cards_by_set("woe")
+            black_lotus = s.get_card_by_name("Black Lotus")
+            print(black_lotus.total_words())
+        ```
+    """
+
+    def __init__(
+        self,
+        cards: Iterable[Card] | None = None,
+        bulk_file_type: ScryfallBulkFile | None = None,
+        bulk_file_dir: Path = CONFIG.bulk_file_dir,
+    ):
+        self.bulk_file_type = bulk_file_type
+        self.bulk_file_dir = bulk_file_dir
+        self._cards: list[Card] | None = None
+        # Positions in _cards of the cards with each value of each indexed attribute
+        self._indexes: dict[str, dict[Any, list[int]]] = {}
+        if cards is not None:
+            self._index(cards)
+
+    def __enter__(self):
+        if self._cards is None:
+            self.load()
+
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+    def __len__(self) -> int:
+        return len(self._loaded_cards)
+
+    # region Loading
+
+    def load(self) -> None:
+        """
+        Load cards from this index's bulk file, or from the database if it has
+        none, replacing any cards already loaded.
+
+        Raises:
+            FileNotFoundError: If the bulk file does not exist.
+        """
+
+        if self.bulk_file_type is not None:
+            self._index(self._read_bulk_file())
+        else:
+            self._index(self._read_database())
+
+    def _read_bulk_file(self) -> Iterator[Card]:
+        with open_bulk_data_file(find_bulk_data_file(self.bulk_file_type, self.bulk_file_dir)) as cards_file:
+            for card_json in ijson.items(cards_file, "item", use_float=True):
+                yield Card.from_json(card_json)
+
+    def _read_database(self) -> Iterator[Card]:
+        # Imported here since scooze.api imports this module
+        from scooze.api import ScoozeApi
+
+        with ScoozeApi(cache_size=0) as s:
+            yield from s.iter_cards_all()
+
+    def _index(self, cards: Iterable[Card]) -> None:
+        self._cards = []
+        self._indexes = {attribute: defaultdict(list) for attribute in INDEXED_ATTRIBUTES}
+        self._append(cards)
+
+    def _append(self, cards: Iterable[Card]) -> None:
+        for card in cards:
+            position = len(self._cards)
+            self._cards.append(card)
+            for attribute, index in self._indexes.items():
+                if (value := getattr(card, attribute)) is not None:
+                    index[value].append(position)
+
+    def _check_loaded(self) -> None:
+        if self._cards is None:
+            raise RuntimeError("CardIndex used before its cards were loaded")
+
+    @property
+    def _loaded_cards(self) -> list[Card]:
+        self._check_loaded()
+        return self._cards
+
+    # endregion
+
+    # region Card lookups
+
+    def get_card_by(self, property_name: str, value: Any) -> Card | None:
+        """
+        Search the index for the first card that matches the given criteria.
+
+        Args:
+            property_name: The property to check.
+            value: The value to match on.
+
+        Returns:
+            The first matching card, or None if none were found.
+
+        Raises:
+            RuntimeError: If the index's cards have not been loaded.
+        """
+
+        return next(self.iter_cards_by(property_name=property_name, values=[value]), None)
+
+    def get_cards_by(
+        self,
+        property_name: str,
+        values: list[Any],
+        paginated: bool = False,
+        page: int = 1,
+        page_size: int = 10,
+        fields: list[str] | None = None,
+    ) -> list[Card]:
+        """
+        Search the index for cards matching the given criteria, with options
+        for pagination.
+
+        Args:
+            property_name: The property to check.
+            values: A list of values to match on.
+            paginated: Whether to paginate the results.
+            page: The page to look at, if paginated.
+            page_size: The size of each page, if paginated.
+            fields: Accepted for compatibility with ScoozeApi. Cards are
+                already in memory, so whole cards are always returned.
+
+        Returns:
+            A list of cards matching the search criteria, or empty list if none
+                were found.
+
+        Raises:
+            RuntimeError: If the index's cards have not been loaded.
+        """
+
+        cards = self.iter_cards_by(property_name=property_name, values=values)
+        if paginated:
+            start = (page - 1) * page_size
+            return list(islice(cards, start, start + page_size))
+        return list(cards)
+
+    def get_card_by_name(self, name: str) -> Card | None:
+        """
+        Search the index for a card with the given name.
+
+        Args:
+            name: The card name to search for.
+
+        Returns:
+            A card with the given name if found, or None if none were found.
+
+        Raises:
+            RuntimeError: If the index's cards have not been loaded.
+        """
+
+        return self.get_card_by(property_name="name", value=name)
+
+    def get_card_by_oracle_id(self, oracle_id: str) -> Card | None:
+        """
+        Search the index for a card with the given Oracle ID.
+
+        Args:
+            oracle_id: The card [Oracle ID](https://scryfall.com/docs/api/cards) to search for.
+
+        Returns:
+            A card with the given Oracle ID if found, or None if none were found.
+
+        Raises:
+            RuntimeError: If the index's cards have not been loaded.
+        """
+
+        return self.get_card_by(property_name="oracle_id", value=oracle_id)
+
+    def get_card_by_scryfall_id(self, scryfall_id: str) -> Card | None:
+        """
+        Search the index for a card with the given Scryfall ID.
+
+        Args:
+            scryfall_id: The card [Scryfall ID](https://scryfall.com/docs/api/cards) to search for.
+
+        Returns:
+            A card with the given Scryfall ID if found, or None if none were found.
+
+        Raises:
+            RuntimeError: If the index's cards have not been loaded.
+        """
+
+        return self.get_card_by(property_name="scryfall_id", value=scryfall_id)
+
+    def get_cards_by_set(self, set_code: str) -> list[Card]:
+        """
+        Search the index for all cards in the given set.
+
+        Args:
+            set_code: The set code to search for.
+
+        Returns:
+            A list of cards from the given set, or empty list if none were found.
+
+        Raises:
+            RuntimeError: If the index's cards have not been loaded.
+        """
+
+        return self.get_cards_by(property_name="set", values=[set_code])
+
+    def get_cards_all(self) -> list[Card]:
+        """
+        Get all cards in the index.
+
+        Returns:
+            A list of all cards in the index.
+
+        Raises:
+            RuntimeError: If the index's cards have not been loaded.
+        """
+
+        return list(self._loaded_cards)
+
+    def iter_cards_by(
+        self,
+        property_name: str,
+        values: list[Any],
+        batch_size: int = 1000,
+        fields: list[str] | None = None,
+    ) -> Iterator[Card]:
+        """
+        Iterate over the cards in the index matching the given criteria.
+
+        Args:
+            property_name: The property to check.
+            values: A list of values to match on.
+            batch_size: Accepted for compatibility with ScoozeApi.
+            fields: Accepted for compatibility with ScoozeApi.
+
+        Returns:
+            An iterator over the cards matching the search criteria.
+
+        Raises:
+            RuntimeError: If the index's cards have not been loaded.
+        """
+
+        path = _path_for(property_name)
+        cards = self._loaded_cards
+        values = [_normalize_value(path, value) for value in values]
+
+        if len(path) == 1 and (index := self._indexes.get(to_snake(path[0]))) is not None:
+            # Return cards in the order they were loaded, like a database scan would
+            positions = sorted({position for value in values for position in index.get(value, ())})
+            return (cards[position] for position in positions)
+
+        return (card for card in cards if any(_matches(_resolve(card, path), value) for value in values))
+
+    def iter_cards_all(self, batch_size: int = 1000, fields: list[str] | None = None) -> Iterator[Card]:
+        """
+        Iterate over all cards in the index.
+
+        Args:
+            batch_size: Accepted for compatibility with ScoozeApi.
+            fields: Accepted for compatibility with ScoozeApi.
+
+        Returns:
+            An iterator over all cards in the index.
+
+        Raises:
+            RuntimeError: If the index's cards have not been loaded.
+        """
+
+        return iter(self._loaded_cards)
+
+    # endregion
+
+    # region Card writes
+
+    def add_card(self, card: Card) -> PydanticObjectId:
+        """
+        Add a card to the index, and assign it a new ID.
+
+        Args:
+            card: The card to add.
+
+        Returns:
+            The ID of the added card.
+
+        Raises:
+            RuntimeError: If the index's cards have not been loaded.
+        """
+
+        return self.add_cards([card])[0]
+
+    def add_cards(self, cards: list[Card]) -> list[PydanticObjectId]:
+        """
+        Add a list of cards to the index, and assign each a new ID.
+
+        Args:
+            cards: The list of cards to add.
+
+        Returns:
+            The IDs of the added cards, or empty list if no cards provided.
+
+        Raises:
+            RuntimeError: If the index's cards have not been loaded.
+        """
+
+        self._check_loaded()
+        for card in cards:
+            card.scooze_id = PydanticObjectId()
+        self._append(cards)
+        return [card.scooze_id for card in cards]
+
+    def delete_card(self, id: str) -> bool:
+        """
+        Delete a card from the index.
+
+        Args:
+            id: The ID of the card to delete.
+
+        Returns:
+            True if the card is deleted, False otherwise.
+
+        Raises:
+            RuntimeError: If the index's cards have not been loaded.
+        """
+
+        self._check_loaded()
+        positions = self._indexes["scooze_id"].get(_normalize_value(("scooze_id",), id))
+        if not positions:
+            return False
+
+        # NOTE: deleting a card moves the cards after it, so the indexes are rebuilt
+        self._index(card for position, card in enumerate(self._cards) if position not in positions)
+        return True
+
+    def delete_cards_all(self) -> int:
+        """
+        Delete all cards in the index.
+
+        Returns:
+            The number of cards deleted.
+
+        Raises:
+            RuntimeError: If the index's cards have not been loaded.
+        """
+
+        total = len(self._loaded_cards)
+        self._index([])
+        return total
+
+    # endregion
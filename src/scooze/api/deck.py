@@ -1,7 +1,85 @@
+from collections import Counter
+
+from beanie import PydanticObjectId
 from scooze.card import Card
+from scooze.cardlist import CardList
 from scooze.deck import Deck
+from scooze.logger import logger
+from scooze.models.card import CardModel
+from scooze.models.deck import DeckModel
+
+
+async def get_deck(id: str | PydanticObjectId) -> Deck | None:
+    """
+    Get a deck from the database, along with all of its cards.
+
+    Args:
+        id: The ID of the deck to get.
+
+    Returns:
+        The deck, or None if it was not found.
+    """
+
+    decks = await get_decks([id])
+
+    return decks[0] if decks else None
+
+
+async def get_decks(ids: list[str | PydanticObjectId]) -> list[Deck]:
+    """
+    Get decks from the database, along with all of their cards.
+
+    The cards of every deck are fetched together in a single query, and a
+    card that appears in several decks is shared between them as the same
+    `Card` instance.
+
+    Args:
+        ids: The IDs of the decks to get.
+
+    Returns:
+        The decks that were found, in the order they were requested.
+    """
+
+    deck_ids = [PydanticObjectId(id) for id in ids]
+    deck_models = {model.id: model for model in await DeckModel.find({"_id": {"$in": deck_ids}}).to_list()}
+
+    return await decks_from_models([deck_models[id] for id in deck_ids if id in deck_models])
+
+
+async def decks_from_models(deck_models: list[DeckModel]) -> list[Deck]:
+    """
+    Build decks from deck models, fetching the cards of all of them with one
+    deduplicated query.
+
+    Args:
+        deck_models: The deck models to build decks from.
+
+    Returns:
+        A deck for each deck model, in the same order.
+    """
+
+    card_ids = {card_id for model in deck_models for board in (model.main, model.side, model.cmdr) for card_id in board}
+    cards: dict[PydanticObjectId, Card] = {}
+    if card_ids:
+        async for card_model in CardModel.find({"_id": {"$in": list(card_ids)}}):
+            cards[card_model.id] = Card.from_model(card_model)
+
+    if missing_ids := card_ids - cards.keys():
+        logger.warning(f"{len(missing_ids)} cards in the requested decks were not found.", extra={"ids": missing_ids})
+
+    def to_cardlist(board: Counter) -> CardList:
+        return CardList(cards=Counter({cards[id]: count for id, count in board.items() if id in cards}))
 
-# TODO(#145): need to support creating Deck from model
+    return [
+        Deck(
+            archetype=model.archetype,
+            format=model.format,
+            main=to_cardlist(model.main),
+            side=to_cardlist(model.side),
+            cmdr=to_cardlist(model.cmdr),
+        )
+        for model in deck_models
+    ]
 
 
 def get_deck_by(property_name: str, value) -> Deck:
@@ -0,0 +1,106 @@
+from typing import NamedTuple
+
+from pymongo import IndexModel
+from scooze.config import CONFIG
+from scooze.enums import DbCollection
+from scooze.models.card import CardModel
+from scooze.models.deck import DeckModel
+from scooze.mongo import db
+
+# Indexes declared on the document model stored in each collection.
+DECLARED_INDEXES: dict[DbCollection, list[IndexModel]] = {
+    DbCollection.CARDS: CardModel.Settings.indexes,
+    DbCollection.DECKS: DeckModel.Settings.indexes,
+}
+
+
+class IndexStatus(NamedTuple):
+    """
+    The state of a single index on a collection.
+
+    Attributes:
+        name: The name of the index.
+        keys: The fields covered by the index, with their sort directions.
+        declared: Whether the index is declared on the collection's model.
+        built: Whether the index exists in the database.
+    """
+
+    name: str
+    keys: list[tuple[str, int]]
+    declared: bool
+    built: bool
+
+
+async def build_indexes(collection: DbCollection) -> list[str]:
+    """
+    Build the indexes declared for a collection. Indexes that already exist
+    are left as they are.
+
+    Args:
+        collection: The collection to build indexes on.
+
+    Returns:
+        The names of the declared indexes.
+    """
+
+    if not (index_models := DECLARED_INDEXES[collection]):
+        return []
+    return await db.client[CONFIG.mongo_db][collection].create_indexes(index_models)
+
+
+async def drop_indexes(collection: DbCollection) -> list[str]:
+    """
+    Drop the indexes declared for a collection, leaving any others in place.
+
+    Args:
+        collection: The collection to drop indexes from.
+
+    Returns:
+        The names of the indexes that were dropped.
+    """
+
+    mongo_collection = db.client[CONFIG.mongo_db][collection]
+    built_names = (await mongo_collection.index_information()).keys()
+    dropped = [
+        index_model.document["name"]
+        for index_model in DECLARED_INDEXES[collection]
+        if index_model.document["name"] in built_names
+    ]
+    for name in dropped:
+        await mongo_collection.drop_index(name)
+    return dropped
+
+
+async def get_index_status(collection: DbCollection) -> list[IndexStatus]:
+    """
+    Compare the indexes declared for a collection with those in the database.
+
+    Args:
+        collection: The collection to check.
+
+    Returns:
+        The status of every declared or built index, other than the default
+        index on `_id`.
+    """
+
+    built = {
+        name: list(info["key"])
+        for name, info in (await db.client[CONFIG.mongo_db][collection].index_information()).items()
+        if name != "_id_"
+    }
+    statuses = [
+        IndexStatus(
+            name=index_model.document["name"],
+            keys=list(index_model.document["key"].items()),
+            declared=True,
+            built=index_model.document["name"] in built,
+        )
+        for index_model in DECLARED_INDEXES[collection]
+    ]
+    declared_names = {status.name for status in statuses}
+    statuses.extend(
+        IndexStatus(name=name, keys=keys, declared=False, built=True)
+        for name, keys in built.items()
+        if name not in declared_names
+    )
+    return statuses
@@ -1,4 +1,12 @@
-from functools import cache
+import asyncio
+import inspect
+from functools import wraps
+from typing import AsyncIterator, Iterator, TypeVar
+
+from scooze.api.backends import MongoBackend
+from scooze.api.cache import MISSING, make_key
+
+T = TypeVar("T")
 
 
 def _check_for_safe_context(function):
@@ -15,18 +23,109 @@ def _check_for_safe_context(function):
     return wrapper_safe_context
 
 
-@cache
-def _safe_cache(function):
+def _check_for_mongo_backend(function):
     """
-    Wrapper for cache to ensure incoming arguments are hashable.
+    Wrapper to ensure an instance method of ScoozeApi that only MongoDB
+    supports is called with the Mongo backend.
+    """
+
+    @wraps(function)
+    def wrapper_mongo_backend(self, *args, **kwargs):
+        if not isinstance(self.backend, MongoBackend):
+            raise NotImplementedError(f"{function.__name__} is only supported by the Mongo backend")
+        return function(self, *args, **kwargs)
+
+    return wrapper_mongo_backend
+
+
+def _iterate_sync(async_iterator: AsyncIterator[T]) -> Iterator[T]:
     """
+    Iterate over an async iterator from synchronous code, running the event
+    loop for one item at a time.
+    """
+
+    loop = asyncio.get_event_loop()
+    try:
+        while True:
+            try:
+                yield loop.run_until_complete(anext(async_iterator))
+            except StopAsyncIteration:
+                return
+    finally:
+        if hasattr(async_iterator, "aclose"):
+            loop.run_until_complete(async_iterator.aclose())
+
+
+def _cached_query(function):
+    """
+    Wrapper to cache the results of a ScoozeApi or AsyncScoozeApi lookup in
+    the instance's query cache. Coroutines are awaited before their results
+    are stored. List results are copied on the way in and out, so callers
+    can't modify the cached entry.
+    """
+
+    signature = inspect.signature(function)
+
+    def _key(self, args, kwargs):
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        try:
+            return make_key(function.__name__, *list(bound.arguments.values())[1:])
+        except TypeError:
+            # Arguments that can't be made hashable skip the cache.
+            return None
+
+    def _copy(result):
+        return list(result) if isinstance(result, list) else result
+
+    if inspect.iscoroutinefunction(function):
+
+        @wraps(function)
+        async def async_wrapper_cached_query(self, *args, **kwargs):
+            if (key := _key(self, args, kwargs)) is None:
+                return await function(self, *args, **kwargs)
+            if (result := self.cache.get(key)) is MISSING:
+                result = await function(self, *args, **kwargs)
+                self.cache.set(key, _copy(result))
+            return _copy(result)
+
+        return async_wrapper_cached_query
+
+    @wraps(function)
+    def wrapper_cached_query(self, *args, **kwargs):
+        if (key := _key(self, args, kwargs)) is None:
+            return function(self, *args, **kwargs)
+        if (result := self.cache.get(key)) is MISSING:
+            result = function(self, *args, **kwargs)
+            self.cache.set(key, _copy(result))
+        return _copy(result)
+
+    return wrapper_cached_query
+
+
+def _invalidates_cache(function):
+    """
+    Wrapper to clear the instance's query cache whenever a ScoozeApi or
+    AsyncScoozeApi method writes to the database, whether or not the write
+    succeeds.
+    """
+
+    if inspect.iscoroutinefunction(function):
+
+        @wraps(function)
+        async def async_wrapper_invalidates_cache(self, *args, **kwargs):
+            try:
+                return await function(self, *args, **kwargs)
+            finally:
+                self.cache.clear()
+
+        return async_wrapper_invalidates_cache
 
-    def _convert_list_args_to_tuple(*args, **kwargs):
-        # TODO(#207): additional behavior to convert non-hashable arguments to hashable to allow cache
-        args = [tuple(x) if type(x) == list else x for x in args]
-        kwargs = {k: tuple(x) if type(x) == list else x for k, x in kwargs.items()}
-        result = function(*args, **kwargs)
-        result = tuple(result) if type(result) == list else result
-        return result
+    @wraps(function)
+    def wrapper_invalidates_cache(self, *args, **kwargs):
+        try:
+            return function(self, *args, **kwargs)
+        finally:
+            self.cache.clear()
 
-    return function
+    return wrapper_invalidates_cache
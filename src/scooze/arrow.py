@@ -0,0 +1,353 @@
+import json
+from collections.abc import Iterable, Iterator
+from datetime import date, datetime
+from enum import Enum
+from functools import cache
+from pathlib import Path
+from typing import Any
+
+from scooze.card import Card
+from scooze.catalogs import Format, Legality
+from scooze.enums import CardTableFormat
+from scooze.models.card import CardModelData
+from scooze.models.cardparts import PricesModel
+from scooze.models.utils import (
+    DATE_FORMAT,
+    collection_item,
+    field_base_type,
+    unwrap_optional,
+)
+
+# Columns holding each card's legality in one format are named LEGALITY_PREFIX + the format.
+LEGALITY_PREFIX = "legality_"
+# Columns holding each card's price in one currency are named PRICE_PREFIX + the price.
+PRICE_PREFIX = "price_"
+
+
+def _import_pyarrow():
+    """
+    Import the optional `pyarrow` package.
+
+    Returns:
+        The `pyarrow` module.
+
+    Raises:
+        ImportError: If `pyarrow` is not installed.
+    """
+
+    try:
+        import pyarrow
+    except ImportError as e:
+        raise ImportError(
+            "Arrow and Parquet card tables require the pyarrow package: `pip install scooze[arrow]`"
+        ) from e
+    return pyarrow
+
+
+def _arrow_type(annotation: Any):
+    """
+    Find the Arrow type for a card field, or None if the field is stored as
+    JSON text.
+    """
+
+    pa = _import_pyarrow()
+    annotation = unwrap_optional(annotation)
+
+    if (item_annotation := collection_item(annotation)) is not None:
+        item_type = _arrow_type(item_annotation)
+        if item_type is None:
+            return None
+        # NOTE: Parquet can't read dictionary-encoded values back out of a list, so list items are left unencoded
+        return pa.list_(pa.string() if pa.types.is_dictionary(item_type) else item_type)
+    base_type = field_base_type(annotation)
+    if base_type is Enum:
+        return pa.dictionary(pa.int16(), pa.string())
+    if base_type is bool:
+        return pa.bool_()
+    if base_type is int:
+        return pa.int64()
+    if base_type is float:
+        return pa.float64()
+    if base_type is str:
+        return pa.string()
+    if base_type is date:
+        return pa.date32()
+    return None
+
+
+@cache
+def _field_types() -> dict[str, Any]:
+    # NOTE: legalities and prices are split into a column per format and per price
+    return {
+        name: _arrow_type(field.annotation)
+        for name, field in CardModelData.model_fields.items()
+        if name not in ("legalities", "prices")
+    }
+
+
+@cache
+def _dictionaries() -> dict[str, list[str]]:
+    # Every batch of a column shares one dictionary: all the values of its enum, in order. Arrow IPC files can't
+    # change a column's dictionary between batches.
+    dictionaries = {}
+    for name, field in CardModelData.model_fields.items():
+        annotation = unwrap_optional(field.annotation)
+        if field_base_type(annotation) is Enum:
+            dictionaries[name] = annotation.list()
+    for fmt in Format:
+        dictionaries[f"{LEGALITY_PREFIX}{fmt}"] = Legality.list()
+    return dictionaries
+
+
+@cache
+def card_schema():
+    """
+    The Arrow schema of a card table. Enum fields are dictionary-encoded,
+    `legalities` has a column per format, `prices` has a float column per
+    price, and nested fields like `card_faces` are stored as JSON text.
+
+    Returns:
+        A `pyarrow.Schema`.
+
+    Raises:
+        ImportError: If `pyarrow` is not installed.
+    """
+
+    pa = _import_pyarrow()
+    fields = [pa.field("scooze_id", pa.string())]
+    fields.extend(pa.field(name, arrow_type or pa.string()) for name, arrow_type in _field_types().items())
+    fields.extend(pa.field(f"{LEGALITY_PREFIX}{fmt}", pa.dictionary(pa.int8(), pa.string())) for fmt in Format)
+    fields.extend(pa.field(f"{PRICE_PREFIX}{price}", pa.float64()) for price in PricesModel.model_fields)
+    return pa.schema(fields)
+
+
+def _to_card_data(card: Card | CardModelData | dict) -> tuple[str | None, CardModelData]:
+    match card:
+        case CardModelData():
+            return None, card
+        case Card():
+            scooze_id = str(card.scooze_id) if card.scooze_id is not None else None
+            return scooze_id, CardModelData.model_validate(card.__dict__)
+        case _:
+            # A document from the cards collection
+            scooze_id = str(card["_id"]) if card.get("_id") is not None else None
+            return scooze_id, CardModelData.model_validate(card)
+
+
+def cards_to_record_batch(cards: Iterable[Card | CardModelData | dict]):
+    """
+    Convert cards to a record batch of a card table.
+
+    Args:
+        cards: Cards, validated card data, or documents from the cards
+            collection.
+
+    Returns:
+        A `pyarrow.RecordBatch` with the `card_schema()`.
+
+    Raises:
+        ImportError: If `pyarrow` is not installed.
+    """
+
+    pa = _import_pyarrow()
+    schema = card_schema()
+    field_types = _field_types()
+    columns: dict[str, list] = {name: [] for name in schema.names}
+
+    for card in cards:
+        scooze_id, card_data = _to_card_data(card)
+        columns["scooze_id"].append(scooze_id)
+        dumped = card_data.model_dump()
+        for name, arrow_type in field_types.items():
+            value = dumped[name]
+            if value is not None:
+                if arrow_type is None:
+                    value = json.dumps(card_data.model_dump(mode="json", include={name})[name])
+                elif name == "released_at" and isinstance(value, str):
+                    value = datetime.strptime(value, DATE_FORMAT).date()
+            columns[name].append(value)
+
+        legalities = dumped["legalities"] or {}
+        for fmt in Format:
+            columns[f"{LEGALITY_PREFIX}{fmt}"].append(legalities.get(fmt))
+        prices = dumped["prices"] or {}
+        for price in PricesModel.model_fields:
+            value = prices.get(price)
+            columns[f"{PRICE_PREFIX}{price}"].append(float(value) if value is not None else None)
+
+    arrays = []
+    for field in schema:
+        values = columns[field.name]
+        if field.name in (dictionaries := _dictionaries()):
+            dictionary = dictionaries[field.name]
+            value_ids = {value: i for i, value in enumerate(dictionary)}
+            indices = pa.array([value_ids[value] if value is not None else None for value in values], pa.int16())
+            arrays.append(
+                pa.DictionaryArray.from_arrays(indices.cast(field.type.index_type), pa.array(dictionary, pa.string()))
+            )
+        else:
+            arrays.append(pa.array(values, field.type))
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def cards_to_table(cards: Iterable[Card | CardModelData | dict], batch_size: int = 10000):
+    """
+    Convert cards to a card table.
+
+    Args:
+        cards: Cards, validated card data, or documents from the cards
+            collection.
+        batch_size: The number of cards to convert at a time.
+
+    Returns:
+        A `pyarrow.Table` with the `card_schema()`.
+
+    Raises:
+        ImportError: If `pyarrow` is not installed.
+    """
+
+    pa = _import_pyarrow()
+    return pa.Table.from_batches(_batched_record_batches(cards, batch_size), schema=card_schema())
+
+
+def _batched_record_batches(cards: Iterable[Card | CardModelData | dict], batch_size: int) -> Iterator:
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1.")
+
+    batch = []
+    for card in cards:
+        batch.append(card)
+        if len(batch) >= batch_size:
+            yield cards_to_record_batch(batch)
+            batch = []
+    if batch:
+        yield cards_to_record_batch(batch)
+
+
+def record_batch_to_card_jsons(record_batch) -> Iterator[dict]:
+    """
+    Convert a record batch of a card table back to card JSON that can be
+    validated as `CardModelData`. The `scooze_id` column is dropped, so the
+    cards are given new IDs when they are loaded.
+
+    Args:
+        record_batch: A `pyarrow.RecordBatch` or `pyarrow.Table` with the
+            `card_schema()`.
+
+    Yields:
+        Card JSON, keyed by field name, for each row.
+    """
+
+    field_types = _field_types()
+    for row in record_batch.to_pylist():
+        card_json: dict[str, Any] = {}
+        legalities: dict[str, str] = {}
+        prices: dict[str, float] = {}
+        for name, value in row.items():
+            if value is None or name == "scooze_id":
+                continue
+            if name.startswith(LEGALITY_PREFIX):
+                legalities[name.removeprefix(LEGALITY_PREFIX)] = value
+            elif name.startswith(PRICE_PREFIX):
+                prices[name.removeprefix(PRICE_PREFIX)] = value
+            elif name in field_types and field_types[name] is None:
+                card_json[name] = json.loads(value)
+            else:
+                card_json[name] = value
+        if legalities:
+            card_json["legalities"] = legalities
+        # NOTE: Scryfall gives every card a prices object, even if none of its prices are known
+        card_json["prices"] = prices
+        yield card_json
+
+
+def write_card_table_file(
+    cards: Iterable[Card | CardModelData | dict],
+    path: Path,
+    format: CardTableFormat = CardTableFormat.PARQUET,
+    batch_size: int = 10000,
+) -> int:
+    """
+    Write cards to a Parquet or Arrow IPC file, a batch at a time.
+
+    Args:
+        cards: Cards, validated card data, or documents from the cards
+            collection.
+        path: Where to write the file.
+        format: The file format to write.
+        batch_size: The number of cards to convert and write at a time.
+
+    Returns:
+        The number of cards written.
+
+    Raises:
+        ImportError: If `pyarrow` is not installed.
+    """
+
+    total = 0
+    with open_card_table_writer(path, format) as writer:
+        for record_batch in _batched_record_batches(cards, batch_size):
+            writer.write_batch(record_batch)
+            total += record_batch.num_rows
+    return total
+
+
+def open_card_table_writer(path: Path, format: CardTableFormat = CardTableFormat.PARQUET):
+    """
+    Open a writer for a Parquet or Arrow IPC card table file, to be used as a
+    context manager. Record batches from `cards_to_record_batch` are written
+    to it with `write_batch`.
+
+    Args:
+        path: Where to write the file.
+        format: The file format to write.
+
+    Returns:
+        A `pyarrow.parquet.ParquetWriter` or `pyarrow.ipc.RecordBatchFileWriter`.
+
+    Raises:
+        ImportError: If `pyarrow` is not installed.
+    """
+
+    pa = _import_pyarrow()
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+
+    match format:
+        case CardTableFormat.ARROW:
+            return pa.ipc.new_file(str(path), card_schema())
+        case _:
+            import pyarrow.parquet
+
+            return pyarrow.parquet.ParquetWriter(str(path), card_schema())
+
+
+def read_card_table_file(path: Path, batch_size: int = 10000) -> Iterator:
+    """
+    Read a Parquet or Arrow IPC card table file a batch at a time. The format
+    is detected from the file's contents.
+
+    Args:
+        path: The file to read.
+        batch_size: The number of cards per batch, for Parquet files. Arrow
+            IPC files are read in the batches they were written in.
+
+    Yields:
+        A `pyarrow.RecordBatch` for each batch of cards in the file.
+
+    Raises:
+        ImportError: If `pyarrow` is not installed.
+    """
+
+    pa = _import_pyarrow()
+    with open(path, "rb") as f:
+        is_parquet = f.read(4) == b"PAR1"
+
+    if is_parquet:
+        import pyarrow.parquet
+
+        yield from pyarrow.parquet.ParquetFile(str(path)).iter_batches(batch_size=batch_size)
+    else:
+        with pa.memory_map(str(path)) as source:
+            reader = pa.ipc.open_file(source)
+            for i in range(reader.num_record_batches):
+                yield reader.get_batch(i)
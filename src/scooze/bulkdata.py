@@ -1,46 +1,375 @@
+import asyncio
+import gzip
+import os
+import shutil
+import time
+from contextlib import asynccontextmanager, contextmanager
+from datetime import datetime
+from email.utils import formatdate, parsedate_to_datetime
+from functools import partial
 from pathlib import Path
+from typing import AsyncIterator, BinaryIO, Iterator
 from urllib.error import HTTPError  # import HTTPError for linking in docs
 
 import requests
 from scooze.catalogs import ScryfallBulkFile
 from scooze.config import CONFIG
+from scooze.enums import BulkFileCompression
+from scooze.errors import BulkDownloadError
 
 SCRYFALL_BULK_INFO_ENDPOINT = "https://api.scryfall.com/bulk-data"
 
+# Seconds to wait for a connection to Scryfall, and then between bytes of its response.
+REQUEST_TIMEOUT = (10, 60)
+
+# Size of the pieces a bulk file is written to disk in, in bytes.
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+# File extension of a bulk file stored with each compression format.
+BULK_FILE_SUFFIXES: dict[BulkFileCompression | None, str] = {
+    None: ".json",
+    BulkFileCompression.GZIP: ".json.gz",
+    BulkFileCompression.ZSTD: ".json.zst",
+}
+
+# Size of the reads made from a bulk file download when it is streamed, in bytes.
+STREAM_CHUNK_SIZE = 1 << 16
+
+GZIP_MAGIC = b"\x1f\x8b"
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
 
 def download_bulk_data_file(
     uri: str,
     bulk_file_type: ScryfallBulkFile | None = None,
-    bulk_file_dir: Path = CONFIG.bulk_file_dir,
-) -> None:
+    bulk_file_dir: Path | str = CONFIG.bulk_file_dir,
+    updated_at: datetime | None = None,
+    expected_size: int | None = None,
+    force: bool = False,
+    max_retries: int = 3,
+    compression: BulkFileCompression | None = None,
+) -> bool:
     """
     Download a single bulk data file from Scryfall.
 
+    The file is written to a `.part` file next to the target and only renamed
+    over the target once it is complete, so an interrupted download never
+    leaves a truncated bulk file behind. A `.part` file left by an earlier
+    attempt is resumed with an HTTP Range request, and dropped connections
+    are resumed the same way up to `max_retries` times.
+
+    An existing file is not downloaded again if it is at least as new as
+    `updated_at`, or, without `updated_at`, if the server reports it as not
+    modified since the file was last saved.
+
+    With `compression`, the completed download is compressed in a single
+    streaming pass and stored with the matching extension, replacing any copy
+    of the file saved in another format.
+
     Args:
         uri: Location of bulk data file (generally found from bulk info
             endpoint).
         bulk_file_type: Type of bulk file, used to set filename.
         bulk_file_dir: Directory to save bulk files. Defaults to
             `~/.scooze/data/bulk` if not specified.
+        updated_at: When the bulk file was last updated, from the bulk info
+            endpoint.
+        expected_size: Size of the bulk file in bytes, from the bulk info
+            endpoint.
+        force: Flag to download the file even if the existing one is up to
+            date.
+        max_retries: The number of times to resume a download after its
+            connection drops.
+        compression: Format to compress the file with on disk. If None, the
+            file is stored uncompressed.
+
+    Returns:
+        True if the file was downloaded, or False if the existing file was
+        already up to date.
+
+    Raises:
+        HTTPError: If request for bulk file not successful.
+        BulkDownloadError: If the downloaded file is not the expected size.
+    """
+
+    bulk_file_dir = Path(bulk_file_dir)
+    bulk_file_dir.mkdir(parents=True, exist_ok=True)
+    file = bulk_file_dir / f"{bulk_file_type}{BULK_FILE_SUFFIXES[compression]}"
+    part_file = bulk_file_dir / f"{bulk_file_type}.json.part"
+
+    headers = {}
+    if file.exists() and not force:
+        saved_at = file.stat().st_mtime
+        if updated_at is not None:
+            if saved_at >= updated_at.timestamp():
+                return False
+        else:
+            headers["If-Modified-Since"] = formatdate(saved_at, usegmt=True)
+
+    if part_file.exists() and updated_at is not None and part_file.stat().st_mtime < updated_at.timestamp():
+        # NOTE: this partial download started before the file was last updated, so it can't be resumed
+        part_file.unlink()
+
+    retries = 0
+    while True:
+        try:
+            response = _download_to_part_file(uri, part_file, headers)
+            break
+        except (requests.ConnectionError, requests.Timeout, requests.exceptions.ChunkedEncodingError):
+            if retries >= max_retries:
+                raise
+            retries += 1
+            time.sleep(min(2**retries, 30))
+
+    if response is None:
+        return False
+
+    if expected_size is not None and (size := part_file.stat().st_size) != expected_size:
+        part_file.unlink()
+        raise BulkDownloadError(f"Downloaded {bulk_file_type} is {size} bytes, but {expected_size} were expected.")
+
+    if compression is not None:
+        compressed_part_file = file.with_name(f"{file.name}.part")
+        _compress_file(part_file, compressed_part_file, compression)
+        os.replace(compressed_part_file, file)
+        part_file.unlink()
+    else:
+        os.replace(part_file, file)
+    for suffix in BULK_FILE_SUFFIXES.values():
+        if (other_file := bulk_file_dir / f"{bulk_file_type}{suffix}") != file:
+            other_file.unlink(missing_ok=True)
+
+    # Stamp the file with its version so later downloads can tell whether it is up to date
+    if updated_at is None and (last_modified := response.headers.get("Last-Modified")):
+        updated_at = parsedate_to_datetime(last_modified)
+    if updated_at is not None:
+        os.utime(file, (updated_at.timestamp(), updated_at.timestamp()))
+
+    return True
+
+
+def _download_to_part_file(uri: str, part_file: Path, headers: dict[str, str]) -> requests.Response | None:
+    """
+    Download a bulk file into a partial file, picking up from the end of what
+    has already been written.
+
+    Args:
+        uri: Location of the bulk data file.
+        part_file: Path to write the downloaded file to.
+        headers: Extra headers for the request.
+
+    Returns:
+        The closed response, or None if the server reported the file as not
+        modified.
 
     Raises:
         HTTPError: If request for bulk file not successful.
     """
 
-    # TODO(#74): flag for check vs existing file; don't overwrite with same file or older version
-    with requests.get(uri, stream=True) as r:
+    headers = dict(headers)
+    if part_file.exists() and (offset := part_file.stat().st_size):
+        # NOTE: ranges count bytes of the encoded body, so ask for the file unencoded to line up with what's on disk
+        headers |= {"Range": f"bytes={offset}-", "Accept-Encoding": "identity"}
+
+    with requests.get(uri, headers=headers, stream=True, timeout=REQUEST_TIMEOUT) as r:
+        if r.status_code == requests.codes.not_modified:
+            return None
+        if r.status_code == requests.codes.requested_range_not_satisfiable:
+            # The partial file already holds the whole bulk file
+            return r
         r.raise_for_status()
-        bulk_file_dir.mkdir(parents=True, exist_ok=True)
-        file = bulk_file_dir / f"{bulk_file_type}.json"
-        with file.open(mode="wb") as f:
-            for chunk in r.iter_content(chunk_size=None):
+        # A server that ignores the Range header sends the whole file again
+        mode = "ab" if r.status_code == requests.codes.partial_content else "wb"
+        with part_file.open(mode=mode) as f:
+            for chunk in r.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
                 f.write(chunk)
+        return r
+
+
+def find_bulk_data_file(
+    bulk_file_type: ScryfallBulkFile,
+    bulk_file_dir: Path | str = CONFIG.bulk_file_dir,
+) -> Path:
+    """
+    Find a stored bulk data file, in whichever format it was saved.
+
+    Args:
+        bulk_file_type: Type of bulk file to find.
+        bulk_file_dir: Directory bulk files are saved in. Defaults to
+            `~/.scooze/data/bulk` if not specified.
+
+    Returns:
+        The path to the most recently saved copy of the file, or to the
+        uncompressed file if none is saved.
+    """
+
+    saved_files = [
+        file
+        for suffix in BULK_FILE_SUFFIXES.values()
+        if (file := Path(bulk_file_dir) / f"{bulk_file_type}{suffix}").exists()
+    ]
+    if not saved_files:
+        return Path(bulk_file_dir) / f"{bulk_file_type}{BULK_FILE_SUFFIXES[None]}"
+    return max(saved_files, key=lambda file: file.stat().st_mtime)
+
+
+@contextmanager
+def open_bulk_data_file(file: Path | str) -> Iterator[BinaryIO]:
+    """
+    Open a bulk data file for reading, decompressing it as it is read if it
+    was saved compressed. The format is detected from the file's magic bytes.
+
+    Args:
+        file: Path to the bulk file.
+
+    Yields:
+        A binary file object holding the file's JSON.
+
+    Raises:
+        ImportError: If the file is zstd-compressed and `zstandard` is not
+            installed.
+    """
+
+    with Path(file).open(mode="rb") as f:
+        magic = f.read(len(ZSTD_MAGIC))
+        f.seek(0)
+        if magic.startswith(GZIP_MAGIC):
+            with gzip.GzipFile(fileobj=f, mode="rb") as decompressed:
+                yield decompressed
+        elif magic.startswith(ZSTD_MAGIC):
+            with _import_zstandard().ZstdDecompressor().stream_reader(f) as decompressed:
+                yield decompressed
+        else:
+            yield f
+
+
+class BulkDataStream:
+    """
+    An in-progress bulk file download, read as an async binary file by
+    `ijson`'s async parsers. Blocking network reads run in a worker thread so
+    the event loop stays free for database writes.
+
+    Attributes:
+        response: The streaming response for the bulk file.
+        tee_file: A file that everything read is also written to, if any.
+    """
+
+    def __init__(self, response: requests.Response, tee_file: BinaryIO | None = None):
+        self.response = response
+        self.tee_file = tee_file
+        self._chunks = response.iter_content(chunk_size=STREAM_CHUNK_SIZE)
+        self._buffer = b""
+
+    async def read(self, size: int = -1) -> bytes:
+        if size == 0:
+            return b""
+        if not self._buffer:
+            self._buffer = await asyncio.get_running_loop().run_in_executor(None, self._read_chunk)
+        if size < 0:
+            # NOTE: unlike a regular file, this returns the next network chunk rather than the rest of the download
+            size = len(self._buffer)
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+    def _read_chunk(self) -> bytes:
+        chunk = next(self._chunks, b"")
+        if self.tee_file is not None:
+            self.tee_file.write(chunk)
+        return chunk
+
+
+@asynccontextmanager
+async def stream_bulk_data_file(uri: str, tee_file: Path | str | None = None) -> AsyncIterator[BulkDataStream]:
+    """
+    Open a bulk data file download as an async stream, so it can be parsed
+    while it downloads.
+
+    Args:
+        uri: Location of bulk data file (generally found from bulk info
+            endpoint).
+        tee_file: Path to also save the downloaded file to. It is written to a
+            `.part` file and only renamed into place once the whole file has
+            been read, so an interrupted stream can be resumed by
+            `download_bulk_data_file`.
+
+    Yields:
+        The download, as an async binary file.
+
+    Raises:
+        HTTPError: If request for bulk file not successful.
+    """
+
+    loop = asyncio.get_running_loop()
+    response = await loop.run_in_executor(None, partial(requests.get, uri, stream=True, timeout=REQUEST_TIMEOUT))
+    try:
+        response.raise_for_status()
+        if tee_file is None:
+            yield BulkDataStream(response)
+            return
+
+        tee_file = Path(tee_file)
+        tee_file.parent.mkdir(parents=True, exist_ok=True)
+        part_file = tee_file.with_name(f"{tee_file.name}.part")
+        with part_file.open(mode="wb") as f:
+            stream = BulkDataStream(response, f)
+            yield stream
+            # Save the rest of the file, in case the parser stopped before the end of the body
+            while await stream.read():
+                pass
+        os.replace(part_file, tee_file)
+    finally:
+        response.close()
+
+
+def _compress_file(source: Path, target: Path, compression: BulkFileCompression) -> None:
+    """
+    Compress a file, streaming it through the compressor.
+
+    Args:
+        source: Path to the file to compress.
+        target: Path to write the compressed file to.
+        compression: Format to compress the file with.
+
+    Raises:
+        ImportError: If compressing with zstd and `zstandard` is not
+            installed.
+    """
+
+    with source.open(mode="rb") as src, target.open(mode="wb") as dst:
+        match compression:
+            case BulkFileCompression.ZSTD:
+                with _import_zstandard().ZstdCompressor().stream_writer(dst, closefd=False) as writer:
+                    shutil.copyfileobj(src, writer, DOWNLOAD_CHUNK_SIZE)
+            case _:
+                # NOTE: level 6 compresses nearly as well as the default of 9 at several times the speed
+                with gzip.GzipFile(fileobj=dst, mode="wb", compresslevel=6) as writer:
+                    shutil.copyfileobj(src, writer, DOWNLOAD_CHUNK_SIZE)
+
+
+def _import_zstandard():
+    """
+    Import the optional `zstandard` package.
+
+    Returns:
+        The `zstandard` module.
+
+    Raises:
+        ImportError: If `zstandard` is not installed.
+    """
+
+    try:
+        import zstandard
+    except ImportError as e:
+        raise ImportError("zstd-compressed bulk files require the zstandard package: `pip install scooze[zstd]`") from e
+    return zstandard
 
 
 def download_bulk_data_file_by_type(
     bulk_file_type: ScryfallBulkFile | None = None,
     bulk_file_dir: str = CONFIG.bulk_file_dir,
-) -> None:
+    force: bool = False,
+    compression: BulkFileCompression | None = None,
+) -> bool:
     """
     Get a bulk data file from Scryfall, specified by file type
     (from among ScryfallBulkFile).
@@ -49,24 +378,30 @@ def download_bulk_data_file_by_type(
         bulk_file_type: Type of bulk file, used to set filename.
         bulk_file_dir: Directory to save bulk files. Defaults to
             `~/.scooze/data/bulk` if not specified.
+        force: Flag to download the file even if the existing one is up to
+            date.
+        compression: Format to compress the file with on disk. If None, the
+            file is stored uncompressed.
+
+    Returns:
+        True if the file was downloaded, or False if it was already up to date
+        or is not offered by Scryfall.
 
     Raises:
         HTTPError: If request for bulk file not successful.
+        BulkDownloadError: If the downloaded file is not the expected size.
     """
 
-    # get URI from Scryfall bulk endpoint
-
-    with requests.get(SCRYFALL_BULK_INFO_ENDPOINT) as bulk_metadata_request:
-        bulk_metadata_request.raise_for_status()
-        bulk_metadata = bulk_metadata_request.json()["data"]
-    bulk_files = {t["type"]: t["download_uri"] for t in bulk_metadata}
+    bulk_files = get_bulk_metadata()
     if bulk_file_type not in bulk_files:
-        return
-    download_bulk_data_file(bulk_files[bulk_file_type], bulk_file_type, bulk_file_dir)
+        return False
+    return _download_from_metadata(bulk_files[bulk_file_type], bulk_file_type, bulk_file_dir, force, compression)
 
 
 def download_all_bulk_data_files(
     bulk_file_dir: str = CONFIG.bulk_file_dir,
+    force: bool = False,
+    compression: BulkFileCompression | None = None,
 ) -> None:
     """
     Download all supported Scryfall bulk data files to local filesystem.
@@ -74,20 +409,67 @@ def download_all_bulk_data_files(
     Args:
         bulk_file_dir: Directory to save bulk files. Defaults to
             `~/.scooze/data/bulk` if not specified.
+        force: Flag to download files even if the existing ones are up to
+            date.
+        compression: Format to compress the files with on disk. If None, the
+            files are stored uncompressed.
 
     Raises:
         HTTPError: If request for bulk file not successful.
+        BulkDownloadError: If a downloaded file is not the expected size.
+    """
+
+    bulk_files = get_bulk_metadata()
+
+    for bulk_type in ScryfallBulkFile.list():
+        _download_from_metadata(bulk_files[bulk_type], bulk_type, bulk_file_dir, force, compression)
+
+
+def get_bulk_metadata() -> dict[str, dict]:
     """
+    Get the metadata of each bulk file from Scryfall's bulk info endpoint.
+
+    Returns:
+        Metadata for each bulk file, keyed by bulk file type.
 
-    with requests.get(SCRYFALL_BULK_INFO_ENDPOINT) as bulk_metadata_request:
+    Raises:
+        HTTPError: If request for bulk info not successful.
+    """
+
+    with requests.get(SCRYFALL_BULK_INFO_ENDPOINT, timeout=REQUEST_TIMEOUT) as bulk_metadata_request:
         bulk_metadata_request.raise_for_status()
         bulk_metadata = bulk_metadata_request.json()["data"]
-    bulk_files = {t["type"]: t["download_uri"] for t in bulk_metadata}
+    return {t["type"]: t for t in bulk_metadata}
 
-    for bulk_type in ScryfallBulkFile.list():
-        bulk_filename = bulk_files[bulk_type]
-        download_bulk_data_file(
-            uri=bulk_filename,
-            bulk_file_type=bulk_type,
-            bulk_file_dir=bulk_file_dir,
-        )
+
+def _download_from_metadata(
+    metadata: dict,
+    bulk_file_type: ScryfallBulkFile,
+    bulk_file_dir: str,
+    force: bool,
+    compression: BulkFileCompression | None,
+) -> bool:
+    """
+    Download a bulk file described by the bulk info endpoint.
+
+    Args:
+        metadata: The bulk info endpoint's description of the file.
+        bulk_file_type: Type of bulk file, used to set filename.
+        bulk_file_dir: Directory to save bulk files.
+        force: Flag to download the file even if the existing one is up to
+            date.
+        compression: Format to compress the file with on disk.
+
+    Returns:
+        True if the file was downloaded, or False if it was already up to date.
+    """
+
+    return download_bulk_data_file(
+        uri=metadata["download_uri"],
+        bulk_file_type=bulk_file_type,
+        bulk_file_dir=bulk_file_dir,
+        updated_at=datetime.fromisoformat(updated_at) if (updated_at := metadata.get("updated_at")) else None,
+        expected_size=metadata.get("size"),
+        force=force,
+        compression=compression,
+    )
@@ -1,5 +1,4 @@
 import json
-import re
 from collections import Counter
 from datetime import date
 from typing import Iterable, Mapping, Self
@@ -33,8 +32,15 @@ from scooze.catalogs import (
     SetType,
 )
 from scooze.logger import logger
+from scooze.manacost import ParsedCost, parse_cost
 from scooze.models.card import CardModel
-from scooze.utils import FloatableT, HashableObject, parse_symbols
+from scooze.utils import (
+    FloatableT,
+    HashableObject,
+    cached_feature,
+    count_words,
+    remove_reminder_text,
+)
 
 # TODO(#309): Add functionality to Card to get only the values for an "OracleCard"
 
@@ -190,6 +196,97 @@ class Card(HashableObject):
         watermark (str | None): Watermark printed on this card, if any.
     """
 
+    __slots__ = (
+        "scooze_id",
+        # Basic Fields
+        "name",
+        "cmc",
+        "color_identity",
+        "colors",
+        "legalities",
+        "mana_cost",
+        "power",
+        "toughness",
+        "type_line",
+        # Oracle Fields
+        "card_faces",
+        "color_indicator",
+        "edhrec_rank",
+        "hand_modifier",
+        "keywords",
+        "life_modifier",
+        "loyalty",
+        "oracle_id",
+        "oracle_text",
+        "penny_rank",
+        "prints_search_uri",
+        "produced_mana",
+        "reserved",
+        "rulings_uri",
+        # Core Fields
+        "arena_id",
+        "scryfall_id",
+        "lang",
+        "mtgo_id",
+        "mtgo_foil_id",
+        "multiverse_ids",
+        "tcgplayer_id",
+        "tcgplayer_etched_id",
+        "cardmarket_id",
+        "scryfall_uri",
+        "uri",
+        # Gameplay Fields
+        "all_parts",
+        "oversized",
+        # Print Fields
+        "artist",
+        "artist_ids",
+        "attraction_lights",
+        "booster",
+        "border_color",
+        "card_back_id",
+        "collector_number",
+        "content_warning",
+        "digital",
+        "finishes",
+        "flavor_name",
+        "flavor_text",
+        "frame_effects",
+        "frame",
+        "full_art",
+        "games",
+        "highres_image",
+        "illustration_id",
+        "image_status",
+        "image_uris",
+        "layout",
+        "preview",
+        "prices",
+        "printed_name",
+        "printed_text",
+        "printed_type_line",
+        "promo",
+        "promo_types",
+        "purchase_uris",
+        "rarity",
+        "related_uris",
+        "released_at",
+        "reprint",
+        "scryfall_set_uri",
+        "security_stamp",
+        "set_name",
+        "set_search_uri",
+        "set_type",
+        "set_uri",
+        "set_code",
+        "set_id",
+        "story_spotlight",
+        "textless",
+        "variation",
+        "variation_of",
+        "watermark",
+    )
+
     def __init__(
         self,
         name: str | None = None,
@@ -287,17 +384,17 @@ class Card(HashableObject):
 
         # region Basic Fields
 
-        self.name = name
+        self.name = CardNormalizer.to_str(name)
         self.cmc = CardNormalizer.to_float(cmc)
         self.color_identity = CardNormalizer.to_frozenset(color_identity, convert_to_enum=Color)
         self.colors = CardNormalizer.to_frozenset(colors, convert_to_enum=Color)
         self.legalities = CardNormalizer.to_frozendict(
             legalities, convert_key_to_enum=Format, convert_value_to_enum=Legality
         )
-        self.mana_cost = mana_cost
-        self.power = power
-        self.toughness = toughness
-        self.type_line = type_line
+        self.mana_cost = CardNormalizer.to_str(mana_cost)
+        self.power = CardNormalizer.to_str(power)
+        self.toughness = CardNormalizer.to_str(toughness)
+        self.type_line = CardNormalizer.to_str(type_line)
 
         # Oracle Fields
         self.card_faces = CardNormalizer.to_card_faces(card_faces)
@@ -306,14 +403,14 @@ class Card(HashableObject):
         self.hand_modifier = hand_modifier
         self.keywords = CardNormalizer.to_frozenset(keywords)
         self.life_modifier = life_modifier
-        self.loyalty = loyalty
-        self.oracle_id = oracle_id
-        self.oracle_text = oracle_text
+        self.loyalty = CardNormalizer.to_str(loyalty)
+        self.oracle_id = CardNormalizer.to_str(oracle_id)
+        self.oracle_text = CardNormalizer.to_str(oracle_text)
         self.penny_rank = penny_rank
-        self.prints_search_uri = prints_search_uri
+        self.prints_search_uri = CardNormalizer.to_str(prints_search_uri)
         self.produced_mana = CardNormalizer.to_frozenset(produced_mana, convert_to_enum=Color)
         self.reserved = reserved
-        self.rulings_uri = rulings_uri
+        self.rulings_uri = CardNormalizer.to_str(rulings_uri)
 
         # endregion
 
@@ -349,7 +446,7 @@ class Card(HashableObject):
 
         # region Print fields
 
-        self.artist = artist
+        self.artist = CardNormalizer.to_str(artist)
         self.artist_ids = CardNormalizer.to_tuple(artist_ids)
         self.attraction_lights = CardNormalizer.to_frozenset(attraction_lights)
         self.booster = booster
@@ -360,7 +457,7 @@ class Card(HashableObject):
         self.digital = digital
         self.finishes = CardNormalizer.to_frozenset(finishes, convert_to_enum=Finish)
         self.flavor_name = flavor_name
-        self.flavor_text = flavor_text
+        self.flavor_text = CardNormalizer.to_str(flavor_text)
         self.frame_effects = CardNormalizer.to_frozenset(frame_effects, convert_to_enum=FrameEffect)
         self.frame = CardNormalizer.to_enum(Frame, frame)
         self.full_art = full_art
@@ -374,7 +471,7 @@ class Card(HashableObject):
         self.prices = CardNormalizer.to_prices(prices)
         self.printed_name = printed_name
         self.printed_text = printed_text
-        self.printed_type_line = printed_type_line
+        self.printed_type_line = CardNormalizer.to_str(printed_type_line)
         self.promo = promo
         self.promo_types = CardNormalizer.to_frozenset(promo_types)
         self.purchase_uris = CardNormalizer.to_purchase_uris(purchase_uris)
@@ -382,19 +479,19 @@ class Card(HashableObject):
         self.related_uris = CardNormalizer.to_related_uris(related_uris)
         self.released_at = CardNormalizer.to_date(released_at)
         self.reprint = reprint
-        self.scryfall_set_uri = scryfall_set_uri
+        self.scryfall_set_uri = CardNormalizer.to_str(scryfall_set_uri)
         self.security_stamp = CardNormalizer.to_enum(SecurityStamp, security_stamp)
-        self.set_name = set_name
-        self.set_search_uri = set_search_uri
+        self.set_name = CardNormalizer.to_str(set_name)
+        self.set_search_uri = CardNormalizer.to_str(set_search_uri)
         self.set_type = CardNormalizer.to_enum(SetType, set_type)
-        self.set_uri = set_uri
-        self.set_code = set_code if set_code else kwargs.get("set")
-        self.set_id = set_id
+        self.set_uri = CardNormalizer.to_str(set_uri)
+        self.set_code = CardNormalizer.to_str(set_code if set_code else kwargs.get("set"))
+        self.set_id = CardNormalizer.to_str(set_id)
         self.story_spotlight = story_spotlight
         self.textless = textless
         self.variation = variation
         self.variation_of = variation_of
-        self.watermark = watermark
+        self.watermark = CardNormalizer.to_str(watermark)
 
         # endregion
 
@@ -440,8 +537,7 @@ class Card(HashableObject):
             oracle_text: The oracle text of a card.
         """
 
-        pattern_reminder = r" ?\([^()]+\) ?"  # text between parens ()
-        return re.sub(pattern_reminder, "", oracle_text)
+        return remove_reminder_text(oracle_text)
 
     def is_double_sided(self) -> bool:
         """
@@ -450,39 +546,59 @@ class Card(HashableObject):
 
         return self.card_faces is not None
 
+    @cached_feature
+    def parsed_cost(self) -> ParsedCost:
+        """
+        This card's parsed mana cost, with its symbols, mana value, and
+        colors. Cached until the card is changed.
+        """
+
+        return parse_cost(self.mana_cost)
+
     def mana_symbols(self) -> Counter[CostSymbol]:
         """
         A mapping of CostSymbols to how many times those symbols appear in this card's mana cost.
         """
 
-        return parse_symbols(self.mana_cost)
+        return Counter[CostSymbol](self.parsed_cost().symbols)
 
+    @cached_feature
     def total_words(self) -> int:
         """
         The number of words in this card's oracle text
-        (excludes reminder text).
+        (excludes reminder text). Cached until the card is changed.
         """
 
-        pattern_words = r"([a-zA-Z0-9+/{}']+)"  # words on a card
-
         word_count: int
 
         # MDFC
         if self.is_double_sided():
-            word_count = sum(
-                [
-                    len(re.findall(pattern_words, Card.oracle_text_without_reminder(face.oracle_text)))
-                    for face in self.card_faces
-                ]
-            )
+            word_count = sum(face.total_words() for face in self.card_faces)
         # Non-MDFC
         else:
-            word_count = len(re.findall(pattern_words, Card.oracle_text_without_reminder(self.oracle_text)))
+            word_count = count_words(self.oracle_text)
 
         # Don't double count reversible card text
         return int(word_count / (2 if self.layout is Layout.REVERSIBLE_CARD else 1))
 
 
+def precompute_features(cards: Iterable[Card]) -> None:
+    """
+    Compute and cache the derived features of each card and its faces, such
+    as word counts and parsed mana costs, so that later statistics over the
+    cards only read them.
+
+    Args:
+        cards: The cards to precompute features for.
+    """
+
+    for card in cards:
+        card.parsed_cost()
+        card.total_words()
+        for face in card.card_faces or ():
+            face.parsed_cost()
+
+
 class CardNormalizer(CardPartsNormalizer):
     """
     A simple class to use when normalizing non-serializable data from JSON.
@@ -4,6 +4,7 @@ from typing import Self
 
 from scooze.card import Card
 from scooze.catalogs import Color, CostSymbol
+from scooze.manacost import parse_cost
 from scooze.utils import ComparableObject, DictDiff
 
 
@@ -50,10 +51,10 @@ class CardList(ComparableObject):
 
         counts = Counter()
         for card, q in self.cards.items():
-            for symbol, count in card.mana_symbols().items():
+            for symbol, count in parse_cost(card.mana_cost).symbols.items():
                 # filter only to colors and colorless (not generic)
-                if symbol in Color.list():
-                    counts.update({symbol: count * q})
+                if Color.has_value(symbol):
+                    counts[symbol] += count * q
         return counts
 
     # endregion
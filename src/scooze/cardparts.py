@@ -1,10 +1,18 @@
 import json
+from collections import Counter
 from datetime import date
 from typing import Iterable, Mapping, Self
 
-from scooze.catalogs import Color, Component, Layout
+from scooze.catalogs import Color, Component, CostSymbol, Layout
 from scooze.logger import logger
-from scooze.utils import FloatableT, HashableObject, JsonNormalizer
+from scooze.manacost import ParsedCost, parse_cost
+from scooze.utils import (
+    FloatableT,
+    HashableObject,
+    JsonNormalizer,
+    cached_feature,
+    count_words,
+)
 
 
 class ImageUris(HashableObject):
@@ -23,6 +31,15 @@ class ImageUris(HashableObject):
         small (str | None): Small JPG image (146x204)
     """
 
+    __slots__ = (
+        "png",
+        "border_crop",
+        "art_crop",
+        "large",
+        "normal",
+        "small",
+    )
+
     def __init__(
         self,
         png: str | None = None,
@@ -82,6 +99,30 @@ class CardFace(HashableObject):
         watermark (str | None): Watermark printed on this face, if any.
     """
 
+    __slots__ = (
+        "name",
+        "artist",
+        "artist_id",
+        "cmc",
+        "color_indicator",
+        "colors",
+        "flavor_text",
+        "illustration_id",
+        "image_uris",
+        "layout",
+        "loyalty",
+        "mana_cost",
+        "oracle_id",
+        "oracle_text",
+        "power",
+        "printed_name",
+        "printed_text",
+        "printed_type_line",
+        "toughness",
+        "type_line",
+        "watermark",
+    )
+
     def __init__(
         self,
         name: str | None = None,
@@ -111,27 +152,27 @@ class CardFace(HashableObject):
         if kwargs:
             logger.debug("kwargs found", extra=kwargs)
 
-        self.name = name
-        self.artist = artist
+        self.name = CardPartsNormalizer.to_str(name)
+        self.artist = CardPartsNormalizer.to_str(artist)
         self.artist_id = artist_id
         self.cmc = CardPartsNormalizer.to_float(cmc)
         self.color_indicator = CardPartsNormalizer.to_frozenset(color_indicator, convert_to_enum=Color)
         self.colors = CardPartsNormalizer.to_frozenset(colors, convert_to_enum=Color)
-        self.flavor_text = flavor_text
+        self.flavor_text = CardPartsNormalizer.to_str(flavor_text)
         self.illustration_id = illustration_id
         self.image_uris = CardPartsNormalizer.to_image_uris(image_uris)
         self.layout = CardPartsNormalizer.to_enum(Layout, layout)
-        self.loyalty = loyalty
-        self.mana_cost = mana_cost
-        self.oracle_id = oracle_id
-        self.oracle_text = oracle_text
-        self.power = power
+        self.loyalty = CardPartsNormalizer.to_str(loyalty)
+        self.mana_cost = CardPartsNormalizer.to_str(mana_cost)
+        self.oracle_id = CardPartsNormalizer.to_str(oracle_id)
+        self.oracle_text = CardPartsNormalizer.to_str(oracle_text)
+        self.power = CardPartsNormalizer.to_str(power)
         self.printed_name = printed_name
         self.printed_text = printed_text
         self.printed_type_line = printed_type_line
-        self.toughness = toughness
-        self.type_line = type_line
-        self.watermark = watermark
+        self.toughness = CardPartsNormalizer.to_str(toughness)
+        self.type_line = CardPartsNormalizer.to_str(type_line)
+        self.watermark = CardPartsNormalizer.to_str(watermark)
 
     @classmethod
     def from_json(cls, data: dict | str) -> Self:
@@ -140,6 +181,31 @@ class CardFace(HashableObject):
         elif isinstance(data, str):
             return cls(**json.loads(data))
 
+    @cached_feature
+    def parsed_cost(self) -> ParsedCost:
+        """
+        This face's parsed mana cost, with its symbols, mana value, and
+        colors. Cached until the face is changed.
+        """
+
+        return parse_cost(self.mana_cost)
+
+    def mana_symbols(self) -> Counter[CostSymbol]:
+        """
+        A mapping of CostSymbols to how many times those symbols appear in this face's mana cost.
+        """
+
+        return Counter[CostSymbol](self.parsed_cost().symbols)
+
+    @cached_feature
+    def total_words(self) -> int:
+        """
+        The number of words in this face's oracle text (excludes reminder
+        text). Cached until the face is changed.
+        """
+
+        return count_words(self.oracle_text)
+
 
 class Preview(HashableObject):
     """
@@ -151,6 +217,12 @@ class Preview(HashableObject):
         source_uri (str | None): Location of preview source.
     """
 
+    __slots__ = (
+        "previewed_at",
+        "source",
+        "source_uri",
+    )
+
     def __init__(
         self,
         previewed_at: date | None = None,
@@ -180,6 +252,15 @@ class Prices(HashableObject):
         tix (float | None): Price in MTGO tix, from Cardhoarder.
     """
 
+    __slots__ = (
+        "usd",
+        "usd_foil",
+        "usd_etched",
+        "eur",
+        "eur_foil",
+        "tix",
+    )
+
     def __init__(
         self,
         usd: FloatableT | None = None,
@@ -212,6 +293,12 @@ class PurchaseUris(HashableObject):
         cardhoarder (str | None): Link to buy this card digitally for MTGO on Cardhoarder.
     """
 
+    __slots__ = (
+        "tcgplayer",
+        "cardmarket",
+        "cardhoarder",
+    )
+
     def __init__(
         self,
         tcgplayer: str | None = None,
@@ -237,6 +324,14 @@ class RelatedCard(HashableObject):
         uri (str | None): URI of linked component.
     """
 
+    __slots__ = (
+        "name",
+        "scryfall_id",
+        "component",
+        "type_line",
+        "uri",
+    )
+
     def __init__(
         self,
         name: str | None = None,
@@ -248,10 +343,10 @@ class RelatedCard(HashableObject):
         # kwargs
         **kwargs,
     ):
-        self.name = name
+        self.name = CardPartsNormalizer.to_str(name)
         self.scryfall_id = scryfall_id if scryfall_id else id
         self.component = CardPartsNormalizer.to_enum(Component, component)
-        self.type_line = type_line
+        self.type_line = CardPartsNormalizer.to_str(type_line)
         self.uri = uri
 
         if kwargs:
@@ -271,6 +366,13 @@ class RelatedUris(HashableObject):
             [infinite.tcgplayer.com/magic-the-gathering/decks](https://infinite.tcgplayer.com/magic-the-gathering/decks)
     """
 
+    __slots__ = (
+        "edhrec",
+        "gatherer",
+        "tcgplayer_infinite_articles",
+        "tcgplayer_infinite_decks",
+    )
+
     def __init__(
         self,
         edhrec: str | None = None,
@@ -0,0 +1,405 @@
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable
+
+import ijson
+from scooze.bulkdata import find_bulk_data_file, open_bulk_data_file
+from scooze.card import Card
+from scooze.catalogs import Color, Format, Legality, Rarity, ScryfallBulkFile
+from scooze.config import CONFIG
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# The bit for each color in a color bitmask.
+COLOR_BITS: dict[Color, int] = {color: 1 << i for i, color in enumerate(Color) if color != Color.COLORLESS}
+
+# Codes stored in the legality and rarity columns. -1 means the card has no value.
+LEGALITY_CODES: dict[Legality, int] = {legality: i for i, legality in enumerate(Legality)}
+RARITY_CODES: dict[Rarity, int] = {rarity: i for i, rarity in enumerate(Rarity)}
+NO_CODE = -1
+
+# Prices held in the price columns.
+PRICES = ("usd", "usd_foil", "usd_etched", "eur", "eur_foil", "tix")
+
+# Columns that cards can be grouped by.
+GROUP_COLUMNS = ("cmc", "colors", "color_identity", "rarity")
+
+
+def _import_numpy():
+    """
+    Import the optional `numpy` package.
+
+    Returns:
+        The `numpy` module.
+
+    Raises:
+        ImportError: If `numpy` is not installed.
+    """
+
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError("CardTable requires the numpy package: `pip install scooze[cardtable]`") from e
+    return numpy
+
+
+def _to_bitmask(colors: Iterable[Color] | None) -> int:
+    return sum(COLOR_BITS.get(color, 0) for color in colors or ())
+
+
+def _from_bitmask(bitmask: int) -> frozenset[Color]:
+    return frozenset(color for color, bit in COLOR_BITS.items() if bitmask & bit)
+
+
+class CardTable(Sequence[Card]):
+    """
+    Card attributes held in NumPy arrays, for filtering, grouping, and
+    aggregating many cards at once without a Python loop over them. Filters
+    and groups give indices back into the table's cards.
+
+    Columns are read with `column()`:
+
+    - `cmc`: float, NaN if unknown.
+    - `colors`, `color_identity`: a bitmask of `COLOR_BITS`.
+    - `rarity`: a code from `RARITY_CODES`, or `NO_CODE`.
+    - `legalities.<format>`: a code from `LEGALITY_CODES`, or `NO_CODE`.
+    - `prices.<price>`: float, NaN if unknown.
+
+    Example:
+        ``` python
+        table = CardTable.from_bulk_file(ScryfallBulkFile.ORACLE)
+        modern = table.where(table.legal_in(Format.MODERN))
+        average_cmc = table.aggregate("cmc", by="color_identity", indices=modern)
+        ```
+
+    Raises:
+        ImportError: If `numpy` is not installed.
+    """
+
+    def __init__(self, cards: Iterable[Card]):
+        np = _import_numpy()
+        self.cards: list[Card] = list(cards)
+        count = len(self.cards)
+
+        self.cmc = np.full(count, np.nan)
+        self.colors = np.zeros(count, np.uint8)
+        self.color_identity = np.zeros(count, np.uint8)
+        self.rarity = np.full(count, NO_CODE, np.int8)
+        # One row per card and one column per format, in `Format` order
+        self.legalities = np.full((count, len(Format)), NO_CODE, np.int8)
+        self.prices = {price: np.full(count, np.nan) for price in PRICES}
+
+        formats = {fmt: i for i, fmt in enumerate(Format)}
+        for i, card in enumerate(self.cards):
+            if card.cmc is not None:
+                self.cmc[i] = card.cmc
+            self.colors[i] = _to_bitmask(card.colors)
+            self.color_identity[i] = _to_bitmask(card.color_identity)
+            if card.rarity is not None:
+                self.rarity[i] = RARITY_CODES[card.rarity]
+            for fmt, legality in (card.legalities or {}).items():
+                self.legalities[i, formats[fmt]] = LEGALITY_CODES[legality]
+            if card.prices is not None:
+                for price, values in self.prices.items():
+                    if (value := getattr(card.prices, price)) is not None:
+                        values[i] = value
+
+    @classmethod
+    def from_bulk_file(
+        cls,
+        file_type: ScryfallBulkFile,
+        bulk_file_dir: Path = CONFIG.bulk_file_dir,
+    ) -> "CardTable":
+        """
+        Build a table from a bulk data file.
+
+        Args:
+            file_type: The type of [ScryfallBulkFile](https://scryfall.com/docs/api/bulk-data)
+                to read.
+            bulk_file_dir: The path to the folder containing the ScryfallBulkFile.
+
+        Returns:
+            A table of the file's cards.
+
+        Raises:
+            FileNotFoundError: If the bulk file does not exist.
+        """
+
+        with open_bulk_data_file(find_bulk_data_file(file_type, bulk_file_dir)) as cards_file:
+            return cls(Card.from_json(card_json) for card_json in ijson.items(cards_file, "item", use_float=True))
+
+    @classmethod
+    def from_database(cls, property_name: str | None = None, values: list[Any] | None = None) -> "CardTable":
+        """
+        Build a table from the cards in the database matching the given
+        criteria, or from all cards if none are given.
+
+        Args:
+            property_name: The property to check.
+            values: A list of values to match on.
+
+        Returns:
+            A table of the matching cards.
+        """
+
+        # Imported here since scooze.api imports the modules this one does
+        from scooze.api import ScoozeApi
+
+        with ScoozeApi(cache_size=0) as s:
+            if property_name is None:
+                return cls(s.iter_cards_all())
+            return cls(s.iter_cards_by(property_name=property_name, values=values))
+
+    def __len__(self) -> int:
+        return len(self.cards)
+
+    def __getitem__(self, index: int) -> Card:
+        return self.cards[index]
+
+    def take(self, indices: Iterable[int]) -> list[Card]:
+        """
+        The cards at the given indices.
+
+        Args:
+            indices: Indices into this table, such as those from `where()`.
+
+        Returns:
+            The cards, in the order of the indices.
+        """
+
+        return [self.cards[i] for i in indices]
+
+    # region Columns
+
+    def column(self, name: str) -> "np.ndarray":
+        """
+        Read a column by name.
+
+        Args:
+            name: The column to read.
+
+        Returns:
+            The column's value for every card, in order.
+
+        Raises:
+            KeyError: If there is no such column.
+        """
+
+        match name.split(".", 1):
+            case ["cmc" | "colors" | "color_identity" | "rarity"]:
+                return getattr(self, name)
+            case ["legalities", fmt] if Format.has_value(fmt):
+                return self.legalities[:, list(Format).index(Format(fmt))]
+            case ["prices", price] if price in self.prices:
+                return self.prices[price]
+        raise KeyError(f"CardTable has no column {name!r}.")
+
+    # endregion
+
+    # region Filters
+
+    def where(self, mask: "np.ndarray") -> "np.ndarray":
+        """
+        The indices of the cards selected by a mask. Masks from this table's
+        filter methods can be combined with `&`, `|`, and `~` first.
+
+        Args:
+            mask: A boolean array with a value for every card.
+
+        Returns:
+            The selected indices, in order.
+        """
+
+        np = _import_numpy()
+        return np.flatnonzero(mask)
+
+    def legal_in(self, format: Format, legalities: Iterable[Legality] = (Legality.LEGAL,)) -> "np.ndarray":
+        """
+        Select the cards with one of the given legalities in a format.
+
+        Args:
+            format: The format to check.
+            legalities: The legalities to select.
+
+        Returns:
+            A boolean mask with a value for every card.
+        """
+
+        np = _import_numpy()
+        return np.isin(self.column(f"legalities.{format}"), [LEGALITY_CODES[legality] for legality in legalities])
+
+    def color_identity_within(self, colors: Iterable[Color]) -> "np.ndarray":
+        """
+        Select the cards whose color identity is within the given colors, as
+        for a Commander deck.
+
+        Args:
+            colors: The colors allowed.
+
+        Returns:
+            A boolean mask with a value for every card.
+        """
+
+        outside = _to_bitmask(COLOR_BITS) ^ _to_bitmask(colors)
+        return (self.color_identity & outside) == 0
+
+    def has_colors(self, colors: Iterable[Color]) -> "np.ndarray":
+        """
+        Select the cards that are at least all of the given colors.
+
+        Args:
+            colors: The colors required.
+
+        Returns:
+            A boolean mask with a value for every card.
+        """
+
+        bitmask = _to_bitmask(colors)
+        return (self.colors & bitmask) == bitmask
+
+    def has_rarity(self, *rarities: Rarity) -> "np.ndarray":
+        """
+        Select the cards with any of the given rarities.
+
+        Args:
+            rarities: The rarities to select.
+
+        Returns:
+            A boolean mask with a value for every card.
+        """
+
+        np = _import_numpy()
+        return np.isin(self.rarity, [RARITY_CODES[rarity] for rarity in rarities])
+
+    # endregion
+
+    # region Grouping and aggregation
+
+    def _group_codes(self, by: str, indices: "np.ndarray") -> tuple["np.ndarray", "np.ndarray", list[Any]]:
+        np = _import_numpy()
+        if by not in GROUP_COLUMNS and not by.startswith("legalities."):
+            raise KeyError(f"CardTable can't group by {by!r}.")
+
+        keys, codes = np.unique(self.column(by)[indices], return_inverse=True)
+        match by:
+            case "colors" | "color_identity":
+                labels = [_from_bitmask(key) for key in keys]
+            case "rarity":
+                labels = [list(Rarity)[key] if key != NO_CODE else None for key in keys]
+            case "cmc":
+                labels = [None if np.isnan(key) else float(key) for key in keys]
+            case _:
+                labels = [list(Legality)[key] if key != NO_CODE else None for key in keys]
+        return keys, codes, labels
+
+    def group(self, by: str, indices: Iterable[int] | None = None) -> dict[Any, "np.ndarray"]:
+        """
+        Group cards by the value of a column.
+
+        Args:
+            by: The column to group by: `cmc`, `colors`, `color_identity`,
+                `rarity`, or `legalities.<format>`.
+            indices: The cards to group. If None, all cards are grouped.
+
+        Returns:
+            The indices of the cards in each group, keyed by the column's
+                value: a float for `cmc`, a frozenset of Colors for color
+                columns, a Rarity or Legality for coded columns, and None for
+                cards with no value.
+
+        Raises:
+            KeyError: If the table can't be grouped by the given column.
+        """
+
+        np = _import_numpy()
+        indices = np.arange(len(self)) if indices is None else np.asarray(indices, dtype=np.intp)
+        _, codes, labels = self._group_codes(by, indices)
+        order = np.argsort(codes, kind="stable")
+        boundaries = np.flatnonzero(np.diff(codes[order])) + 1
+        return dict(zip(labels, np.split(indices[order], boundaries)))
+
+    def aggregate(
+        self,
+        column: str,
+        by: str | None = None,
+        func: str = "mean",
+        indices: Iterable[int] | None = None,
+    ) -> float | dict[Any, float]:
+        """
+        Aggregate a numeric column, ignoring NaN values.
+
+        Args:
+            column: The column to aggregate: `cmc` or `prices.<price>`.
+            by: The column to group by first, as for `group()`. If None, all
+                the selected cards are aggregated together.
+            func: One of `count`, `sum`, `mean`, `min`, or `max`.
+            indices: The cards to aggregate. If None, all cards are
+                aggregated.
+
+        Returns:
+            The aggregate, or the aggregate of each group keyed as by
+                `group()`. Groups with no values have a NaN mean, min, or max.
+
+        Raises:
+            KeyError: If there is no such column, or the table can't be
+                grouped by `by`.
+            ValueError: If `func` is not a supported aggregate.
+        """
+
+        np = _import_numpy()
+        if func not in _AGGREGATES:
+            raise ValueError(f"Unknown aggregate {func!r}; expected one of {', '.join(_AGGREGATES)}.")
+
+        indices = np.arange(len(self)) if indices is None else np.asarray(indices, dtype=np.intp)
+        values = self.column(column)[indices].astype(np.float64)
+        if by is None:
+            return float(_AGGREGATES[func](values, np.zeros(len(values), np.intp), 1)[0])
+
+        keys, codes, labels = self._group_codes(by, indices)
+        results = _AGGREGATES[func](values, codes, len(keys))
+        return {label: float(result) for label, result in zip(labels, results)}
+
+    # endregion
+
+
+def _count(values: "np.ndarray", codes: "np.ndarray", size: int) -> "np.ndarray":
+    np = _import_numpy()
+    return np.bincount(codes, weights=~np.isnan(values), minlength=size)
+
+
+def _sum(values: "np.ndarray", codes: "np.ndarray", size: int) -> "np.ndarray":
+    np = _import_numpy()
+    return np.bincount(codes, weights=np.nan_to_num(values), minlength=size)
+
+
+def _mean(values: "np.ndarray", codes: "np.ndarray", size: int) -> "np.ndarray":
+    np = _import_numpy()
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return _sum(values, codes, size) / _count(values, codes, size)
+
+
+def _min(values: "np.ndarray", codes: "np.ndarray", size: int) -> "np.ndarray":
+    np = _import_numpy()
+    results = np.full(size, np.inf)
+    np.fmin.at(results, codes, values)
+    results[results == np.inf] = np.nan
+    return results
+
+
+def _max(values: "np.ndarray", codes: "np.ndarray", size: int) -> "np.ndarray":
+    np = _import_numpy()
+    results = np.full(size, -np.inf)
+    np.fmax.at(results, codes, values)
+    results[results == -np.inf] = np.nan
+    return results
+
+
+# Vectorized aggregates, each taking values and the group code of each value and giving one result per group.
+_AGGREGATES: dict[str, Callable[["np.ndarray", "np.ndarray", int], "np.ndarray"]] = {
+    "count": _count,
+    "sum": _sum,
+    "mean": _mean,
+    "min": _min,
+    "max": _max,
+}
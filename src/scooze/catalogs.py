@@ -728,7 +728,7 @@ class CostSymbol(ExtendedEnum, StrEnum):
             return 2
         if self.is_half:
             return 0.5
-        if self.is_generic:
+        if self.is_generic and self.value.isdigit():
             return float(self)
         return 1
 
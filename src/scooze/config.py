@@ -13,6 +13,8 @@ PACKAGE_ROOT = Path(__file__).parent
 DEFAULT_BULK_FILE_DIR = Path.home() / ".scooze" / "data" / "bulk"
 DEFAULT_DECKS_DIR = Path.home() / ".scooze" / "data" / "decks"
 DEFAULT_LOGS_DIR = Path.home() / ".scooze" / "logs"
+DEFAULT_SQLITE_PATH = Path.home() / ".scooze" / "data" / "scooze.db"
+DEFAULT_SNAPSHOT_PATH = Path.home() / ".scooze" / "data" / "cards.snapshot"
 
 # endregion
 
@@ -33,6 +35,8 @@ class ScoozeSettings(BaseSettings):
     bulk_file_dir: Path = DEFAULT_BULK_FILE_DIR
     decks_dir: Path = DEFAULT_DECKS_DIR
     logs_dir: Path = DEFAULT_LOGS_DIR
+    sqlite_path: Path = DEFAULT_SQLITE_PATH
+    snapshot_path: Path = DEFAULT_SNAPSHOT_PATH
     testing: bool = False
 
     @property
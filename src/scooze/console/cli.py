@@ -18,9 +18,17 @@ COMMANDS = [
     "run",
     # Save commands
     "save cards",
+    # Export commands
+    "export cards",
     # Load commands
     "load cards",
     "load decks",
+    # Index commands
+    "index build",
+    "index drop",
+    "index status",
+    # Snapshot commands
+    "snapshot build",
 ]
 
 
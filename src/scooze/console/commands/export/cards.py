@@ -0,0 +1,87 @@
+import asyncio
+from pathlib import Path
+
+from cleo.commands.command import Command
+from cleo.helpers import option
+from scooze.api import ScoozeApi
+from scooze.api.bulkdata import export_card_file
+from scooze.catalogs import ScryfallBulkFile
+from scooze.config import CONFIG
+from scooze.enums import CardTableFormat
+
+
+class ExportCardsCommand(Command):
+    name = "export cards"
+    description = "Export cards to a Parquet or Arrow card table file."
+
+    options = [
+        option(
+            "format",
+            description="The file format to write. Can be any of: <fg=cyan>parquet, arrow</>",
+            default=CardTableFormat.PARQUET,
+            value_required=True,
+            flag=False,
+        ),
+        option(
+            "output",
+            description="Where to write the file. Defaults to cards.<format> in the bulk data directory.",
+            value_required=True,
+            flag=False,
+        ),
+        option(
+            "bulk-file",
+            description="Export a bulk file instead of the database. Can be any of: <fg=cyan>"
+            + ", ".join(ScryfallBulkFile.list())
+            + "</>",
+            value_required=True,
+            flag=False,
+        ),
+        option(
+            "bulk-data-dir",
+            description="Directory to read bulk files from.",
+            default=str(CONFIG.bulk_file_dir),
+            value_required=True,
+            flag=False,
+        ),
+        option(
+            "batch-size",
+            description="Number of cards to convert and write at a time.",
+            default=10000,
+            value_required=True,
+            flag=False,
+        ),
+    ]
+
+    def handle(self):
+        try:
+            file_format = CardTableFormat(self.option("format").lower())
+        except ValueError:
+            self.line(f"Unknown format: {self.option('format')}")
+            return 1
+
+        bulk_file = None
+        if self.option("bulk-file") is not None:
+            try:
+                bulk_file = ScryfallBulkFile(self.option("bulk-file").lower())
+            except ValueError:
+                self.line(f"Unknown bulk file: {self.option('bulk-file')}")
+                return 1
+
+        output = self.option("output")
+        output = Path(output) if output is not None else Path(self.option("bulk-data-dir")) / f"cards.{file_format}"
+
+        self.line(f"Exporting {bulk_file or 'cards'} to {output}...")
+        export_kwargs = dict(
+            format=file_format,
+            file_type=bulk_file,
+            bulk_file_dir=self.option("bulk-data-dir"),
+            batch_size=int(self.option("batch-size")),
+        )
+        if bulk_file is not None:
+            # NOTE: a bulk file is read from disk, so there's no need to connect to the database
+            total = asyncio.run(export_card_file(output, **export_kwargs))
+        else:
+            with ScoozeApi(cache_size=0) as s:
+                total = s.export_card_file(output, **export_kwargs)
+
+        self.line(f"Exported {total} cards.")
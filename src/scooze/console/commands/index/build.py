@@ -0,0 +1,29 @@
+from cleo.commands.command import Command
+from cleo.helpers import argument
+from scooze.api import ScoozeApi
+from scooze.enums import DbCollection
+
+
+class IndexBuildCommand(Command):
+    name = "index build"
+    description = "Build the declared indexes on collections in the database."
+
+    arguments = [
+        argument(
+            "collections",
+            "Which collections to build indexes on. Defaults to all. Can be any of: <fg=cyan>cards, decks</>",
+            optional=True,
+            multiple=True,
+        )
+    ]
+
+    def handle(self):
+        to_index = [
+            c for c in DbCollection.list() if not self.argument("collections") or c in self.argument("collections")
+        ]
+
+        with ScoozeApi() as s:
+            for collection in to_index:
+                self.line(f"Building indexes on {collection}...")
+                names = s.build_indexes(collection)
+                self.line(f"Built {len(names)} indexes on {collection}: <fg=cyan>{', '.join(names)}</>")
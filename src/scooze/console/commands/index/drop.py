@@ -0,0 +1,28 @@
+from cleo.commands.command import Command
+from cleo.helpers import argument
+from scooze.api import ScoozeApi
+from scooze.enums import DbCollection
+
+
+class IndexDropCommand(Command):
+    name = "index drop"
+    description = "Drop the declared indexes from collections in the database."
+
+    arguments = [
+        argument(
+            "collections",
+            "Which collections to drop indexes from. Defaults to all. Can be any of: <fg=cyan>cards, decks</>",
+            optional=True,
+            multiple=True,
+        )
+    ]
+
+    def handle(self):
+        to_drop = [
+            c for c in DbCollection.list() if not self.argument("collections") or c in self.argument("collections")
+        ]
+
+        with ScoozeApi() as s:
+            for collection in to_drop:
+                names = s.drop_indexes(collection)
+                self.line(f"Dropped {len(names)} indexes from {collection}.")
@@ -0,0 +1,32 @@
+from cleo.commands.command import Command
+from cleo.helpers import argument
+from scooze.api import ScoozeApi
+from scooze.enums import DbCollection
+
+
+class IndexStatusCommand(Command):
+    name = "index status"
+    description = "Compare the declared indexes with those built in the database."
+
+    arguments = [
+        argument(
+            "collections",
+            "Which collections to check. Defaults to all. Can be any of: <fg=cyan>cards, decks</>",
+            optional=True,
+            multiple=True,
+        )
+    ]
+
+    def handle(self):
+        to_check = [
+            c for c in DbCollection.list() if not self.argument("collections") or c in self.argument("collections")
+        ]
+
+        with ScoozeApi() as s:
+            for collection in to_check:
+                self.line(f"<b>{collection}</>")
+                for status in s.get_index_status(collection):
+                    keys = ", ".join(f"{field}: {direction}" for field, direction in status.keys)
+                    state = "<fg=green>built</>" if status.built else "<fg=red>missing</>"
+                    origin = "" if status.declared else " (not declared)"
+                    self.line(f"  {status.name} ({keys}): {state}{origin}")
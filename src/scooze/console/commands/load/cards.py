@@ -3,9 +3,11 @@ from pathlib import Path
 from cleo.commands.command import Command
 from cleo.helpers import option
 from scooze.api import ScoozeApi
-from scooze.bulkdata import download_bulk_data_file_by_type
+from scooze.api.bulkdata import CardSyncResult
+from scooze.bulkdata import download_bulk_data_file_by_type, find_bulk_data_file
 from scooze.catalogs import ScryfallBulkFile
 from scooze.config import CONFIG
+from scooze.enums import BulkLoadEngine
 
 
 class LoadCardsCommand(Command):
@@ -35,9 +37,61 @@ class LoadCardsCommand(Command):
             description="Hide progress logs while loading files.",
             flag=True,
         ),
+        option(
+            "sync",
+            description="Only write changes since the last load, and delete cards that are no longer in the file.",
+            flag=True,
+        ),
+        option(
+            "stream",
+            description="Load files while they download from Scryfall, saving them to the bulk data directory.",
+            flag=True,
+        ),
+        option(
+            "swap",
+            description="Replace all cards in the database with the loaded file, without serving a partial load.",
+            flag=True,
+        ),
+        option(
+            "table-file",
+            description="Load cards from a Parquet or Arrow card table file, as written by 'export cards'.",
+            value_required=True,
+            flag=False,
+        ),
+        option(
+            "batch-size",
+            description="Number of cards to send to the database per insert.",
+            default=5000,
+            value_required=True,
+            flag=False,
+        ),
+        option(
+            "concurrent-inserts",
+            description="Maximum number of database inserts in flight at once.",
+            default=2,
+            value_required=True,
+            flag=False,
+        ),
+        option(
+            "workers",
+            description="Number of processes to validate cards with. Use 0 to validate in the main process.",
+            default=0,
+            value_required=True,
+            flag=False,
+        ),
+        option(
+            "engine",
+            description="How cards are written to the database. Can be any of: <fg=cyan>beanie, raw</>",
+            default=BulkLoadEngine.BEANIE,
+            value_required=True,
+            flag=False,
+        ),
     ]
 
     def handle(self):
+        if self.option("table-file") is not None:
+            return self.load_card_table_file(Path(self.option("table-file")))
+
         to_load: list[ScryfallBulkFile] = []
         load_all = self.option("all")
         load_test = self.option("test") and not load_all
@@ -55,20 +109,44 @@ class LoadCardsCommand(Command):
         if len(to_load) == 0 and not load_test:
             self.line("No files were selected to load.")
 
+        if self.option("swap"):
+            if self.option("sync"):
+                self.line("--swap and --sync cannot be used together.")
+                return 1
+            if len(to_load) + load_test > 1:
+                self.line("--swap replaces all cards, so only one file can be loaded at a time.")
+                return 1
+
+        if self.option("stream") and (self.option("sync") or self.option("swap")):
+            self.line("--stream cannot be used with --sync or --swap.")
+            return 1
+
         loaded_count = 0
+        self.sync_totals = CardSyncResult(inserted=0, updated=0, unchanged=0, deleted=0)
         with ScoozeApi() as s:
             for bulk_file in to_load:
+                if self.option("stream"):
+                    self.line(f"Streaming {bulk_file} from Scryfall...")
+                    loaded_count += s.stream_card_file(
+                        bulk_file,
+                        self.option("bulk-data-dir"),
+                        show_progress=not self.option("concise"),
+                        batch_size=int(self.option("batch-size")),
+                        max_concurrent_inserts=int(self.option("concurrent-inserts")),
+                        workers=int(self.option("workers")),
+                        engine=BulkLoadEngine(self.option("engine").lower()),
+                    )
+                    continue
+
                 if self.option("force-download"):
                     self.line(f"Downloading {bulk_file} from Scryfall...")
                     download_bulk_data_file_by_type(bulk_file, self.option("bulk-data-dir"))
 
                 try:
                     self.line(
-                        f"Reading from Scryfall data in: {Path(self.option('bulk-data-dir'), bulk_file + '.json')}"
-                    )
-                    loaded_count += s.load_card_file(
-                        bulk_file, self.option("bulk-data-dir"), show_progress=not self.option("concise")
+                        f"Reading from Scryfall data in: {find_bulk_data_file(bulk_file, self.option('bulk-data-dir'))}"
                     )
+                    loaded_count += self.load_card_file(s, bulk_file, self.option("bulk-data-dir"))
                 except FileNotFoundError:
                     if not self.confirm(f"{bulk_file} file not found; would you like to download it now?"):
                         self.line("Skipping...")
@@ -76,14 +154,61 @@ class LoadCardsCommand(Command):
 
                     self.line(f"Downloading {bulk_file} from Scryfall...")
                     download_bulk_data_file_by_type(bulk_file, self.option("bulk-data-dir"))
-                    loaded_count += s.load_card_file(
-                        bulk_file, self.option("bulk-data-dir"), show_progress=not self.option("concise")
-                    )
+                    loaded_count += self.load_card_file(s, bulk_file, self.option("bulk-data-dir"))
 
             if load_test:
                 self.line(f"Reading from Scryfall data in: {Path('data/test/default_cards.json')}")
-                loaded_count += s.load_card_file(
-                    ScryfallBulkFile.DEFAULT, "./data/test", show_progress=not self.option("concise")
-                )
+                loaded_count += self.load_card_file(s, ScryfallBulkFile.DEFAULT, "./data/test")
+
+        if self.option("sync"):
+            inserted, updated, unchanged, deleted = self.sync_totals
+            self.line(
+                f"Synced {loaded_count} cards to the database: "
+                f"{inserted} inserted, {updated} updated, {unchanged} unchanged, {deleted} deleted."
+            )
+        else:
+            self.line(f"Loaded {loaded_count} cards to the database.")
+
+    def load_card_file(self, s: ScoozeApi, bulk_file: ScryfallBulkFile, bulk_file_dir: str) -> int:
+        if self.option("sync"):
+            result = s.sync_card_file(
+                bulk_file,
+                bulk_file_dir,
+                show_progress=not self.option("concise"),
+                batch_size=int(self.option("batch-size")),
+                max_concurrent_inserts=int(self.option("concurrent-inserts")),
+                workers=int(self.option("workers")),
+            )
+            self.sync_totals = CardSyncResult(*(total + count for total, count in zip(self.sync_totals, result)))
+            return result.inserted + result.updated + result.unchanged
+
+        return s.load_card_file(
+            bulk_file,
+            bulk_file_dir,
+            show_progress=not self.option("concise"),
+            batch_size=int(self.option("batch-size")),
+            max_concurrent_inserts=int(self.option("concurrent-inserts")),
+            workers=int(self.option("workers")),
+            engine=BulkLoadEngine(self.option("engine").lower()),
+            swap=self.option("swap"),
+        )
 
+    def load_card_table_file(self, table_file: Path) -> int | None:
+        if self.option("sync") or self.option("swap") or self.option("stream"):
+            self.line("--table-file cannot be used with --sync, --swap, or --stream.")
+            return 1
+        if not table_file.is_file():
+            self.line(f"Card table file not found: {table_file}")
+            return 1
+
+        self.line(f"Reading from card table file: {table_file}")
+        with ScoozeApi() as s:
+            loaded_count = s.load_card_table_file(
+                table_file,
+                show_progress=not self.option("concise"),
+                batch_size=int(self.option("batch-size")),
+                max_concurrent_inserts=int(self.option("concurrent-inserts")),
+                workers=int(self.option("workers")),
+                engine=BulkLoadEngine(self.option("engine").lower()),
+            )
         self.line(f"Loaded {loaded_count} cards to the database.")
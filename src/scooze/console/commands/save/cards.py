@@ -3,6 +3,7 @@ from cleo.helpers import option
 from scooze.bulkdata import download_bulk_data_file_by_type
 from scooze.catalogs import ScryfallBulkFile
 from scooze.config import CONFIG
+from scooze.enums import BulkFileCompression
 
 
 class SaveCardsCommand(Command):
@@ -22,6 +23,17 @@ class SaveCardsCommand(Command):
             value_required=True,
             flag=False,
         ),
+        option(
+            "force",
+            description="Download files even if the saved ones are already up to date.",
+            flag=True,
+        ),
+        option(
+            "compression",
+            description="Compress saved files. Can be any of: <fg=cyan>gzip, zstd</>",
+            value_required=True,
+            flag=False,
+        ),
     ]
 
     def handle(self):
@@ -37,6 +49,15 @@ class SaveCardsCommand(Command):
             if self.option("prints"):
                 to_save.append(ScryfallBulkFile.DEFAULT)
 
+        compression = BulkFileCompression(self.option("compression").lower()) if self.option("compression") else None
+
         for bulk_file in to_save:
             self.line(f"Downloading {bulk_file} from Scryfall...")
-            download_bulk_data_file_by_type(bulk_file, self.option("bulk-data-dir"))
+            downloaded = download_bulk_data_file_by_type(
+                bulk_file,
+                self.option("bulk-data-dir"),
+                force=self.option("force"),
+                compression=compression,
+            )
+            if not downloaded:
+                self.line(f"{bulk_file} is already up to date.")
@@ -0,0 +1,31 @@
+from pathlib import Path
+
+from cleo.commands.command import Command
+from cleo.helpers import option
+from scooze.api import ScoozeApi
+from scooze.config import CONFIG
+from scooze.snapshot import build_snapshot
+
+
+class SnapshotBuildCommand(Command):
+    name = "snapshot build"
+    description = "Write the cards in the database to a snapshot file that can be opened without the database."
+
+    options = [
+        option(
+            "output",
+            description="Where to write the snapshot.",
+            default=CONFIG.snapshot_path,
+            value_required=True,
+            flag=False,
+        ),
+    ]
+
+    def handle(self):
+        output = Path(self.option("output"))
+        self.line(f"Writing snapshot to {output}...")
+
+        with ScoozeApi(cache_size=0) as s:
+            total = build_snapshot(s.iter_cards_all(), output)
+
+        self.line(f"Wrote {total} cards.")
@@ -1,4 +1,4 @@
-from enum import Enum, EnumMeta, StrEnum
+from enum import Enum, EnumMeta, StrEnum, auto
 
 # region Enum Extensions
 
@@ -9,9 +9,21 @@ class CaseInsensitiveEnumMeta(EnumMeta):
     fields.
     """
 
+    def __new__(metacls, cls, bases, classdict, **kwds):
+        enum_class = super().__new__(metacls, cls, bases, classdict, **kwds)
+        # Lookup tables, built once so that normalizing a value or name doesn't scan the members
+        enum_class._values = tuple(member.value for member in enum_class)
+        enum_class._members_by_folded_name = {
+            name.casefold(): member for name, member in enum_class.__members__.items()
+        }
+        return enum_class
+
     def __getitem__(self, item):
         if isinstance(item, str):
-            item = item.upper()
+            try:
+                return self._members_by_folded_name[item.casefold()]
+            except KeyError:
+                raise KeyError(item) from None
         return super().__getitem__(item)
 
 
@@ -26,7 +38,32 @@ class ExtendedEnum(Enum, metaclass=CaseInsensitiveEnumMeta):
         """
         Get a list of this Enum's field names.
         """
-        return list(map(lambda c: c.value, cls))
+        return list(cls._values)
+
+    @classmethod
+    def has_value(cls, value) -> bool:
+        """
+        Check whether a value is the value of one of this Enum's fields.
+        """
+        try:
+            return value in cls._value2member_map_
+        except TypeError:
+            # Unhashable values can't be field values
+            return False
+
+    @classmethod
+    def from_value_or_name(cls, value):
+        """
+        Get the field with the given value, or failing that, the given
+        case-insensitive name.
+
+        Raises:
+            KeyError: If no field has the given value or name.
+        """
+        try:
+            return cls._value2member_map_[value]
+        except (KeyError, TypeError):
+            return cls[value]
 
 
 # endregion
@@ -44,4 +81,31 @@ class DbCollection(ExtendedEnum, StrEnum):
     DECKS = "decks"
 
 
+class BulkLoadEngine(ExtendedEnum, StrEnum):
+    """
+    Methods of writing bulk data to the scooze database.
+    """
+
+    BEANIE = auto()  # Validated Beanie documents, inserted through the ODM.
+    RAW = auto()  # Validated dicts, inserted directly through Motor.
+
+
+class BulkFileCompression(ExtendedEnum, StrEnum):
+    """
+    Formats for compressing bulk files stored on disk.
+    """
+
+    GZIP = auto()  # Stored as .json.gz.
+    ZSTD = auto()  # Stored as .json.zst. Requires the `zstd` extra.
+
+
+class CardTableFormat(ExtendedEnum, StrEnum):
+    """
+    File formats for exporting cards as a columnar table.
+    """
+
+    ARROW = auto()  # An Arrow IPC file. Requires the `pyarrow` package.
+    PARQUET = auto()  # A Parquet file. Requires the `pyarrow` package.
+
+
 # endregion
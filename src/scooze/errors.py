@@ -1,5 +1,17 @@
-__all__ = ("BulkAddError",)
+__all__ = (
+    "BulkAddError",
+    "BulkDownloadError",
+    "SnapshotFormatError",
+)
 
 
 class BulkAddError(BaseException):
     pass
+
+
+class BulkDownloadError(BaseException):
+    pass
+
+
+class SnapshotFormatError(BaseException):
+    pass
@@ -7,6 +7,7 @@ from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
 from scooze.config import CONFIG
 from scooze.models.card import CardModel
+from scooze.models.deck import DeckModel
 from scooze.mongo import db, mongo_close, mongo_connect
 from scooze.routers.card import router as CardRouter
 from scooze.routers.cards import router as CardsRouter
@@ -19,7 +20,12 @@ from scooze.routers.decks import router as DecksRouter
 async def lifespan(app: FastAPI):
     # Setup Mongo and Beanie
     await mongo_connect()
-    await init_beanie(database=db.client[CONFIG.mongo_db], document_models=[CardModel])
+    await init_beanie(
+        database=db.client[CONFIG.mongo_db],
+        document_models=[CardModel, DeckModel],
+        # NOTE: indexes are only built by scooze.api.index, so dropped indexes stay dropped
+        skip_indexes=True,
+    )
 
     # Yield to the app
     yield
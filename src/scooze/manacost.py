@@ -0,0 +1,105 @@
+import re
+from collections.abc import Iterable
+from functools import lru_cache
+from typing import NamedTuple
+
+from frozendict import frozendict
+from scooze.catalogs import Color, CostSymbol
+
+# The number of distinct costs kept parsed. Only a few thousand distinct mana costs have ever been printed.
+PARSED_COST_CACHE_SIZE = 8192
+
+# Matches each symbol of form {W}, {W/P}, etc, capturing the text inside the braces.
+SYMBOL_PATTERN = re.compile(r"{([^}]+)}")
+
+# Every CostSymbol by its text, so parsing a cost doesn't construct Enums.
+SYMBOLS: dict[str, CostSymbol] = {symbol.value: symbol for symbol in CostSymbol}
+
+_COLORS: dict[str, Color] = {color.value: color for color in Color if color != Color.COLORLESS}
+
+
+class SymbolInfo(NamedTuple):
+    """
+    Facts about a CostSymbol, precomputed for every symbol in `SYMBOL_INFO`.
+    """
+
+    mana_value: float
+    colors: frozenset[Color]
+
+
+SYMBOL_INFO: dict[CostSymbol, SymbolInfo] = {
+    symbol: SymbolInfo(
+        mana_value=symbol.mana_value_contribution,
+        colors=frozenset(_COLORS[c] for c in symbol.value if c in _COLORS),
+    )
+    for symbol in CostSymbol
+}
+
+
+class ParsedCost(NamedTuple):
+    """
+    A parsed cost string.
+
+    Attributes:
+        symbols: The number of times each symbol appears in the cost.
+        mana_value: The total mana value of the symbols.
+        colors: The colors of the symbols.
+    """
+
+    symbols: frozendict[CostSymbol, int]
+    mana_value: float
+    colors: frozenset[Color]
+
+
+EMPTY_COST = ParsedCost(symbols=frozendict(), mana_value=0, colors=frozenset())
+
+
+@lru_cache(maxsize=PARSED_COST_CACHE_SIZE)
+def parse_cost(cost: str | None) -> ParsedCost:
+    """
+    Parse a string containing one or more cost symbols, in standard oracle
+    text form (e.g. "{4}{G}"). Results are cached for each distinct string.
+
+    Args:
+        cost: String representing a mana cost, or rules text that may have
+            one or more symbols. None is treated as an empty cost.
+
+    Returns:
+        The parsed cost.
+
+    Raises:
+        ValueError: If the string has a symbol that is not a CostSymbol.
+    """
+
+    if not cost:
+        return EMPTY_COST
+
+    symbols: dict[CostSymbol, int] = {}
+    for text in SYMBOL_PATTERN.findall(cost):
+        symbol = SYMBOLS.get(text) or CostSymbol(text)
+        symbols[symbol] = symbols.get(symbol, 0) + 1
+
+    return ParsedCost(
+        symbols=frozendict(symbols),
+        mana_value=sum(SYMBOL_INFO[symbol].mana_value * count for symbol, count in symbols.items()),
+        colors=frozenset().union(*(SYMBOL_INFO[symbol].colors for symbol in symbols)),
+    )
+
+
+def parse_costs(costs: Iterable[str | None]) -> list[ParsedCost]:
+    """
+    Parse a column of cost strings, such as the mana costs of every card in a
+    list. Each distinct string is parsed once.
+
+    Args:
+        costs: The cost strings to parse.
+
+    Returns:
+        The parsed costs, in the same order.
+
+    Raises:
+        ValueError: If a string has a symbol that is not a CostSymbol.
+    """
+
+    parsed: dict[str | None, ParsedCost] = {}
+    return [parsed[cost] if cost in parsed else parsed.setdefault(cost, parse_cost(cost)) for cost in costs]
@@ -1,5 +1,5 @@
 from datetime import date
-from typing import Any, Callable
+from typing import Any, Callable, Mapping, Self
 
 from pydantic import (
     AliasChoices,
@@ -9,6 +9,7 @@ from pydantic import (
     field_serializer,
     field_validator,
 )
+from pymongo import IndexModel
 from scooze.cardparts import (
     CardFace,
     ImageUris,
@@ -628,9 +629,47 @@ class CardModel(ScoozeDocument, CardModelData):
         }
     )
 
+    @classmethod
+    def from_data(cls, data: CardModelData | Mapping[str, Any]) -> Self:
+        """
+        Build a CardModel that is ready to insert into the database, validating
+        the given data at most once.
+
+        Args:
+            data: Scryfall JSON, a mapping of Card fields, or an already
+                validated CardModelData.
+
+        Returns:
+            A validated CardModel.
+
+        Raises:
+            ValidationError: If the given data is not a valid card.
+        """
+
+        if isinstance(data, CardModelData):
+            # NOTE: CardModelData has already been validated, so it only needs to be copied over
+            return cls.model_construct(**dict(data))
+
+        if "id" in data:
+            # Scryfall's `id` is this card's Scryfall ID, not the database `_id` that CardModel would read it as
+            scryfall_id = data["id"]
+            data = {k: v for k, v in data.items() if k != "id"}
+            if "scryfall_id" not in data and "scryfallId" not in data:
+                data["scryfall_id"] = scryfall_id
+
+        return cls.model_validate(data)
+
     class Settings:
         name = DbCollection.CARDS
         validate_on_save = True
         bson_encoders = {
             date: encode_date,
         }
+        indexes = [
+            IndexModel("name", name="name"),
+            IndexModel("oracleId", name="oracle_id"),
+            IndexModel("scryfallId", name="scryfall_id"),
+            IndexModel("set", name="set"),
+            IndexModel("legalities.$**", name="legalities"),
+            IndexModel("colorIdentity", name="color_identity"),
+        ]
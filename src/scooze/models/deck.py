@@ -2,6 +2,7 @@ from collections import Counter
 from datetime import date
 
 from pydantic import ConfigDict, Field, field_serializer, model_validator
+from pymongo import IndexModel
 from scooze.catalogs import Format
 from scooze.enums import DbCollection
 from scooze.models.utils import ObjectIdT, ScoozeBaseModel, ScoozeDocument
@@ -136,3 +137,8 @@ class DeckModel(ScoozeDocument, DeckModelData):
         bson_encoders = {
             date: encode_date,
         }
+        indexes = [
+            IndexModel("archetype", name="archetype"),
+            IndexModel("format", name="format"),
+            IndexModel("datePlayed", name="date_played"),
+        ]
@@ -1,5 +1,7 @@
+import types
 from datetime import date
-from typing import Annotated, Any, TypeAlias
+from enum import Enum
+from typing import Annotated, Any, TypeAlias, Union, get_args, get_origin
 
 from beanie import Document, PydanticObjectId
 from bson import ObjectId as BsonObjectId
@@ -86,3 +88,68 @@ class ObjectIdPydanticAnnotation:
 ObjectIdT: TypeAlias = Annotated[BsonObjectId, ObjectIdPydanticAnnotation]
 
 # endregion
+
+# region Field Annotations
+
+# The types a model field's annotation is classified by, in the order they are checked. Enums come before the types
+# they are based on, and bools before ints.
+FIELD_BASE_TYPES: tuple[type, ...] = (Enum, bool, int, float, date, str, BaseModel)
+
+
+def unwrap_optional(annotation: Any) -> Any:
+    """
+    Find the type an optional annotation allows besides None.
+
+    Args:
+        annotation: A model field's annotation, like `str | None`.
+
+    Returns:
+        The annotation without None, or the annotation as it is if it isn't
+        optional.
+    """
+
+    if get_origin(annotation) in (Union, types.UnionType):
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(args) == 1:
+            return args[0]
+    return annotation
+
+
+def collection_item(annotation: Any) -> Any | None:
+    """
+    Find the annotation of a list or set annotation's items.
+
+    Args:
+        annotation: A model field's annotation, without None.
+
+    Returns:
+        The annotation of the items, or None if the annotation isn't a list
+        or set.
+    """
+
+    if get_origin(annotation) in (list, set):
+        (item_annotation,) = get_args(annotation)
+        return item_annotation
+    return None
+
+
+def field_base_type(annotation: Any) -> type | None:
+    """
+    Classify an annotation by the first of `FIELD_BASE_TYPES` it is a
+    subclass of.
+
+    Args:
+        annotation: A model field's annotation, without None.
+
+    Returns:
+        One of `FIELD_BASE_TYPES`, or None if the annotation is none of them.
+    """
+
+    if isinstance(annotation, type):
+        for base_type in FIELD_BASE_TYPES:
+            if issubclass(annotation, base_type):
+                return base_type
+    return None
+
+
+# endregion
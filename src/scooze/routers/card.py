@@ -74,7 +74,7 @@ async def add_card(card_data: CardModelData) -> CardModel:
 
     try:
         # NOTE: would like to add the dupe protection back in
-        card = CardModel.model_validate(card_data.model_dump())
+        card = CardModel.from_data(card_data)
 
         return await card.create()
     except Exception as e:
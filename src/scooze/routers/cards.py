@@ -2,7 +2,7 @@ from http import HTTPStatus
 from typing import Any
 
 from beanie import PydanticObjectId
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query
 from fastapi.responses import JSONResponse
 from scooze.models.card import CardModel, CardModelData
 from scooze.utils import to_lower_camel
@@ -56,7 +56,7 @@ async def add_cards(cards: list[CardModelData]) -> JSONResponse:
     """
 
     try:
-        cards_to_insert = [CardModel.model_validate(card.model_dump()) for card in cards]
+        cards_to_insert = [CardModel.from_data(card) for card in cards]
         insert_result = await CardModel.insert_many(cards_to_insert)
         return JSONResponse(f"Created {len(insert_result.inserted_ids)} card(s).")
     except Exception as e:
@@ -73,6 +73,7 @@ async def get_cards_by(
     paginated: bool = False,
     page: int = 1,
     page_size: int = 10,
+    fields: list[str] | None = Query(default=None),
 ) -> list[CardModel]:
     """
     Get cards where the given property matches any of the given values.
@@ -83,6 +84,8 @@ async def get_cards_by(
         paginated: Return paginated results if True, or all matches if False.
         page: The page to return matches from.
         page_size: The number of results per page.
+        fields: The properties to fetch for each match. If given, all other
+            properties are left at their defaults.
 
     Returns:
         A list of cards matching the search criteria.
@@ -101,7 +104,13 @@ async def get_cards_by(
 
     skip = (page - 1) * page_size if paginated else 0
     limit = page_size if paginated else None
-    cards = await CardModel.find({"$or": [{prop_name: v} for v in vals]}, skip=skip, limit=limit).to_list()
+    query = {prop_name: {"$in": vals}}
+    if fields is None:
+        cards = await CardModel.find(query, skip=skip, limit=limit).to_list()
+    else:
+        projection = {"_id" if field in ("_id", "id") else to_lower_camel(field): 1 for field in fields}
+        cursor = CardModel.get_motor_collection().find(query, projection, skip=skip, limit=limit or 0)
+        cards = [CardModel.model_validate(doc) async for doc in cursor]
 
     if len(cards) == 0:
         raise HTTPException(status_code=HTTPStatus.NOT_FOUND, detail="Cards not found.")
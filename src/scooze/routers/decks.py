@@ -2,7 +2,9 @@ from http import HTTPStatus
 from typing import Any
 
 from beanie import PydanticObjectId
-from fastapi import APIRouter, HTTPException
+from bson import ObjectId
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.encoders import jsonable_encoder
 from fastapi.responses import JSONResponse
 from scooze.models.deck import DeckModel, DeckModelData
 from scooze.utils import to_lower_camel
@@ -70,6 +72,7 @@ async def get_decks_by(
     paginated: bool = False,
     page: int = 1,
     page_size: int = 10,
+    fields: list[str] | None = Query(default=None),
 ) -> list[DeckModel]:
     """
     Get decks where the given property matches any of the given values.
@@ -80,6 +83,8 @@ async def get_decks_by(
         paginated: Return paginated results if True, or all matches if False.
         page: The page to return matches from.
         page_size: The number of results per page.
+        fields: The properties to fetch for each match. If given, only those
+            properties are returned, without validating the decks.
 
     Returns:
         A list of decks matching the search criteria.
@@ -98,11 +103,21 @@ async def get_decks_by(
 
     skip = (page - 1) * page_size if paginated else 0
     limit = page_size if paginated else None
-    decks = await DeckModel.find({"$or": [{prop_name: v} for v in vals]}, skip=skip, limit=limit).to_list()
+    query = {prop_name: {"$in": vals}}
+    if fields is None:
+        decks = await DeckModel.find(query, skip=skip, limit=limit).to_list()
+    else:
+        projection = {"_id" if field in ("_id", "id") else to_lower_camel(field): 1 for field in fields}
+        cursor = DeckModel.get_motor_collection().find(query, projection, skip=skip, limit=limit or 0)
+        decks = [doc async for doc in cursor]
 
     if len(decks) == 0:
         raise HTTPException(status_code=HTTPStatus.NOT_FOUND, detail="Decks not found.")
 
+    if fields is not None:
+        # NOTE: a projected deck is missing the cards DeckModel's validators count, so it's returned as it was stored
+        return JSONResponse(jsonable_encoder(decks, custom_encoder={ObjectId: str}))
+
     return decks
 
 
@@ -0,0 +1,571 @@
+import json
+import math
+import mmap
+import os
+import shutil
+import struct
+import sys
+import tempfile
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+from datetime import date
+from enum import Enum
+from functools import cache, cached_property, partial
+from pathlib import Path
+from typing import Any, Callable, NamedTuple, get_origin
+
+from pydantic import BaseModel
+from scooze.card import Card, CardNormalizer
+from scooze.catalogs import Format, Legality
+from scooze.config import CONFIG
+from scooze.errors import SnapshotFormatError
+from scooze.models.card import CardModelData
+from scooze.models.utils import collection_item, field_base_type, unwrap_optional
+from scooze.utils import HashableObject
+
+# A snapshot file is laid out as:
+#   header     magic, version, card count, column count
+#   directory  for each column: name, type, and the offset and size of its data
+#   strings    the string table: (count + 1) offsets into a blob of UTF-8 strings, then the blob
+#   columns    each column's data, one value per card
+# All integers are little-endian, and every section starts on an 8-byte boundary so it can be read in place.
+SNAPSHOT_MAGIC = b"SCZSNAP\x00"
+SNAPSHOT_VERSION = 1
+
+_HEADER = struct.Struct("<8sIII4x")
+_DIRECTORY_ENTRY = struct.Struct("<64scxxxxxxxQQ")
+_STRING_ID = struct.Struct("<I")
+
+# Column types. STRING columns hold an index into the string table for each card, FLOAT and INT columns hold the
+# value itself, TEXT columns hold (count + 1) offsets into a blob of UTF-8 text that follows them, and LIST columns
+# hold (count + 1) offsets into an array of string table indexes that follows them.
+STRING = b"s"
+FLOAT = b"d"
+INT = b"q"
+TEXT = b"t"
+LIST = b"l"
+
+# Stands in for None in each type of fixed-width column.
+NULL_STRING = 0xFFFFFFFF
+NULL_INT = -(1 << 63)
+# Marks a None TEXT or LIST value, in the top bit of the offset where it would have ended.
+_NULL_OFFSET_BIT = 1 << 63
+
+# Card fields with long, mostly unique text, stored as TEXT rather than in the string table.
+TEXT_FIELDS = ("oracle_text", "flavor_text", "printed_text")
+
+
+# region Columns
+
+
+class _Column(NamedTuple):
+    # The column's name in the file. Parts of a card like its prices get a column per attribute, named
+    # "<field>.<attribute>", after a column named for the field that marks whether the card has the part at all.
+    name: str
+    column_type: bytes
+    # How the column's values are read back: "str", "int", "bool", "float", "date", "str_list", "int_list",
+    # "json", or "part" for the marker column of a card part.
+    kind: str
+    field: str
+    attribute: str | None = None
+    # Turns the value read back into the value Card holds, for fields Card normalizes.
+    convert: Callable[[Any], Any] | None = None
+
+
+def _converter(field: str, annotation: Any) -> Callable[[Any], Any] | None:
+    if (item_annotation := collection_item(annotation)) is not None:
+        item_base_type = field_base_type(item_annotation)
+        if item_base_type is BaseModel:
+            # card_faces and all_parts
+            return getattr(CardNormalizer, f"to_{field}")
+        enum = item_annotation if item_base_type is Enum else None
+        if get_origin(annotation) is set:
+            return partial(CardNormalizer.to_frozenset, convert_to_enum=enum)
+        return partial(CardNormalizer.to_tuple, convert_to_enum=enum)
+    base_type = field_base_type(annotation)
+    if base_type is Enum:
+        return annotation.from_value_or_name
+    if base_type is BaseModel:
+        # image_uris, preview, prices, purchase_uris, and related_uris
+        return getattr(CardNormalizer, f"to_{field}")
+    return None
+
+
+def _scalar_column(name: str, annotation: Any, field: str, attribute: str | None = None) -> _Column:
+    annotation = unwrap_optional(annotation)
+    convert = _converter(field, annotation) if attribute is None else None
+    if (item_annotation := collection_item(annotation)) is not None:
+        item_base_type = field_base_type(item_annotation)
+        if item_base_type is BaseModel:
+            return _Column(name, TEXT, "json", field, attribute, convert)
+        if item_base_type is int:
+            return _Column(name, LIST, "int_list", field, attribute, convert)
+        return _Column(name, LIST, "str_list", field, attribute, convert)
+    base_type = field_base_type(annotation)
+    if base_type is bool:
+        return _Column(name, INT, "bool", field, attribute, convert)
+    if base_type is int:
+        return _Column(name, INT, "int", field, attribute, convert)
+    if base_type is float:
+        return _Column(name, FLOAT, "float", field, attribute, convert)
+    if base_type is date:
+        return _Column(name, INT, "date", field, attribute, convert)
+    if field in TEXT_FIELDS:
+        return _Column(name, TEXT, "str", field, attribute, convert)
+    return _Column(name, STRING, "str", field, attribute, convert)
+
+
+@cache
+def _columns() -> tuple[_Column, ...]:
+    columns = [_Column("scooze_id", STRING, "str", "scooze_id", convert=CardNormalizer.to_id)]
+    for name, field in CardModelData.model_fields.items():
+        annotation = unwrap_optional(field.annotation)
+        if name == "legalities":
+            convert = partial(CardNormalizer.to_frozendict, convert_key_to_enum=Format, convert_value_to_enum=Legality)
+            columns.append(_Column(name, INT, "part", name, convert=convert))
+            columns.extend(_Column(f"{name}.{fmt}", STRING, "str", name, fmt) for fmt in Format)
+        elif field_base_type(annotation) is BaseModel:
+            columns.append(_Column(name, INT, "part", name, convert=_converter(name, annotation)))
+            columns.extend(
+                _scalar_column(f"{name}.{attribute}", part_field.annotation, name, attribute)
+                for attribute, part_field in annotation.model_fields.items()
+            )
+        else:
+            columns.append(_scalar_column(name, annotation, name))
+    return tuple(columns)
+
+
+def snapshot_columns() -> dict[str, bytes]:
+    """
+    The columns written to every snapshot, in file order.
+
+    Returns:
+        The type of each column, keyed by name.
+    """
+
+    return {column.name: column.column_type for column in _columns()}
+
+
+def _to_json(value: Any) -> Any:
+    match value:
+        case HashableObject():
+            return value.__dict__
+        case frozenset() | set():
+            return list(value)
+        case date():
+            return value.isoformat()
+        case Enum():
+            return value.value
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _card_value(card: Card, column: _Column) -> Any:
+    value = getattr(card, column.field)
+    if column.attribute is not None:
+        if value is None:
+            return None
+        value = value.get(column.attribute) if column.field == "legalities" else getattr(value, column.attribute)
+    if value is None:
+        return None
+
+    match column.kind:
+        case "part":
+            return 1
+        case "str":
+            return str(value)
+        case "bool" | "int":
+            return int(value)
+        case "date":
+            return value.toordinal()
+        case "str_list" | "int_list":
+            return [str(item) for item in value]
+        case "json":
+            return json.dumps(value, default=_to_json, separators=(",", ":"))
+    return value
+
+
+def _from_column(value: Any, kind: str) -> Any:
+    if value is None:
+        return None
+
+    match kind:
+        case "bool":
+            return bool(value)
+        case "date":
+            return date.fromordinal(value)
+        case "int_list":
+            return [int(item) for item in value]
+        case "json":
+            return json.loads(value)
+    return value
+
+
+# endregion
+
+# region Writing
+
+
+class _ColumnWriter:
+    """
+    Spills one column's data to temporary files as cards are added, so a
+    snapshot can be built without holding its columns in memory.
+    """
+
+    def __init__(self, column_type: bytes):
+        self.column_type = column_type
+        self.data = tempfile.TemporaryFile()
+        self.offsets = None
+        self._end = 0
+        if column_type in (TEXT, LIST):
+            self.offsets = tempfile.TemporaryFile()
+            self.offsets.write(struct.pack("<Q", 0))
+
+    def append(self, value: Any, strings: "_StringTable") -> None:
+        if self.column_type == STRING:
+            self.data.write(struct.pack("<I", NULL_STRING if value is None else strings.id(value)))
+        elif self.column_type == FLOAT:
+            self.data.write(struct.pack("<d", math.nan if value is None else float(value)))
+        elif self.column_type == INT:
+            self.data.write(struct.pack("<q", NULL_INT if value is None else value))
+        elif value is None:
+            self.offsets.write(struct.pack("<Q", self._end | _NULL_OFFSET_BIT))
+        else:
+            if self.column_type == TEXT:
+                data = value.encode("utf-8")
+                self._end += len(data)
+            else:
+                data = struct.pack(f"<{len(value)}I", *(strings.id(item) for item in value))
+                self._end += len(value)
+            self.data.write(data)
+            self.offsets.write(struct.pack("<Q", self._end))
+
+    @property
+    def size(self) -> int:
+        return sum(f.tell() for f in (self.offsets, self.data) if f is not None)
+
+    def copy_to(self, f) -> None:
+        for source in (self.offsets, self.data):
+            if source is not None:
+                source.seek(0)
+                shutil.copyfileobj(source, f)
+
+    def close(self) -> None:
+        for f in (self.offsets, self.data):
+            if f is not None:
+                f.close()
+
+
+class _StringTable:
+    """
+    The distinct strings in a snapshot, with their text spilled to a
+    temporary file as they are added.
+    """
+
+    def __init__(self):
+        self._ids: dict[str, int] = {}
+        self.writer = _ColumnWriter(TEXT)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def id(self, value: str) -> int:
+        if (string_id := self._ids.get(value)) is None:
+            string_id = self._ids[value] = len(self._ids)
+            self.writer.append(value, self)
+        return string_id
+
+
+def _pad(f) -> None:
+    f.write(b"\x00" * (-f.tell() % 8))
+
+
+def build_snapshot(cards: Iterable[Card], path: Path = CONFIG.snapshot_path) -> int:
+    """
+    Write cards to a snapshot file, replacing any snapshot already at the
+    given path once the new one is complete. Each column is spilled to a
+    temporary file as cards are read, so only the distinct strings are held
+    in memory.
+
+    Args:
+        cards: The cards to write.
+        path: Where to write the snapshot.
+
+    Returns:
+        The number of cards written.
+    """
+
+    columns = _columns()
+    strings = _StringTable()
+    writers = [_ColumnWriter(column.column_type) for column in columns]
+    try:
+        count = 0
+        for card in cards:
+            for column, writer in zip(columns, writers):
+                writer.append(_card_value(card, column), strings)
+            count += 1
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        part_file = path.with_name(path.name + ".part")
+        with part_file.open("wb") as f:
+            f.write(_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, count, len(columns)))
+
+            # Every section's offset is known from the sizes of the ones before it
+            offset = _HEADER.size + _DIRECTORY_ENTRY.size * (len(columns) + 1)
+            f.write(_DIRECTORY_ENTRY.pack(b"", STRING, offset, len(strings)))
+            offset += strings.writer.size + (-strings.writer.size % 8)
+            for column, writer in zip(columns, writers):
+                f.write(_DIRECTORY_ENTRY.pack(column.name.encode(), column.column_type, offset, writer.size))
+                offset += writer.size + (-writer.size % 8)
+
+            for writer in (strings.writer, *writers):
+                writer.copy_to(f)
+                _pad(f)
+        os.replace(part_file, path)
+    finally:
+        for writer in (strings.writer, *writers):
+            writer.close()
+
+    return count
+
+
+# endregion
+
+
+class CardSnapshot(Sequence[Card]):
+    """
+    A read-only sequence of the cards in a snapshot file. The file is
+    memory-mapped, so processes that open the same snapshot share one copy in
+    the page cache, and each Card is only built from its columns when it is
+    accessed.
+
+    Example:
+        ``` python
+        with CardSnapshot() as snapshot:
+            total_cmc = sum(cmc for cmc in snapshot.column("cmc") if not math.isnan(cmc))
+            black_lotus = snapshot[snapshot.find("name", "Black Lotus")[0]]
+        ```
+
+    Raises:
+        SnapshotFormatError: If the file is not a snapshot this version of
+            scooze can read.
+    """
+
+    def __init__(self, path: Path = CONFIG.snapshot_path):
+        self.path = path
+        with open(path, "rb") as f:
+            try:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Empty files can't be mapped
+                raise SnapshotFormatError(f"{path} is not a scooze snapshot.")
+
+        try:
+            magic, version, self._count, column_count = _HEADER.unpack_from(self._mmap)
+        except struct.error:
+            magic = None
+        if magic != SNAPSHOT_MAGIC:
+            self.close()
+            raise SnapshotFormatError(f"{path} is not a scooze snapshot.")
+        if version != SNAPSHOT_VERSION:
+            self.close()
+            raise SnapshotFormatError(f"{path} is a version {version} snapshot; expected {SNAPSHOT_VERSION}.")
+
+        self._columns: dict[str, tuple[bytes, int, int]] = {}
+        for i in range(column_count + 1):
+            name, column_type, offset, size = _DIRECTORY_ENTRY.unpack_from(
+                self._mmap, _HEADER.size + i * _DIRECTORY_ENTRY.size
+            )
+            self._columns[name.rstrip(b"\x00").decode()] = (column_type, offset, size)
+        _, strings_offset, self._string_count = self._columns.pop("")
+        self._strings_offset = strings_offset
+        self._strings: dict[int, str] = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self) -> None:
+        """
+        Unmap the snapshot file.
+        """
+
+        self._mmap.close()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> Card:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._count))]
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("snapshot index out of range")
+
+        # NOTE: values are converted to the types Card holds as they are read, so the Card's fields are set
+        # directly rather than normalized again by Card.__init__. The card is new, so it has no caches to invalidate.
+        card = Card.__new__(Card)
+        parts: dict[str, dict[str, Any] | None] = {}
+        for column, column_type, offset in self._layout:
+            if column.attribute is not None:
+                if (part := parts[column.field]) is not None:
+                    if (value := _from_column(self._read(column_type, offset, index), column.kind)) is not None:
+                        part[column.attribute] = value
+                continue
+
+            if column_type == STRING:
+                # Most columns are STRING columns, so they are read here rather than through _read
+                (string_id,) = _STRING_ID.unpack_from(self._mmap, offset + 4 * index)
+                value = self._strings.get(string_id) or self._string(string_id)
+            else:
+                value = _from_column(self._read(column_type, offset, index), column.kind)
+
+            if column.kind == "part":
+                value = parts[column.field] = {} if value is not None else None
+            elif value is not None and column.convert is not None:
+                value = column.convert(value)
+            object.__setattr__(card, column.field, value)
+
+        for column, _, _ in self._parts:
+            if (part := parts[column.field]) is not None:
+                object.__setattr__(card, column.field, column.convert(part))
+        return card
+
+    def __iter__(self) -> Iterator[Card]:
+        for index in range(self._count):
+            yield self[index]
+
+    @cached_property
+    def _layout(self) -> list[tuple[_Column, bytes, int]]:
+        # Where each column the cards are built from is in the file
+        return [(column, *self._column(column.name)) for column in _columns()]
+
+    @cached_property
+    def _parts(self) -> list[tuple[_Column, bytes, int]]:
+        return [layout for layout in self._layout if layout[0].kind == "part"]
+
+    # region Columns
+
+    def _string(self, string_id: int) -> str | None:
+        if string_id == NULL_STRING:
+            return None
+        # Strings are decoded once, and then shared by every card that has them
+        if (string := self._strings.get(string_id)) is None:
+            blob_start = self._strings_offset + 8 * (self._string_count + 1)
+            start, end = struct.unpack_from("<QQ", self._mmap, self._strings_offset + 8 * string_id)
+            string = self._strings[string_id] = self._mmap[blob_start + start : blob_start + end].decode("utf-8")
+        return string
+
+    def _fixed_width(self, offset: int, format: str, count: int) -> memoryview:
+        view = memoryview(self._mmap)[offset : offset + struct.calcsize(f"<{format}") * count]
+        if sys.byteorder == "little":
+            return view.cast(format)
+        # Big-endian machines can't read the column in place, so it is copied and byte-swapped
+        with view:
+            values = array(format, view.tobytes())
+        values.byteswap()
+        return memoryview(values)
+
+    def _column(self, name: str) -> tuple[bytes, int]:
+        if name not in self._columns:
+            raise KeyError(f"Snapshot has no column {name!r}.")
+        column_type, offset, _ = self._columns[name]
+        return column_type, offset
+
+    def column(self, name: str) -> Sequence:
+        """
+        Read a whole column without building any Cards. FLOAT and INT columns
+        are views of the file itself, with NaN and NULL_INT standing in for
+        None; they must be released before the snapshot is closed.
+
+        Args:
+            name: The column to read.
+
+        Returns:
+            The column's value for every card, in order.
+
+        Raises:
+            KeyError: If the snapshot has no such column.
+        """
+
+        column_type, offset = self._column(name)
+        if column_type == STRING:
+            with self._fixed_width(offset, "I", self._count) as string_ids:
+                return [self._string(string_id) for string_id in string_ids]
+        if column_type in (FLOAT, INT):
+            return self._fixed_width(offset, column_type.decode(), self._count)
+        return [self.value(name, index) for index in range(self._count)]
+
+    def value(self, name: str, index: int) -> Any:
+        """
+        Read a single value from a column.
+
+        Args:
+            name: The column to read.
+            index: The position of the card to read it for.
+
+        Returns:
+            The value, or None if the card has no value for the column. LIST
+                values are lists of strings.
+
+        Raises:
+            KeyError: If the snapshot has no such column.
+        """
+
+        column_type, offset = self._column(name)
+        return self._read(column_type, offset, index)
+
+    def _read(self, column_type: bytes, offset: int, index: int) -> Any:
+        if column_type == STRING:
+            (string_id,) = struct.unpack_from("<I", self._mmap, offset + 4 * index)
+            return self._string(string_id)
+        if column_type == FLOAT:
+            (value,) = struct.unpack_from("<d", self._mmap, offset + 8 * index)
+            return None if math.isnan(value) else value
+        if column_type == INT:
+            (value,) = struct.unpack_from("<q", self._mmap, offset + 8 * index)
+            return None if value == NULL_INT else value
+
+        start, end = struct.unpack_from("<QQ", self._mmap, offset + 8 * index)
+        if end & _NULL_OFFSET_BIT:
+            return None
+        start &= ~_NULL_OFFSET_BIT
+        data_start = offset + 8 * (self._count + 1)
+        if column_type == LIST:
+            string_ids = struct.unpack_from(f"<{end - start}I", self._mmap, data_start + 4 * start)
+            return [self._string(string_id) for string_id in string_ids]
+        return self._mmap[data_start + start : data_start + end].decode("utf-8")
+
+    def find(self, name: str, value: str) -> list[int]:
+        """
+        Find the cards with a given value in a STRING column, without building
+        any Cards.
+
+        Args:
+            name: The column to search.
+            value: The value to search for.
+
+        Returns:
+            The positions of the matching cards.
+
+        Raises:
+            KeyError: If the snapshot has no such column.
+        """
+
+        column_type, offset = self._column(name)
+        if column_type != STRING:
+            raise KeyError(f"Snapshot column {name!r} is not a string column.")
+
+        string_id = self._string_ids.get(value)
+        if string_id is None:
+            return []
+        with self._fixed_width(offset, "I", self._count) as string_ids:
+            return [index for index, id in enumerate(string_ids) if id == string_id]
+
+    @cached_property
+    def _string_ids(self) -> dict[str, int]:
+        return {self._string(string_id): string_id for string_id in range(self._string_count)}
+
+    # endregion
@@ -2,17 +2,22 @@ import datetime as dt
 import json
 import logging
 import re
+import weakref
 from collections import Counter
 from datetime import date, datetime
+from enum import Enum
+from functools import lru_cache, wraps
 from logging.handlers import RotatingFileHandler
-from sys import maxsize
-from typing import Any, Hashable, Iterable, Mapping, Self, Type, TypeVar
+from operator import attrgetter
+from sys import intern, maxsize
+from typing import Any, Callable, Hashable, Iterable, Mapping, Self, Type, TypeVar
 
 from frozendict import frozendict
 from pydantic.alias_generators import to_camel
 from scooze.catalogs import CostSymbol, Format
 from scooze.config import CONFIG
 from scooze.enums import ExtendedEnum
+from scooze.manacost import parse_cost
 
 ## Generic Types
 T = TypeVar("T")  # generic type
@@ -20,6 +25,8 @@ V = TypeVar("V")  # generic value type
 E = TypeVar("E", bound=ExtendedEnum)  # generic Enum type
 N = TypeVar("N", bound=ExtendedEnum)  # generic Enum (for mapping values) type
 FloatableT = TypeVar("FloatableT", float, int, str)  # type that can normalize to float
+H = TypeVar("H", bound="HashableObject")  # generic HashableObject type
+R = TypeVar("R")  # generic return type
 
 ## String formatting
 DATE_FORMAT = "%Y-%m-%d"
@@ -458,9 +465,57 @@ def parse_symbols(cost: str) -> Counter[CostSymbol]:
         A mapping of cost symbols to the number of times they appear in that string.
     """
 
-    # find all symbols of form {W}, {W/P}, etc
-    symbols = [CostSymbol(s) for s in re.findall(r"{([^}]+)}", cost)]
-    return Counter[CostSymbol](symbols)
+    # NOTE: parsed costs are cached, so the caller gets a copy it can change
+    return Counter[CostSymbol](parse_cost(cost).symbols)
+
+
+# endregion
+
+# region Oracle text utils
+
+# The number of distinct oracle texts kept processed. Printings of a card share its oracle text.
+ORACLE_TEXT_CACHE_SIZE = 32768
+
+# Matches reminder text, between parens (), along with a space on either side.
+REMINDER_TEXT_PATTERN = re.compile(r" ?\([^()]+\) ?")
+
+# Matches each word on a card.
+WORD_PATTERN = re.compile(r"([a-zA-Z0-9+/{}']+)")
+
+
+@lru_cache(maxsize=ORACLE_TEXT_CACHE_SIZE)
+def remove_reminder_text(oracle_text: str) -> str:
+    """
+    Remove reminder text from oracle text. Results are cached for each
+    distinct text.
+
+    Args:
+        oracle_text: The oracle text of a card.
+
+    Returns:
+        The oracle text without its reminder text.
+    """
+
+    return REMINDER_TEXT_PATTERN.sub("", oracle_text)
+
+
+@lru_cache(maxsize=ORACLE_TEXT_CACHE_SIZE)
+def count_words(oracle_text: str | None) -> int:
+    """
+    Count the words in oracle text, excluding reminder text. Results are
+    cached for each distinct text.
+
+    Args:
+        oracle_text: The oracle text of a card. None has no words.
+
+    Returns:
+        The number of words.
+    """
+
+    if oracle_text is None:
+        return 0
+
+    return len(WORD_PATTERN.findall(remove_reminder_text(oracle_text)))
 
 
 # endregion
@@ -477,12 +532,14 @@ class ComparableObject:
     A simple base class to support comparable objects.
     """
 
+    __slots__ = ()
+
     @property
     def __key__(self) -> tuple[Any, ...]:
         return tuple(getattr(self, k) for k in self.__dict__.keys())
 
     def __eq__(self, other: Self):
-        return self.__key__ == other.__key__
+        return self is other or self.__key__ == other.__key__
 
     def __ne__(self, other: Self):
         return not (self == other)
@@ -491,20 +548,169 @@ class ComparableObject:
 class HashableObject(ComparableObject, Hashable):
     """
     A simple base class to support hashable objects.
+
+    Subclasses declare their attributes in `__slots__`, so instances don't
+    carry a `__dict__` of their own. The key an object is compared and hashed
+    by is its attributes' values, in the order they were declared. A subclass
+    without `__slots__` also keeps attributes in an instance `__dict__`, and
+    their values follow the declared ones in its key.
+
+    Hashes and features are cached until an attribute of the object is set.
+    Once an object has cached something, the HashableObjects among its
+    attributes, like a card's prices or faces, refer back to it, so that
+    changing one of them in place also clears the caches of the objects it
+    is part of.
     """
 
+    # NOTE: these are not in _fields, so they aren't part of the key
+    __slots__ = ("_owners", "_cached_hash", "_features", "__weakref__")
+
+    _fields: tuple[str, ...] = ()
+    _key_getter: Callable[[Any], tuple[Any, ...]] = staticmethod(lambda obj: ())
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        fields = []
+        for base in reversed(cls.__mro__):
+            if issubclass(base, HashableObject) and base is not HashableObject:
+                slots = base.__dict__.get("__slots__", ())
+                fields.extend([slots] if isinstance(slots, str) else slots)
+        cls._fields = tuple(fields)
+        if len(fields) == 1:
+            field_getter = attrgetter(fields[0])
+            key_getter = lambda obj: (field_getter(obj),)
+        elif fields:
+            key_getter = attrgetter(*fields)
+        else:
+            key_getter = lambda obj: ()
+        if cls.__dictoffset__:
+            # A subclass that doesn't declare __slots__ keeps its own attributes in an instance __dict__, which is
+            # part of the key too
+            slots_getter = key_getter
+            key_getter = lambda obj: slots_getter(obj) + tuple(vars(obj).values())
+        cls._key_getter = staticmethod(key_getter)
+
+    def __new__(cls, *args, **kwargs):
+        obj = super().__new__(cls)
+        object.__setattr__(obj, "_owners", None)
+        object.__setattr__(obj, "_cached_hash", None)
+        object.__setattr__(obj, "_features", None)
+        return obj
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        if self._owners is not None or self._cached_hash is not None or self._features is not None:
+            self._clear_caches()
+
+    @property
+    def __dict__(self) -> dict[str, Any]:
+        # Stands in for the instance __dict__ slots do away with, so objects can still be read as a mapping of their
+        # attributes, e.g. to validate them as a model. Changes to it are not seen by the object.
+        return dict(zip(self._fields, self.__key__))
+
+    @property
+    def __key__(self) -> tuple[Any, ...]:
+        return self._key_getter(self)
+
+    def _clear_caches(self) -> None:
+        object.__setattr__(self, "_cached_hash", None)
+        object.__setattr__(self, "_features", None)
+        owners = self._owners
+        for owner in owners if type(owners) is tuple else (owners,):
+            if owner is not None and (owner := owner()) is not None:
+                owner._clear_caches()
+
+    def _adopt_parts(self) -> None:
+        # Called when this object first caches something, which may be derived from its parts
+        owner = weakref.ref(self)
+        for value in self.__key__:
+            for part in value if type(value) is tuple else (value,):
+                if isinstance(part, HashableObject):
+                    part._add_owner(owner)
+
+    def _add_owner(self, owner: weakref.ref) -> None:
+        # A part usually belongs to one object, so a lone owner isn't wrapped in a tuple
+        owners = self._owners
+        if owners is None:
+            object.__setattr__(self, "_owners", owner)
+        elif type(owners) is not tuple:
+            if owners is not owner:
+                object.__setattr__(self, "_owners", (owners, owner))
+        elif not any(o is owner for o in owners):
+            object.__setattr__(self, "_owners", (*owners, owner))
+
     def __hash__(self):
-        return hash(self.__key__)
+        if self._cached_hash is None:
+            object.__setattr__(self, "_cached_hash", hash(self.__key__))
+            self._adopt_parts()
+        return self._cached_hash
+
+    def __getstate__(self) -> dict[str, Any]:
+        # String hashes differ between processes, so the caches are not pickled
+        return {field: getattr(self, field) for field in self._fields} | vars(self)
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+
+
+def cached_feature(method: Callable[[H], R]) -> Callable[[H], R]:
+    """
+    Cache a HashableObject method's result on the instance. The result is
+    reused until an attribute of the instance, or of one of its parts, is
+    set.
+
+    Args:
+        method: The method to cache the result of.
+    """
+
+    name = method.__name__
+
+    @wraps(method)
+    def wrapper(self: H) -> R:
+        features = self._features
+        if features is None:
+            features = {}
+            object.__setattr__(self, "_features", features)
+            self._adopt_parts()
+        if name not in features:
+            features[name] = method(self)
+        return features[name]
+
+    return wrapper
 
 
 # endregion
 
 # region JSON Utils
 
+# The number of distinct frozensets and frozendicts JsonNormalizer keeps a shared copy of. Printings of a card, and
+# cards from the same set, repeat the same legalities, colors, games, and finishes.
+INTERNED_VALUE_CACHE_SIZE = 16384
+
+
+@lru_cache(maxsize=INTERNED_VALUE_CACHE_SIZE)
+def _interned(value: T, *enums: type[Enum] | None) -> T:
+    # lru_cache returns the first value it was given that equals this one, so equal values share that object. The
+    # enums keep values normalized to Enums apart from equal values of plain strings.
+    return value
+
+
+def _internable(values: Iterable[Any], enum: type[Enum] | None) -> bool:
+    # Only values of exactly the given Enum, or plain strings and ints, are interned. Equal values of other types, like
+    # 1 and True or 1 and 1.0, would otherwise be swapped for each other.
+    if enum is not None:
+        return all(type(v) is enum for v in values)
+    return all(type(v) is str or type(v) is int for v in values)
+
 
 class JsonNormalizer:
     """
     A simple class to be used when normalizing non-serializable data from JSON.
+
+    Frozensets and frozendicts of strings, ints, or Enums, and strings, that
+    repeat across cards are interned, so equal values share one object in memory and
+    compare equal by identity.
     """
 
     @classmethod
@@ -539,10 +745,8 @@ class JsonNormalizer:
 
         if v is None:
             return v
-        elif v in e.list():
-            return e(v)
 
-        return e[v]
+        return e.from_value_or_name(v)
 
     @classmethod
     def to_float(cls, f: FloatableT | None) -> float | None:
@@ -580,7 +784,7 @@ class JsonNormalizer:
         if d is None:
             return d
 
-        return frozendict(
+        normalized = frozendict(
             {
                 JsonNormalizer.to_enum(e=convert_key_to_enum, v=k) if convert_key_to_enum else k: (
                     JsonNormalizer.to_enum(e=convert_value_to_enum, v=v) if convert_value_to_enum else v
@@ -588,6 +792,11 @@ class JsonNormalizer:
                 for k, v in d.items()
             }
         )
+        if _internable(normalized.keys(), convert_key_to_enum) and _internable(
+            normalized.values(), convert_value_to_enum
+        ):
+            return _interned(normalized, convert_key_to_enum, convert_value_to_enum)
+        return normalized
 
     @classmethod
     def to_frozenset(cls, s: Iterable[T] | None, convert_to_enum: type[E] = None) -> frozenset[T | E] | None:
@@ -605,7 +814,28 @@ class JsonNormalizer:
         if s is None:
             return s
 
-        return frozenset({JsonNormalizer.to_enum(e=convert_to_enum, v=v) if convert_to_enum else v for v in s})
+        normalized = frozenset({JsonNormalizer.to_enum(e=convert_to_enum, v=v) if convert_to_enum else v for v in s})
+        if _internable(normalized, convert_to_enum):
+            return _interned(normalized, convert_to_enum)
+        return normalized
+
+    @classmethod
+    def to_str(cls, s: str | None) -> str | None:
+        """
+        Normalize a string. Strings are interned, so cards that repeat a
+        string, like a set name or an artist, share one copy of it.
+
+        Args:
+            s: A string to normalize.
+
+        Returns:
+            A string.
+        """
+
+        if type(s) is not str:
+            return s
+
+        return intern(s)
 
     @classmethod
     def to_tuple(cls, t: Iterable[T] | None, convert_to_enum: type[E] = None) -> tuple[T | E] | None:
@@ -1,9 +1,20 @@
+import gzip
+import json
+import threading
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 import scooze.api.bulkdata as bulk_api
+import scooze.api.index as index_api
+from scooze.card import Card
 from scooze.catalogs import ScryfallBulkFile
+from scooze.config import CONFIG
+from scooze.enums import BulkLoadEngine, CardTableFormat, DbCollection
 from scooze.models.card import CardModel
+from scooze.mongo import db
 
 
 @pytest.fixture(scope="module")
@@ -16,6 +27,21 @@ def bulk_file_dir() -> str:
     return "./data/test"
 
 
+class QuietHTTPRequestHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def bulk_file_uri(file_type: ScryfallBulkFile, bulk_file_dir: str):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), partial(QuietHTTPRequestHandler, directory=bulk_file_dir))
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/{file_type}.json"
+    server.shutdown()
+    server.server_close()
+
+
 class TestBulkDataWithEmptyDatabase:
     @pytest.fixture(scope="class", autouse=True)
     async def clean_db(self):
@@ -36,3 +62,240 @@ class TestBulkDataWithEmptyDatabase:
         mock_open.side_effect = FileNotFoundError
         with pytest.raises(FileNotFoundError):
             await bulk_api.load_card_file(file_type=file_type, bulk_file_dir=bulk_file_dir)
+
+    async def test_load_card_file_small_batches(self, file_type: ScryfallBulkFile, bulk_file_dir: str):
+        await CardModel.delete_all()
+        result = await bulk_api.load_card_file(
+            file_type=file_type,
+            bulk_file_dir=bulk_file_dir,
+            batch_size=2,
+            max_concurrent_inserts=3,
+        )
+        assert result == 9
+        assert await CardModel.count() == 9
+
+    @patch("scooze.api.bulkdata.CardModel.insert_many")
+    async def test_load_card_file_insert_error(
+        self,
+        mock_insert: MagicMock,
+        file_type: ScryfallBulkFile,
+        bulk_file_dir: str,
+    ):
+        mock_insert.side_effect = RuntimeError("Test insert error")
+        with pytest.raises(RuntimeError) as exc_info:
+            await bulk_api.load_card_file(file_type=file_type, bulk_file_dir=bulk_file_dir, batch_size=2)
+        assert isinstance(exc_info.value.__cause__, ExceptionGroup)
+        assert exc_info.value in exc_info.value.__cause__.exceptions
+
+    async def test_load_card_file_bad_batch_size(self, file_type: ScryfallBulkFile, bulk_file_dir: str):
+        with pytest.raises(ValueError):
+            await bulk_api.load_card_file(file_type=file_type, bulk_file_dir=bulk_file_dir, batch_size=0)
+
+    async def test_load_card_file_workers(self, file_type: ScryfallBulkFile, bulk_file_dir: str):
+        await CardModel.delete_all()
+        result = await bulk_api.load_card_file(file_type=file_type, bulk_file_dir=bulk_file_dir, workers=2)
+        assert result == 9
+        assert await CardModel.count() == 9
+
+    async def test_load_card_file_workers_keeps_order(self, file_type: ScryfallBulkFile, bulk_file_dir: str):
+        with (Path(bulk_file_dir) / f"{file_type}.json").open() as f:
+            expected_ids = [card["id"] for card in json.load(f)]
+        with patch("scooze.api.bulkdata.VALIDATION_CHUNK_SIZE", 2):
+            validated = bulk_api._validate_in_processes(
+                ({"id": i, "name": f"Card {i}"} for i in expected_ids), workers=2
+            )
+            scryfall_ids = [card.scryfall_id async for card in validated]
+        assert scryfall_ids == expected_ids
+
+    @patch("scooze.api.bulkdata.cli_logger")
+    async def test_load_card_file_workers_logs_validation_error(
+        self,
+        mock_logger: MagicMock,
+        file_type: ScryfallBulkFile,
+        tmp_path: Path,
+    ):
+        card_jsons = [{"name": "Good Card", "cmc": 1}, {"name": "Bad Card", "cmc": "not a number"}]
+        with (tmp_path / f"{file_type}.json").open("w") as f:
+            json.dump(card_jsons, f)
+
+        await CardModel.delete_all()
+        result = await bulk_api.load_card_file(file_type=file_type, bulk_file_dir=str(tmp_path), workers=1)
+        assert result == 1
+        mock_logger.exception.assert_called_once()
+        assert mock_logger.exception.call_args.args[0] == "Bad Card not loaded due to validation error."
+        assert mock_logger.exception.call_args.kwargs["extra"] == {"card": card_jsons[1]}
+
+    async def test_load_card_file_bad_workers(self, file_type: ScryfallBulkFile, bulk_file_dir: str):
+        with pytest.raises(ValueError):
+            await bulk_api.load_card_file(file_type=file_type, bulk_file_dir=bulk_file_dir, workers=-1)
+
+    async def test_load_card_file_raw(self, file_type: ScryfallBulkFile, bulk_file_dir: str):
+        await CardModel.delete_all()
+        result = await bulk_api.load_card_file(
+            file_type=file_type, bulk_file_dir=bulk_file_dir, engine=BulkLoadEngine.RAW, batch_size=4
+        )
+        assert result == 9
+
+        with (Path(bulk_file_dir) / f"{file_type}.json").open() as f:
+            expected = {card.scryfall_id: card for card in map(Card.from_json, json.load(f))}
+        for card in map(Card.from_model, await CardModel.find_all().to_list()):
+            card.scooze_id = None
+            assert card == expected[card.scryfall_id]
+
+    async def test_load_card_file_raw_workers(self, file_type: ScryfallBulkFile, bulk_file_dir: str):
+        await CardModel.delete_all()
+        result = await bulk_api.load_card_file(
+            file_type=file_type, bulk_file_dir=bulk_file_dir, engine=BulkLoadEngine.RAW, workers=2
+        )
+        assert result == 9
+        assert await CardModel.count() == 9
+
+    async def test_sync_card_file(self, file_type: ScryfallBulkFile, bulk_file_dir: str):
+        await CardModel.delete_all()
+        result = await bulk_api.sync_card_file(file_type=file_type, bulk_file_dir=bulk_file_dir, batch_size=4)
+        assert result == bulk_api.CardSyncResult(inserted=9, updated=0, unchanged=0, deleted=0)
+        assert await CardModel.count() == 9
+
+        result = await bulk_api.sync_card_file(file_type=file_type, bulk_file_dir=bulk_file_dir, batch_size=4)
+        assert result == bulk_api.CardSyncResult(inserted=0, updated=0, unchanged=9, deleted=0)
+        assert await CardModel.count() == 9
+
+    async def test_sync_card_file_changes(self, file_type: ScryfallBulkFile, bulk_file_dir: str, tmp_path: Path):
+        await CardModel.delete_all()
+        await bulk_api.sync_card_file(file_type=file_type, bulk_file_dir=bulk_file_dir)
+
+        with (Path(bulk_file_dir) / f"{file_type}.json").open() as f:
+            card_jsons = json.load(f)
+        removed = card_jsons.pop()
+        card_jsons[0]["prices"]["usd"] = "123456.78"
+        with (tmp_path / f"{file_type}.json").open("w") as f:
+            json.dump(card_jsons, f)
+
+        result = await bulk_api.sync_card_file(file_type=file_type, bulk_file_dir=str(tmp_path), workers=1)
+        assert result == bulk_api.CardSyncResult(inserted=0, updated=1, unchanged=7, deleted=1)
+        assert await CardModel.count() == 8
+        assert await CardModel.find_one(CardModel.scryfall_id == removed["id"]) is None
+        updated = await CardModel.find_one(CardModel.scryfall_id == card_jsons[0]["id"])
+        assert updated.prices.usd == 123456.78
+
+    async def test_sync_card_file_after_load(self, file_type: ScryfallBulkFile, bulk_file_dir: str):
+        await CardModel.delete_all()
+        await bulk_api.load_card_file(file_type=file_type, bulk_file_dir=bulk_file_dir)
+
+        # Cards loaded without a content hash are rewritten once, then left alone
+        result = await bulk_api.sync_card_file(file_type=file_type, bulk_file_dir=bulk_file_dir)
+        assert result == bulk_api.CardSyncResult(inserted=0, updated=9, unchanged=0, deleted=0)
+        assert await CardModel.count() == 9
+
+    async def test_load_card_file_swap(self, file_type: ScryfallBulkFile, bulk_file_dir: str):
+        await CardModel.delete_all()
+        await bulk_api.load_card_file(file_type=file_type, bulk_file_dir=bulk_file_dir)
+        cards = db.client[CONFIG.mongo_db][DbCollection.CARDS]
+        await cards.create_index("name", name="name_1")
+
+        result = await bulk_api.load_card_file(file_type=file_type, bulk_file_dir=bulk_file_dir, swap=True)
+        assert result == 9
+        assert await CardModel.count() == 9
+        assert "name_1" in await cards.index_information()
+        assert bulk_api.STAGING_CARDS_COLLECTION not in await db.client[CONFIG.mongo_db].list_collection_names()
+        await cards.drop_index("name_1")
+
+    async def test_load_card_file_swap_error(self, file_type: ScryfallBulkFile, bulk_file_dir: str):
+        await CardModel.delete_all()
+        await bulk_api.load_card_file(file_type=file_type, bulk_file_dir=bulk_file_dir)
+
+        with patch("scooze.api.bulkdata._insert_batch") as mock_insert:
+            mock_insert.side_effect = RuntimeError("Test insert error")
+            with pytest.raises(RuntimeError):
+                await bulk_api.load_card_file(file_type=file_type, bulk_file_dir=bulk_file_dir, swap=True)
+        assert await CardModel.count() == 9
+        assert bulk_api.STAGING_CARDS_COLLECTION not in await db.client[CONFIG.mongo_db].list_collection_names()
+
+    async def test_load_card_file_gzip(self, file_type: ScryfallBulkFile, bulk_file_dir: str, tmp_path: Path):
+        content = (Path(bulk_file_dir) / f"{file_type}.json").read_bytes()
+        (tmp_path / f"{file_type}.json.gz").write_bytes(gzip.compress(content))
+
+        await CardModel.delete_all()
+        result = await bulk_api.load_card_file(file_type=file_type, bulk_file_dir=str(tmp_path))
+        assert result == 9
+        assert await CardModel.count() == 9
+
+    async def test_stream_card_file(
+        self, file_type: ScryfallBulkFile, bulk_file_dir: str, bulk_file_uri: str, tmp_path: Path
+    ):
+        await CardModel.delete_all()
+        result = await bulk_api.stream_card_file(
+            file_type=file_type, bulk_file_dir=str(tmp_path), batch_size=4, uri=bulk_file_uri
+        )
+        assert result == 9
+        assert await CardModel.count() == 9
+        assert (tmp_path / f"{file_type}.json").read_bytes() == (Path(bulk_file_dir) / f"{file_type}.json").read_bytes()
+        assert not (tmp_path / f"{file_type}.json.part").exists()
+
+    async def test_stream_card_file_raw_workers(self, file_type: ScryfallBulkFile, bulk_file_uri: str):
+        await CardModel.delete_all()
+        result = await bulk_api.stream_card_file(
+            file_type=file_type, engine=BulkLoadEngine.RAW, workers=2, uri=bulk_file_uri
+        )
+        assert result == 9
+        assert await CardModel.count() == 9
+
+    async def test_load_card_file_defers_indexes(self, file_type: ScryfallBulkFile, bulk_file_dir: str):
+        await CardModel.delete_all()
+        cards = db.client[CONFIG.mongo_db][DbCollection.CARDS]
+        await index_api.build_indexes(DbCollection.CARDS)
+
+        async def insert_without_indexes(batch, engine):
+            assert not any(status.built for status in await index_api.get_index_status(DbCollection.CARDS))
+            return len(batch)
+
+        with patch("scooze.api.bulkdata._insert_batch", insert_without_indexes):
+            await bulk_api.load_card_file(file_type=file_type, bulk_file_dir=bulk_file_dir)
+        statuses = await index_api.get_index_status(DbCollection.CARDS)
+        assert all(status.built for status in statuses)
+
+    async def test_load_card_file_keeps_indexes(self, file_type: ScryfallBulkFile, bulk_file_dir: str):
+        await CardModel.delete_all()
+        await bulk_api.load_card_file(file_type=file_type, bulk_file_dir=bulk_file_dir)
+        cards = db.client[CONFIG.mongo_db][DbCollection.CARDS]
+
+        async def insert_with_indexes(batch, engine):
+            assert "scryfall_id" in await cards.index_information()
+            return len(batch)
+
+        with patch("scooze.api.bulkdata._insert_batch", insert_with_indexes):
+            await bulk_api.load_card_file(file_type=file_type, bulk_file_dir=bulk_file_dir)
+
+    async def test_load_card_file_swap_builds_indexes(self, file_type: ScryfallBulkFile, bulk_file_dir: str):
+        await CardModel.delete_all()
+        await index_api.drop_indexes(DbCollection.CARDS)
+        await bulk_api.load_card_file(file_type=file_type, bulk_file_dir=bulk_file_dir, swap=True)
+        statuses = await index_api.get_index_status(DbCollection.CARDS)
+        assert all(status.built for status in statuses)
+
+    async def test_export_card_file(self, file_type: ScryfallBulkFile, bulk_file_dir: str, tmp_path: Path):
+        pytest.importorskip("pyarrow")
+        await CardModel.delete_all()
+        await bulk_api.load_card_file(file_type=file_type, bulk_file_dir=bulk_file_dir)
+        names = sorted(card.name for card in await CardModel.find_all().to_list())
+
+        path = tmp_path / "cards.parquet"
+        assert await bulk_api.export_card_file(path, batch_size=4) == 9
+
+        await CardModel.delete_all()
+        assert await bulk_api.load_card_table_file(path, batch_size=4) == 9
+        assert sorted(card.name for card in await CardModel.find_all().to_list()) == names
+
+    async def test_export_card_file_from_bulk_file(
+        self, file_type: ScryfallBulkFile, bulk_file_dir: str, tmp_path: Path
+    ):
+        pytest.importorskip("pyarrow")
+        path = tmp_path / "cards.arrow"
+        result = await bulk_api.export_card_file(
+            path, format=CardTableFormat.ARROW, file_type=file_type, bulk_file_dir=bulk_file_dir
+        )
+        assert result == 9
+
+        await CardModel.delete_all()
+        assert await bulk_api.load_card_table_file(path, engine=BulkLoadEngine.RAW) == 9
+        assert await CardModel.count() == 9
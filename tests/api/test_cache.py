@@ -0,0 +1,75 @@
+from unittest.mock import patch
+
+import pytest
+from scooze.api.cache import MISSING, CacheStats, QueryCache, make_key
+
+
+def test_get_set():
+    cache = QueryCache()
+    assert cache.get("key") is MISSING
+    cache.set("key", "value")
+    assert cache.get("key") == "value"
+    assert cache.stats == CacheStats(hits=1, misses=1, evictions=0, size=1)
+
+
+def test_cached_none():
+    cache = QueryCache()
+    cache.set("key", None)
+    assert cache.get("key") is None
+
+
+def test_evicts_least_recently_used():
+    cache = QueryCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert cache.get("b") is MISSING
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats.evictions == 1
+    assert len(cache) == 2
+
+
+@patch("scooze.api.cache.time.monotonic")
+def test_expires_after_ttl(mock_monotonic):
+    cache = QueryCache(ttl=10)
+    mock_monotonic.return_value = 100
+    cache.set("key", "value")
+    mock_monotonic.return_value = 110
+    assert cache.get("key") == "value"
+    mock_monotonic.return_value = 110.5
+    assert cache.get("key") is MISSING
+    assert cache.stats == CacheStats(hits=1, misses=1, evictions=1, size=0)
+
+
+def test_disabled():
+    cache = QueryCache(maxsize=0)
+    cache.set("key", "value")
+    assert cache.get("key") is MISSING
+
+
+def test_bad_maxsize():
+    with pytest.raises(ValueError):
+        QueryCache(maxsize=-1)
+
+
+def test_clear():
+    cache = QueryCache()
+    cache.set("key", "value")
+    cache.get("key")
+    cache.clear()
+    assert cache.get("key") is MISSING
+    assert cache.stats == CacheStats(hits=1, misses=1, evictions=0, size=0)
+
+
+def test_make_key():
+    assert make_key("name", ["a", "b"]) == make_key("name", ["a", "b"])
+    assert make_key("name", ["a", "b"]) != make_key("name", ("a", "b"))
+    assert make_key({"a": [1], "b": {2}}) == make_key({"b": {2}, "a": [1]})
+    hash(make_key("name", [{"a": [1, 2]}]))
+
+
+def test_make_key_unhashable():
+    with pytest.raises(TypeError):
+        make_key(bytearray(b"unhashable"))
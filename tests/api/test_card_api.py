@@ -81,6 +81,54 @@ class TestCardApiWithPopulatedDatabase:
         results = await card_api.get_cards_by(property_name="name", values=["Not a card name", "Also not a card name"])
         assert results == []
 
+    async def test_get_cards_by_ids(self):
+        models = await CardModel.find({}, limit=3).to_list()
+        results = await card_api.get_cards_by(property_name="scooze_id", values=[str(model.id) for model in models])
+        assert {result.scooze_id for result in results} == {model.id for model in models}
+
+    async def test_get_cards_by_fields(self, recall_full: Card):
+        results = await card_api.get_cards_by(
+            property_name="name", values=[recall_full.name], fields=["name", "cmc", "legalities"]
+        )
+        assert len(results) == 1
+        result = results[0]
+        assert result.name == recall_full.name
+        assert result.cmc == recall_full.cmc
+        assert result.legalities == recall_full.legalities
+        assert result.scooze_id is not None
+        assert result.oracle_text is None
+        assert result.type_line is None
+
+    async def test_get_cards_by_fields_paginated(self):
+        results = await card_api.get_cards_by(
+            property_name="reserved", values=[True, False], paginated=True, page=2, page_size=2, fields=["name"]
+        )
+        assert len(results) == 2
+        assert all(result.type_line is None for result in results)
+
+    async def test_iter_cards_all(self):
+        results = await card_api.get_cards_all()
+        streamed = [card async for card in card_api.iter_cards_all(batch_size=2)]
+        assert {card.scooze_id for card in streamed} == {card.scooze_id for card in results}
+
+    async def test_iter_cards_by(self, recall_full: Card):
+        streamed = [
+            card
+            async for card in card_api.iter_cards_by(
+                property_name="name", values=[recall_full.name, "Not a card name"], batch_size=1
+            )
+        ]
+        assert [card.name for card in streamed] == [recall_full.name]
+
+    async def test_iter_cards_by_fields(self):
+        async for card in card_api.iter_cards_by(property_name="reserved", values=[True, False], fields=["name"]):
+            assert card.name is not None
+            assert card.type_line is None
+
+    async def test_iter_cards_bad_batch_size(self):
+        with pytest.raises(ValueError):
+            [card async for card in card_api.iter_cards_all(batch_size=0)]
+
 
 class TestCardApiDeletions:
     @pytest.fixture(autouse=True)
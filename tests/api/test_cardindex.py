@@ -0,0 +1,139 @@
+import asyncio
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from beanie import init_beanie
+from scooze.api.cardindex import CardIndex
+from scooze.card import Card
+from scooze.catalogs import Color, Format, Legality, ScryfallBulkFile
+from scooze.config import CONFIG
+from scooze.models.card import CardModel, CardModelData
+from scooze.mongo import db
+
+
+@pytest.fixture(scope="module")
+def card_index(cards_json: list[str]) -> CardIndex:
+    return CardIndex(cards=[Card.from_json(card_json) for card_json in cards_json])
+
+
+def test_get_card_by_name(card_index: CardIndex, recall_base: Card):
+    card = card_index.get_card_by_name("Ancestral Recall")
+    assert card.name == recall_base.name
+    assert card is card_index.get_card_by_name("Ancestral Recall")
+    assert card_index.get_card_by_name("Not a card name") is None
+
+
+def test_get_card_by_ids(card_index: CardIndex, json_ancestral_recall: dict):
+    card = card_index.get_card_by_scryfall_id(json_ancestral_recall["id"])
+    assert card.name == "Ancestral Recall"
+    assert card_index.get_card_by_oracle_id(json_ancestral_recall["oracle_id"]) is card
+    assert card_index.get_card_by("oracleId", json_ancestral_recall["oracle_id"]) is card
+
+
+def test_get_cards_by_set(card_index: CardIndex, json_ancestral_recall: dict):
+    cards = card_index.get_cards_by_set(json_ancestral_recall["set"])
+    assert cards
+    assert all(card.set_code == json_ancestral_recall["set"] for card in cards)
+    assert card_index.get_cards_by_set("not a set") == []
+
+
+def test_get_cards_by_keeps_load_order(card_index: CardIndex):
+    names = ["Mystic Snake", "Ancestral Recall", "Not a card name"]
+    cards = card_index.get_cards_by(property_name="name", values=names)
+    all_cards = card_index.get_cards_all()
+    assert [card.name for card in cards] == [card.name for card in all_cards if card.name in names]
+
+
+def test_get_cards_by_unindexed(card_index: CardIndex):
+    cards = card_index.get_cards_by(property_name="colors", values=[Color.BLUE])
+    assert "Ancestral Recall" in {card.name for card in cards}
+    assert all(Color.BLUE in card.colors for card in cards)
+    assert card_index.get_card_by("colors", ["U"]).colors == {Color.BLUE}
+
+
+def test_get_cards_by_nested(card_index: CardIndex):
+    cards = card_index.get_cards_by(property_name="legalities.vintage", values=[Legality.RESTRICTED])
+    assert "Ancestral Recall" in {card.name for card in cards}
+    assert all(card.legalities[Format.VINTAGE] == Legality.RESTRICTED for card in cards)
+    assert card_index.get_cards_by(property_name="legalities.vintage", values=["restricted"]) == cards
+    assert card_index.get_cards_by(property_name="legalities.notAFormat", values=["legal"]) == []
+
+
+def test_get_cards_by_nested_card_faces(card_index: CardIndex):
+    card = next(card for card in card_index.get_cards_all() if card.card_faces)
+    face_name = card.card_faces[-1].name
+    assert card in card_index.get_cards_by(property_name="cardFaces.name", values=[face_name])
+
+
+def test_get_cards_by_paginated(card_index: CardIndex):
+    all_cards = card_index.get_cards_all()
+    cards = card_index.get_cards_by(property_name="reserved", values=[True, False], paginated=True, page=2, page_size=3)
+    assert cards == all_cards[3:6]
+
+
+def test_not_loaded():
+    with pytest.raises(RuntimeError):
+        CardIndex(bulk_file_type=ScryfallBulkFile.DEFAULT).get_card_by_name("Black Lotus")
+
+
+def test_load_bulk_file():
+    with CardIndex(bulk_file_type=ScryfallBulkFile.DEFAULT, bulk_file_dir=Path("./data/test")) as s:
+        assert len(s) == 9
+        assert s.get_card_by_name("Black Lotus").set_code == "lea"
+        assert len(s.get_cards_by_set("lea")) == 9
+
+
+def test_load_bulk_file_missing(tmp_path: Path):
+    with pytest.raises(FileNotFoundError):
+        with CardIndex(bulk_file_type=ScryfallBulkFile.DEFAULT, bulk_file_dir=tmp_path):
+            pass
+
+
+@pytest.mark.context
+@patch("scooze.api.backends.mongo.mongo_connect")
+@patch("scooze.api.backends.mongo.mongo_close")
+@patch("scooze.api.backends.mongo.init_beanie")
+def test_load_database(
+    mock_beanie: MagicMock,
+    mock_close: MagicMock,
+    mock_connect: MagicMock,
+    cards_json: list[str],
+    mongo_helper,
+):
+    async def populate_db():
+        await mongo_helper.mock_connect()
+        await init_beanie(database=db.client[CONFIG.mongo_db], document_models=[CardModel])
+        for card_json in cards_json:
+            card_data = CardModelData.model_validate_json(card_json)
+            await CardModel.model_validate(card_data.model_dump()).create()
+
+    loop = asyncio.get_event_loop()
+    loop.run_until_complete(populate_db())
+    try:
+        with CardIndex() as s:
+            card = s.get_card_by_name("Ancestral Recall")
+            assert s.get_card_by("scooze_id", str(card.scooze_id)) is card
+            assert len(s) == len(cards_json)
+    finally:
+        loop.run_until_complete(CardModel.delete_all())
+
+
+def test_add_and_delete_cards(cards_json: list[str]):
+    card_index = CardIndex(cards=[])
+    card_index.add_cards([Card.from_json(card_json) for card_json in cards_json])
+    card = Card(name="Black Lotus", set_code="lea")
+    card_id = card_index.add_card(card)
+    assert card.scooze_id == card_id
+    assert card_index.get_card_by("id", str(card_id)) is card
+    assert card_index.get_cards_by_set("lea") == [card]
+
+    recall = card_index.get_card_by_name("Ancestral Recall")
+    assert card_index.delete_card(str(recall.scooze_id))
+    assert card_index.get_card_by_name("Ancestral Recall") is None
+    assert card_index.get_card_by_name("Black Lotus") is card
+    assert not card_index.delete_card(str(recall.scooze_id))
+    assert not card_index.delete_card("not an id")
+
+    assert card_index.delete_cards_all() == len(cards_json)
+    assert card_index.get_cards_all() == []
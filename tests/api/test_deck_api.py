@@ -1 +1,87 @@
-# TODO(#145) - need to support creating Deck from model
+from datetime import date
+from unittest.mock import patch
+
+import pytest
+import scooze.api.deck as deck_api
+from beanie import PydanticObjectId
+from scooze.cardlist import CardList
+from scooze.catalogs import Format
+from scooze.models.card import CardModel, CardModelData
+from scooze.models.deck import DeckModel, DeckModelData
+
+from tests.routers.utils import dict_from_cardlist
+
+
+def names(card_list: CardList) -> dict[str, int]:
+    return {card.name: quantity for card, quantity in card_list.cards.items()}
+
+
+class TestDeckApiWithPopulatedDatabase:
+    @pytest.fixture(scope="class", autouse=True)
+    async def deck_ids(
+        self,
+        cards_json: list[str],
+        archetype_modern_4c: str,
+        main_modern_4c: CardList,
+        side_modern_4c: CardList,
+        today: date,
+    ) -> list[PydanticObjectId]:
+        for card_json in cards_json:
+            card_data = CardModelData.model_validate_json(card_json)
+            card = CardModel.model_validate(card_data.model_dump())
+            await card.create()
+
+        main = await dict_from_cardlist(main_modern_4c)
+        side = await dict_from_cardlist(side_modern_4c)
+        deck_ids = []
+        for archetype, deck_side in [(archetype_modern_4c, side), ("Four-color Control (no sideboard)", {})]:
+            deck_model_data = DeckModelData.model_validate(
+                {"archetype": archetype, "format": "modern", "date_played": today, "main": main, "side": deck_side}
+            )
+            deck = DeckModel.model_validate(deck_model_data.model_dump())
+            await deck.create()
+            deck_ids.append(deck.id)
+
+        yield deck_ids
+
+        await CardModel.delete_all()
+        await DeckModel.delete_all()
+
+    async def test_get_deck(
+        self,
+        deck_ids: list[PydanticObjectId],
+        archetype_modern_4c: str,
+        main_modern_4c: CardList,
+        side_modern_4c: CardList,
+    ):
+        deck = await deck_api.get_deck(str(deck_ids[0]))
+        assert deck.archetype == archetype_modern_4c
+        assert deck.format == Format.MODERN
+        assert names(deck.main) == names(main_modern_4c)
+        assert names(deck.side) == names(side_modern_4c)
+        assert all(card.scooze_id is not None for card in deck.main.cards)
+
+    async def test_get_deck_not_found(self):
+        assert await deck_api.get_deck(PydanticObjectId()) is None
+
+    async def test_get_decks(self, deck_ids: list[PydanticObjectId]):
+        with patch("scooze.api.deck.CardModel.find", side_effect=CardModel.find) as mock_find:
+            decks = await deck_api.get_decks([deck_ids[1], PydanticObjectId(), deck_ids[0]])
+        mock_find.assert_called_once()
+
+        assert [deck.archetype for deck in decks] == ["Four-color Control (no sideboard)", "Four-color Control"]
+        assert len(decks[0].side) == 0
+        # Cards in both decks are shared between them
+        for card in decks[0].main.cards:
+            assert any(other is card for other in decks[1].main.cards)
+
+    async def test_get_decks_missing_cards(self, deck_ids: list[PydanticObjectId], main_modern_4c: CardList):
+        card_model = await CardModel.find_one({"name": "Counterspell"})
+        await card_model.delete()
+        try:
+            deck = await deck_api.get_deck(deck_ids[0])
+            expected = names(main_modern_4c)
+            del expected["Counterspell"]
+            assert names(deck.main) == expected
+        finally:
+            await card_model.create()
@@ -0,0 +1,72 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+import scooze.api.index as index_api
+from scooze.api import AsyncScoozeApi
+from scooze.config import CONFIG
+from scooze.enums import DbCollection
+from scooze.mongo import db
+
+
+@pytest.fixture
+def declared_card_indexes() -> list[str]:
+    return ["name", "oracle_id", "scryfall_id", "set", "legalities", "color_identity"]
+
+
+async def test_build_indexes(declared_card_indexes: list[str]):
+    names = await index_api.build_indexes(DbCollection.CARDS)
+    assert names == declared_card_indexes
+    built = await db.client[CONFIG.mongo_db][DbCollection.CARDS].index_information()
+    assert set(declared_card_indexes) <= built.keys()
+
+
+async def test_drop_indexes(declared_card_indexes: list[str]):
+    cards = db.client[CONFIG.mongo_db][DbCollection.CARDS]
+    await index_api.build_indexes(DbCollection.CARDS)
+    await cards.create_index("lang", name="lang")
+
+    dropped = await index_api.drop_indexes(DbCollection.CARDS)
+    assert dropped == declared_card_indexes
+    assert set((await cards.index_information()).keys()) == {"_id_", "lang"}
+    assert await index_api.drop_indexes(DbCollection.CARDS) == []
+
+    await cards.drop_index("lang")
+    await index_api.build_indexes(DbCollection.CARDS)
+
+
+async def test_get_index_status(declared_card_indexes: list[str]):
+    cards = db.client[CONFIG.mongo_db][DbCollection.CARDS]
+    await index_api.build_indexes(DbCollection.CARDS)
+    await cards.drop_index("set")
+    await cards.create_index("lang", name="lang")
+
+    statuses = {status.name: status for status in await index_api.get_index_status(DbCollection.CARDS)}
+    assert statuses.keys() == set(declared_card_indexes) | {"lang"}
+    assert statuses["name"] == index_api.IndexStatus(name="name", keys=[("name", 1)], declared=True, built=True)
+    assert statuses["legalities"].keys == [("legalities.$**", 1)]
+    assert not statuses["set"].built
+    assert not statuses["lang"].declared
+
+    await cards.drop_index("lang")
+    await index_api.build_indexes(DbCollection.CARDS)
+
+
+async def test_build_deck_indexes():
+    assert await index_api.build_indexes(DbCollection.DECKS) == ["archetype", "format", "date_played"]
+    statuses = await index_api.get_index_status(DbCollection.DECKS)
+    assert all(status.built for status in statuses)
+
+
+@patch("scooze.api.backends.mongo.mongo_connect")
+@patch("scooze.api.backends.mongo.mongo_close")
+async def test_dropped_indexes_stay_dropped(mock_close: MagicMock, mock_connect: MagicMock):
+    async with AsyncScoozeApi() as s:
+        await s.build_indexes(DbCollection.CARDS)
+        await s.drop_indexes(DbCollection.CARDS)
+
+    # Connecting again doesn't build the declared indexes
+    async with AsyncScoozeApi() as s:
+        statuses = await s.get_index_status(DbCollection.CARDS)
+    assert not any(status.built for status in statuses if status.declared)
+
+    await index_api.build_indexes(DbCollection.CARDS)
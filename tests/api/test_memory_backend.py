@@ -0,0 +1,76 @@
+from pathlib import Path
+
+import pytest
+from scooze.api import AsyncScoozeApi, ScoozeApi
+from scooze.api.backends import MemoryBackend
+from scooze.card import Card
+from scooze.catalogs import Format, Legality, ScryfallBulkFile
+from scooze.enums import DbCollection
+
+
+@pytest.fixture
+async def backend(cards_json: list[str]) -> MemoryBackend:
+    backend = MemoryBackend(cards=[])
+    await backend.connect()
+    await backend.add_cards([Card.from_json(card_json) for card_json in cards_json])
+    yield backend
+    await backend.close()
+
+
+async def test_get_card_by(backend: MemoryBackend, json_ancestral_recall: dict):
+    card = await backend.get_card_by(property_name="name", value="Ancestral Recall")
+    assert card.name == "Ancestral Recall"
+    assert await backend.get_card_by("scryfall_id", json_ancestral_recall["id"]) is card
+    assert await backend.get_card_by("oracleId", json_ancestral_recall["oracle_id"]) is card
+    assert await backend.get_card_by("scooze_id", str(card.scooze_id)) is card
+    assert await backend.get_card_by("name", "Not a card name") is None
+
+
+async def test_get_cards_by_legality(backend: MemoryBackend):
+    cards = await backend.get_cards_by("legalities.vintage", [Legality.RESTRICTED])
+    assert "Ancestral Recall" in {card.name for card in cards}
+    assert all(card.legalities[Format.VINTAGE] == Legality.RESTRICTED for card in cards)
+
+
+async def test_get_cards_by_paginated(backend: MemoryBackend):
+    cards = await backend.get_cards_by("reserved", [True, False], paginated=True, page=2, page_size=3)
+    all_cards = await backend.get_cards_all()
+    assert cards == all_cards[3:6]
+
+
+async def test_iter_cards(backend: MemoryBackend):
+    all_cards = await backend.get_cards_all()
+    streamed = [card async for card in backend.iter_cards_all(batch_size=2)]
+    assert streamed == all_cards
+    streamed = [card async for card in backend.iter_cards_by("name", ["Ancestral Recall"], batch_size=1)]
+    assert [card.name for card in streamed] == ["Ancestral Recall"]
+    with pytest.raises(ValueError):
+        [card async for card in backend.iter_cards_all(batch_size=0)]
+
+
+async def test_add_and_delete_card(backend: MemoryBackend, cards_json: list[str]):
+    card = Card(name="Black Lotus", legalities={Format.VINTAGE: Legality.RESTRICTED})
+    card_id = await backend.add_card(card)
+    assert card.scooze_id == card_id
+    assert card in await backend.get_cards_by("legalities.vintage", ["restricted"])
+    assert await backend.delete_card(str(card_id))
+    assert not await backend.delete_card(str(card_id))
+    assert await backend.delete_cards_all() == len(cards_json)
+    assert await backend.get_cards_all() == []
+
+
+async def test_load_bulk_file():
+    async with AsyncScoozeApi(
+        backend=MemoryBackend(bulk_file_type=ScryfallBulkFile.DEFAULT, bulk_file_dir=Path("./data/test"))
+    ) as s:
+        assert (await s.get_card_by_name("Black Lotus")).set_code == "lea"
+        assert len(await s.get_cards_by_set("lea")) == 9
+
+
+def test_scooze_api(cards_json: list[str]):
+    with ScoozeApi(backend=MemoryBackend(cards=[Card.from_json(card_json) for card_json in cards_json])) as s:
+        assert s.get_card_by_name("Ancestral Recall").name == "Ancestral Recall"
+        assert [card.name for card in s.iter_cards_by("name", ["Ancestral Recall"])] == ["Ancestral Recall"]
+        assert len(s.get_cards_by("legalities.vintage", ["restricted"])) > 0
+        with pytest.raises(NotImplementedError):
+            s.get_index_status(DbCollection.CARDS)
@@ -1,6 +1,7 @@
 from unittest.mock import MagicMock, patch
 
 import pytest
+import scooze.api.card as card_api
 from beanie import init_beanie
 from scooze.api import AsyncScoozeApi, ScoozeApi
 from scooze.card import Card
@@ -27,9 +28,9 @@ class TestScoozeApiWithPopulatedDatabase:
         await CardModel.delete_all()
         await mongo_helper.mock_close()
 
-    @patch("scooze.api.mongo_connect")
-    @patch("scooze.api.mongo_close")
-    @patch("scooze.api.init_beanie")
+    @patch("scooze.api.backends.mongo.mongo_connect")
+    @patch("scooze.api.backends.mongo.mongo_close")
+    @patch("scooze.api.backends.mongo.init_beanie")
     async def test_get_card_by_async(
         self,
         mock_beanie: MagicMock,
@@ -52,9 +53,9 @@ class TestScoozeApiWithPopulatedDatabase:
         mock_close.assert_called_once()
         mock_beanie.assert_called_once()
 
-    @patch("scooze.api.mongo_connect")
-    @patch("scooze.api.mongo_close")
-    @patch("scooze.api.init_beanie")
+    @patch("scooze.api.backends.mongo.mongo_connect")
+    @patch("scooze.api.backends.mongo.mongo_close")
+    @patch("scooze.api.backends.mongo.init_beanie")
     def test_get_card_by_sync(
         self,
         mock_beanie: MagicMock,
@@ -76,3 +77,73 @@ class TestScoozeApiWithPopulatedDatabase:
         mock_connect.assert_called_once()
         mock_close.assert_called_once()
         mock_beanie.assert_called_once()
+
+    @patch("scooze.api.backends.mongo.mongo_connect")
+    @patch("scooze.api.backends.mongo.mongo_close")
+    @patch("scooze.api.backends.mongo.init_beanie")
+    def test_iter_cards_by_sync(
+        self,
+        mock_beanie: MagicMock,
+        mock_close: MagicMock,
+        mock_connect: MagicMock,
+        recall_base: Card,
+    ):
+        with ScoozeApi() as s:
+            cards = list(s.iter_cards_by(property_name="name", values=["Ancestral Recall"], batch_size=1))
+            assert [card.name for card in cards] == [recall_base.name]
+            # Stopping early closes the cursor without draining it
+            for card in s.iter_cards_all(batch_size=1):
+                break
+            assert isinstance(card, Card)
+
+    @patch("scooze.api.backends.mongo.mongo_connect")
+    @patch("scooze.api.backends.mongo.mongo_close")
+    @patch("scooze.api.backends.mongo.init_beanie")
+    async def test_cached_lookups_async(
+        self,
+        mock_beanie: MagicMock,
+        mock_close: MagicMock,
+        mock_connect: MagicMock,
+        recall_base: Card,
+    ):
+        async with AsyncScoozeApi(cache_size=8) as s:
+            with patch("scooze.api.card_api.get_card_by", wraps=card_api.get_card_by) as mock_get_card_by:
+                card = await s.get_card_by_name("Ancestral Recall")
+                assert await s.get_card_by_name(name="Ancestral Recall") is card
+                mock_get_card_by.assert_called_once()
+                assert s.cache.stats.hits == 1
+
+                # Writes invalidate the cache
+                new_card = Card(name="Black Lotus")
+                await s.add_card(new_card)
+                assert len(s.cache) == 0
+                await s.get_card_by_name("Ancestral Recall")
+                assert mock_get_card_by.call_count == 2
+                await s.delete_card(new_card.scooze_id)
+
+            cards = await s.get_cards_by("name", ["Ancestral Recall"])
+            cards.clear()
+            assert [card.name for card in await s.get_cards_by("name", ["Ancestral Recall"])] == [recall_base.name]
+
+        assert len(s.cache) == 0
+
+    @patch("scooze.api.backends.mongo.mongo_connect")
+    @patch("scooze.api.backends.mongo.mongo_close")
+    @patch("scooze.api.backends.mongo.init_beanie")
+    def test_cached_lookups_sync(
+        self,
+        mock_beanie: MagicMock,
+        mock_close: MagicMock,
+        mock_connect: MagicMock,
+    ):
+        with ScoozeApi() as s:
+            with patch("scooze.api.card_api.get_card_by", wraps=card_api.get_card_by) as mock_get_card_by:
+                assert s.get_card_by(property_name="name", value="Black Lotus") is None
+                assert s.get_card_by("name", "Black Lotus") is None
+                mock_get_card_by.assert_called_once()
+
+                new_card = Card(name="Black Lotus")
+                s.add_card(new_card)
+                assert s.get_card_by("name", "Black Lotus").scooze_id == new_card.scooze_id
+                s.delete_card(new_card.scooze_id)
+                assert s.get_card_by("name", "Black Lotus") is None
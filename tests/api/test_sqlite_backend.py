@@ -0,0 +1,120 @@
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from beanie import PydanticObjectId
+from scooze.api import AsyncScoozeApi, ScoozeApi
+from scooze.api.backends import SQLiteBackend
+from scooze.card import Card
+from scooze.catalogs import Color, Format, Legality
+from scooze.enums import DbCollection
+from scooze.errors import BulkAddError
+
+
+@pytest.fixture
+async def backend(cards_json: list[str]) -> SQLiteBackend:
+    backend = SQLiteBackend(":memory:")
+    await backend.connect()
+    await backend.add_cards([Card.from_json(card_json) for card_json in cards_json])
+    yield backend
+    await backend.close()
+
+
+async def test_get_card_by(backend: SQLiteBackend, recall_base: Card, json_ancestral_recall: dict):
+    card = await backend.get_card_by(property_name="name", value="Ancestral Recall")
+    recall_base.scooze_id = card.scooze_id
+    assert card == recall_base
+    assert (await backend.get_card_by("scryfall_id", json_ancestral_recall["id"])).name == "Ancestral Recall"
+    assert (await backend.get_card_by("oracleId", json_ancestral_recall["oracle_id"])).name == "Ancestral Recall"
+    assert (await backend.get_card_by("scooze_id", str(card.scooze_id))).name == "Ancestral Recall"
+    assert await backend.get_card_by("name", "Not a card name") is None
+
+
+async def test_get_cards_by_set(backend: SQLiteBackend, json_ancestral_recall: dict):
+    cards = await backend.get_cards_by("set", [json_ancestral_recall["set"]])
+    assert cards
+    assert all(card.set_code == json_ancestral_recall["set"] for card in cards)
+
+
+async def test_get_cards_by_legality(backend: SQLiteBackend):
+    cards = await backend.get_cards_by("legalities.vintage", [Legality.RESTRICTED])
+    assert "Ancestral Recall" in {card.name for card in cards}
+    assert all(card.legalities[Format.VINTAGE] == Legality.RESTRICTED for card in cards)
+
+
+async def test_get_cards_by_unindexed(backend: SQLiteBackend):
+    cards = await backend.get_cards_by("colors", [Color.BLUE])
+    assert "Ancestral Recall" in {card.name for card in cards}
+    assert all(Color.BLUE in card.colors for card in cards)
+    cards = await backend.get_cards_by("colors", [["U"]])
+    assert all(card.colors == {Color.BLUE} for card in cards)
+    assert await backend.get_cards_by("reserved", [True])
+    assert await backend.get_cards_by("colors", []) == []
+
+
+async def test_get_cards_by_paginated_fields(backend: SQLiteBackend, cards_json: list[str]):
+    cards = await backend.get_cards_by(
+        "reserved", [True, False], paginated=True, page=2, page_size=3, fields=["name", "cmc"]
+    )
+    all_cards = await backend.get_cards_all()
+    assert len(all_cards) == len(cards_json)
+    assert [card.name for card in cards] == [card.name for card in all_cards[3:6]]
+    assert all(card.type_line is None for card in cards)
+
+
+async def test_iter_cards(backend: SQLiteBackend):
+    all_cards = await backend.get_cards_all()
+    streamed = [card async for card in backend.iter_cards_all(batch_size=2)]
+    assert [card.scooze_id for card in streamed] == [card.scooze_id for card in all_cards]
+    streamed = [card async for card in backend.iter_cards_by("name", ["Ancestral Recall"], batch_size=1)]
+    assert [card.name for card in streamed] == ["Ancestral Recall"]
+
+
+async def test_add_card(backend: SQLiteBackend):
+    card = Card(name="Black Lotus", legalities={Format.VINTAGE: Legality.RESTRICTED})
+    card_id = await backend.add_card(card)
+    assert card.scooze_id == card_id
+    assert (await backend.get_card_by("legalities.vintage", "restricted")) is not None
+
+
+async def test_add_cards_bad(backend: SQLiteBackend):
+    total = len(await backend.get_cards_all())
+    # Both cards are given the same ID, so the second insert fails
+    with patch("scooze.api.backends.sqlite.PydanticObjectId", return_value=PydanticObjectId()):
+        with pytest.raises(BulkAddError):
+            await backend.add_cards([Card(name="Black Lotus"), Card(name="Mox Ruby")])
+    assert len(await backend.get_cards_all()) == total
+
+
+async def test_delete_card(backend: SQLiteBackend):
+    card = await backend.get_card_by("name", "Ancestral Recall")
+    assert await backend.delete_card(str(card.scooze_id))
+    assert await backend.get_card_by("name", "Ancestral Recall") is None
+    restricted = await backend.get_cards_by("legalities.vintage", ["restricted"])
+    assert "Ancestral Recall" not in {card.name for card in restricted}
+    assert not await backend.delete_card(str(card.scooze_id))
+    assert not await backend.delete_card("not an id")
+
+
+async def test_delete_cards_all(backend: SQLiteBackend, cards_json: list[str]):
+    assert await backend.delete_cards_all() == len(cards_json)
+    assert await backend.get_cards_all() == []
+
+
+async def test_persists_to_file(tmp_path: Path):
+    path = tmp_path / "nested" / "scooze.db"
+    async with AsyncScoozeApi(backend=SQLiteBackend(path)) as s:
+        card_id = await s.add_card(Card(name="Black Lotus"))
+    async with AsyncScoozeApi(backend=SQLiteBackend(path)) as s:
+        card = await s.get_card_by_name("Black Lotus")
+        assert card.scooze_id == card_id
+        assert isinstance(card.scooze_id, PydanticObjectId)
+
+
+def test_scooze_api(cards_json: list[str]):
+    with ScoozeApi(backend=SQLiteBackend(":memory:")) as s:
+        s.add_cards([Card.from_json(card_json) for card_json in cards_json])
+        assert s.get_card_by_name("Ancestral Recall").name == "Ancestral Recall"
+        assert [card.name for card in s.iter_cards_by("name", ["Ancestral Recall"])] == ["Ancestral Recall"]
+        with pytest.raises(NotImplementedError):
+            s.get_index_status(DbCollection.CARDS)
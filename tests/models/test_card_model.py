@@ -49,6 +49,31 @@ def test_cardmodel_beanie(api_client: AsyncClient):
     assert card.get_motor_collection().name == DbCollection.CARDS
 
 
+def _test_from_data_helper(input_json):
+    expected = CardModel.model_validate(CardModelData.model_validate(input_json).model_dump())
+    assert CardModel.from_data(input_json) == expected
+    assert CardModel.from_data(Card.from_json(input_json).__dict__) == expected
+    assert CardModel.from_data(CardModelData.model_validate(input_json)) == expected
+
+
+def test_cardmodel_from_data_instant(api_client: AsyncClient, json_ancestral_recall):
+    _test_from_data_helper(json_ancestral_recall)
+
+
+def test_cardmodel_from_data_transform_planeswalker(api_client: AsyncClient, json_arlinn_the_packs_hope):
+    _test_from_data_helper(json_arlinn_the_packs_hope)
+
+
+def test_cardmodel_from_data_token(api_client: AsyncClient, json_snake_token):
+    _test_from_data_helper(json_snake_token)
+
+
+def test_cardmodel_from_data_scryfall_id(api_client: AsyncClient, json_ancestral_recall):
+    card = CardModel.from_data(json_ancestral_recall)
+    assert card.id is None
+    assert card.scryfall_id == json_ancestral_recall["id"]
+
+
 # endregion
 
 
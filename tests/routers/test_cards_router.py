@@ -49,6 +49,17 @@ class TestCardsRouterWithPopulatedDatabase:
         for card in cards:
             assert card.name in response_json_names
 
+    async def test_get_cards_by_fields(self, api_client: AsyncClient):
+        cards = await CardModel.find({}, limit=2).to_list()
+        response = await api_client.post(
+            "/cards/by?property_name=name&fields=name&fields=cmc", json=[card.name for card in cards]
+        )
+        assert response.status_code == HTTPStatus.OK
+        for card_obj in response.json():
+            assert card_obj["name"] in [card.name for card in cards]
+            assert card_obj["cmc"] is not None
+            assert card_obj["typeLine"] is None
+
     async def test_get_cards_by_none_found(self, api_client: AsyncClient):
         response = await api_client.post("/cards/by?property_name=id", json=[str(PydanticObjectId())])
         assert response.status_code == HTTPStatus.NOT_FOUND
@@ -69,6 +69,19 @@ class TestDeckRouterWithPopulatedDatabase:
         for deck in decks:
             assert deck.archetype in response_json_archetypes
 
+    async def test_get_decks_by_fields(self, api_client: AsyncClient, archetype_modern_4c: str):
+        response = await api_client.post(
+            "/decks/by?property_name=archetype&fields=archetype&fields=format", json=[archetype_modern_4c]
+        )
+        assert response.status_code == HTTPStatus.OK
+        response_json = response.json()
+        assert len(response_json) == 1
+        for deck_obj in response_json:
+            assert PydanticObjectId.is_valid(deck_obj["_id"])
+            assert deck_obj["archetype"] == archetype_modern_4c
+            assert deck_obj["format"] == "modern"
+            assert "main" not in deck_obj
+
     async def test_get_decks_by_none_found(self, api_client: AsyncClient):
         response = await api_client.post("/decks/by?property_name=archetype", json=["Grixis Death's Shadow"])
         assert response.status_code == HTTPStatus.NOT_FOUND
@@ -0,0 +1,85 @@
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from beanie import PydanticObjectId
+from scooze.arrow import (
+    LEGALITY_PREFIX,
+    PRICE_PREFIX,
+    card_schema,
+    cards_to_record_batch,
+    cards_to_table,
+    read_card_table_file,
+    record_batch_to_card_jsons,
+    write_card_table_file,
+)
+from scooze.card import Card
+from scooze.catalogs import Format
+from scooze.enums import CardTableFormat
+from scooze.models.card import CardModelData
+
+pa = pytest.importorskip("pyarrow")
+
+
+@pytest.fixture
+def cards(cards_json: list[str]) -> list[Card]:
+    cards = [Card.from_json(card_json) for card_json in cards_json]
+    for card in cards:
+        card.scooze_id = PydanticObjectId()
+    return cards
+
+
+def _card_data(card: Card) -> CardModelData:
+    return CardModelData.model_validate(card.__dict__)
+
+
+def test_card_schema():
+    schema = card_schema()
+    assert schema.field("scooze_id").type == pa.string()
+    assert schema.field("name").type == pa.string()
+    assert schema.field("cmc").type == pa.float64()
+    assert schema.field("released_at").type == pa.date32()
+    assert schema.field("rarity").type == pa.dictionary(pa.int16(), pa.string())
+    assert schema.field("colors").type == pa.list_(pa.string())
+    assert schema.field(f"{LEGALITY_PREFIX}{Format.VINTAGE}").type == pa.dictionary(pa.int8(), pa.string())
+    assert schema.field(f"{PRICE_PREFIX}usd").type == pa.float64()
+    assert "legalities" not in schema.names
+    assert "prices" not in schema.names
+
+
+def test_record_batch(cards: list[Card]):
+    record_batch = cards_to_record_batch(cards)
+    assert record_batch.num_rows == len(cards)
+    assert record_batch.column("scooze_id").to_pylist() == [str(card.scooze_id) for card in cards]
+    assert record_batch.column("name").to_pylist() == [card.name for card in cards]
+    assert record_batch.column(f"{LEGALITY_PREFIX}{Format.VINTAGE}").to_pylist() == [
+        card.legalities[Format.VINTAGE] for card in cards
+    ]
+
+
+def test_round_trip(cards: list[Card]):
+    table = cards_to_table(cards, batch_size=4)
+    assert table.num_rows == len(cards)
+    card_jsons = list(record_batch_to_card_jsons(table))
+    assert [CardModelData.model_validate(card_json) for card_json in card_jsons] == [_card_data(card) for card in cards]
+
+
+@pytest.mark.parametrize("format", CardTableFormat)
+def test_file_round_trip(cards: list[Card], tmp_path: Path, format: CardTableFormat):
+    path = tmp_path / f"cards.{format}"
+    assert write_card_table_file(cards, path, format=format, batch_size=4) == len(cards)
+
+    card_jsons = [card_json for batch in read_card_table_file(path) for card_json in record_batch_to_card_jsons(batch)]
+    assert [CardModelData.model_validate(card_json) for card_json in card_jsons] == [_card_data(card) for card in cards]
+
+
+def test_bad_batch_size(cards: list[Card]):
+    with pytest.raises(ValueError):
+        cards_to_table(cards, batch_size=0)
+
+
+def test_missing_pyarrow(cards: list[Card]):
+    with patch.dict(sys.modules, {"pyarrow": None}):
+        with pytest.raises(ImportError, match=r"pip install scooze\[arrow\]"):
+            cards_to_record_batch(cards)
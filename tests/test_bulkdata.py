@@ -0,0 +1,266 @@
+import gzip
+import os
+import sys
+import threading
+from contextlib import suppress
+from datetime import datetime, timezone
+from email.utils import formatdate, parsedate_to_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from scooze.bulkdata import (
+    download_bulk_data_file,
+    find_bulk_data_file,
+    open_bulk_data_file,
+)
+from scooze.catalogs import ScryfallBulkFile
+from scooze.enums import BulkFileCompression
+from scooze.errors import BulkDownloadError
+
+# region Fixtures
+
+
+class BulkFileServer(ThreadingHTTPServer):
+    """
+    Local stand-in for Scryfall's bulk file host.
+    """
+
+    content = b'[{"name": "Black Lotus"}, {"name": "Mox Sapphire"}, {"name": "Time Walk"}]'
+    last_modified = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    # Number of bytes to send before dropping the connection, for the next request only
+    drop_after: int | None = None
+    # Number of bytes to send before pausing for longer than the client waits, for the next request only
+    stall_after: int | None = None
+    request_headers: list[dict[str, str]]
+
+
+class BulkFileHandler(BaseHTTPRequestHandler):
+    server: BulkFileServer
+
+    def do_GET(self):
+        self.server.request_headers.append(dict(self.headers))
+
+        since = self.headers.get("If-Modified-Since")
+        if since and parsedate_to_datetime(since) >= self.server.last_modified:
+            self.send_response(304)
+            self.end_headers()
+            return
+
+        body = self.server.content
+        status = 200
+        if (byte_range := self.headers.get("Range")) and byte_range.startswith("bytes="):
+            start = int(byte_range.removeprefix("bytes=").split("-")[0])
+            if start >= len(body):
+                self.send_response(416)
+                self.end_headers()
+                return
+            status = 206
+            body = body[start:]
+
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Last-Modified", formatdate(self.server.last_modified.timestamp(), usegmt=True))
+        self.end_headers()
+
+        if (drop_after := self.server.drop_after) is not None:
+            self.server.drop_after = None
+            self.wfile.write(body[:drop_after])
+            self.wfile.flush()
+            self.close_connection = True
+            return
+        if (stall_after := self.server.stall_after) is not None:
+            self.server.stall_after = None
+            self.wfile.write(body[:stall_after])
+            self.wfile.flush()
+            # NOTE: not time.sleep, which the tests patch to skip the waits between retries
+            threading.Event().wait(0.5)
+            # The client has given up on this response by now, so the rest may not be sent
+            with suppress(OSError):
+                self.wfile.write(body[stall_after:])
+            return
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def bulk_server():
+    server = BulkFileServer(("127.0.0.1", 0), BulkFileHandler)
+    server.request_headers = []
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def uri(bulk_server: BulkFileServer) -> str:
+    return f"http://127.0.0.1:{bulk_server.server_address[1]}/default-cards.json"
+
+
+@pytest.fixture
+def file_type() -> ScryfallBulkFile:
+    return ScryfallBulkFile.DEFAULT
+
+
+# endregion
+
+
+def test_download(bulk_server: BulkFileServer, uri: str, file_type: ScryfallBulkFile, tmp_path: Path):
+    updated_at = datetime(2024, 2, 1, tzinfo=timezone.utc)
+    downloaded = download_bulk_data_file(
+        uri, file_type, tmp_path, updated_at=updated_at, expected_size=len(bulk_server.content)
+    )
+    file = tmp_path / f"{file_type}.json"
+    assert downloaded
+    assert file.read_bytes() == bulk_server.content
+    assert file.stat().st_mtime == updated_at.timestamp()
+    assert not (tmp_path / f"{file_type}.json.part").exists()
+
+
+def test_download_up_to_date(bulk_server: BulkFileServer, uri: str, file_type: ScryfallBulkFile, tmp_path: Path):
+    updated_at = datetime(2024, 2, 1, tzinfo=timezone.utc)
+    download_bulk_data_file(uri, file_type, tmp_path, updated_at=updated_at)
+    assert not download_bulk_data_file(uri, file_type, tmp_path, updated_at=updated_at)
+    assert len(bulk_server.request_headers) == 1
+
+
+def test_download_newer(bulk_server: BulkFileServer, uri: str, file_type: ScryfallBulkFile, tmp_path: Path):
+    download_bulk_data_file(uri, file_type, tmp_path, updated_at=datetime(2024, 2, 1, tzinfo=timezone.utc))
+    assert download_bulk_data_file(uri, file_type, tmp_path, updated_at=datetime(2024, 3, 1, tzinfo=timezone.utc))
+    assert len(bulk_server.request_headers) == 2
+
+
+def test_download_force(bulk_server: BulkFileServer, uri: str, file_type: ScryfallBulkFile, tmp_path: Path):
+    updated_at = datetime(2024, 2, 1, tzinfo=timezone.utc)
+    download_bulk_data_file(uri, file_type, tmp_path, updated_at=updated_at)
+    assert download_bulk_data_file(uri, file_type, tmp_path, updated_at=updated_at, force=True)
+
+
+def test_download_not_modified(bulk_server: BulkFileServer, uri: str, file_type: ScryfallBulkFile, tmp_path: Path):
+    assert download_bulk_data_file(uri, file_type, tmp_path)
+    assert (tmp_path / f"{file_type}.json").stat().st_mtime == bulk_server.last_modified.timestamp()
+    assert not download_bulk_data_file(uri, file_type, tmp_path)
+    assert "If-Modified-Since" in bulk_server.request_headers[1]
+
+
+@patch("scooze.bulkdata.DOWNLOAD_CHUNK_SIZE", 1)
+@patch("scooze.bulkdata.time.sleep")
+def test_download_resumes_dropped_connection(
+    mock_sleep, bulk_server: BulkFileServer, uri: str, file_type: ScryfallBulkFile, tmp_path: Path
+):
+    bulk_server.drop_after = 10
+    assert download_bulk_data_file(uri, file_type, tmp_path, expected_size=len(bulk_server.content))
+    assert (tmp_path / f"{file_type}.json").read_bytes() == bulk_server.content
+    assert bulk_server.request_headers[1]["Range"] == "bytes=10-"
+    assert bulk_server.request_headers[1]["Accept-Encoding"] == "identity"
+
+
+@patch("scooze.bulkdata.DOWNLOAD_CHUNK_SIZE", 1)
+@patch("scooze.bulkdata.REQUEST_TIMEOUT", (1, 0.1))
+@patch("scooze.bulkdata.time.sleep")
+def test_download_resumes_stalled_connection(
+    mock_sleep, bulk_server: BulkFileServer, uri: str, file_type: ScryfallBulkFile, tmp_path: Path
+):
+    bulk_server.stall_after = 10
+    assert download_bulk_data_file(uri, file_type, tmp_path, expected_size=len(bulk_server.content))
+    assert (tmp_path / f"{file_type}.json").read_bytes() == bulk_server.content
+    assert bulk_server.request_headers[1]["Range"] == "bytes=10-"
+
+
+@patch("scooze.bulkdata.DOWNLOAD_CHUNK_SIZE", 1)
+@patch("scooze.bulkdata.time.sleep")
+def test_download_gives_up_after_retries(
+    mock_sleep, bulk_server: BulkFileServer, uri: str, file_type: ScryfallBulkFile, tmp_path: Path
+):
+    bulk_server.drop_after = 10
+    with pytest.raises(OSError):
+        download_bulk_data_file(uri, file_type, tmp_path, max_retries=0)
+    assert not (tmp_path / f"{file_type}.json").exists()
+    assert (tmp_path / f"{file_type}.json.part").read_bytes() == bulk_server.content[:10]
+
+
+def test_download_resumes_part_file(bulk_server: BulkFileServer, uri: str, file_type: ScryfallBulkFile, tmp_path: Path):
+    (tmp_path / f"{file_type}.json.part").write_bytes(bulk_server.content[:5])
+    assert download_bulk_data_file(uri, file_type, tmp_path)
+    assert (tmp_path / f"{file_type}.json").read_bytes() == bulk_server.content
+    assert bulk_server.request_headers[0]["Range"] == "bytes=5-"
+
+
+def test_download_discards_stale_part_file(
+    bulk_server: BulkFileServer, uri: str, file_type: ScryfallBulkFile, tmp_path: Path
+):
+    part_file = tmp_path / f"{file_type}.json.part"
+    part_file.write_bytes(b"old data")
+    os.utime(part_file, (0, 0))
+    assert download_bulk_data_file(uri, file_type, tmp_path, updated_at=datetime(2024, 2, 1, tzinfo=timezone.utc))
+    assert (tmp_path / f"{file_type}.json").read_bytes() == bulk_server.content
+    assert "Range" not in bulk_server.request_headers[0]
+
+
+def test_download_bad_size(bulk_server: BulkFileServer, uri: str, file_type: ScryfallBulkFile, tmp_path: Path):
+    with pytest.raises(BulkDownloadError):
+        download_bulk_data_file(uri, file_type, tmp_path, expected_size=len(bulk_server.content) + 1)
+    assert not (tmp_path / f"{file_type}.json").exists()
+    assert not (tmp_path / f"{file_type}.json.part").exists()
+
+
+def test_download_gzip(bulk_server: BulkFileServer, uri: str, file_type: ScryfallBulkFile, tmp_path: Path):
+    (tmp_path / f"{file_type}.json").write_bytes(b"[]")
+    assert download_bulk_data_file(
+        uri, file_type, tmp_path, expected_size=len(bulk_server.content), compression=BulkFileCompression.GZIP
+    )
+    file = tmp_path / f"{file_type}.json.gz"
+    assert gzip.decompress(file.read_bytes()) == bulk_server.content
+    assert find_bulk_data_file(file_type, tmp_path) == file
+    assert not (tmp_path / f"{file_type}.json").exists()
+    assert not (tmp_path / f"{file_type}.json.part").exists()
+
+
+def test_download_zstd(bulk_server: BulkFileServer, uri: str, file_type: ScryfallBulkFile, tmp_path: Path):
+    zstandard = pytest.importorskip("zstandard")
+    assert download_bulk_data_file(
+        uri, file_type, tmp_path, expected_size=len(bulk_server.content), compression=BulkFileCompression.ZSTD
+    )
+    file = tmp_path / f"{file_type}.json.zst"
+    with zstandard.ZstdDecompressor().stream_reader(file.open(mode="rb")) as f:
+        assert f.read() == bulk_server.content
+    assert find_bulk_data_file(file_type, tmp_path) == file
+    with open_bulk_data_file(file) as f:
+        assert f.read() == bulk_server.content
+    assert not (tmp_path / f"{file_type}.json").exists()
+
+
+def test_download_zstd_not_installed(
+    bulk_server: BulkFileServer, uri: str, file_type: ScryfallBulkFile, tmp_path: Path
+):
+    with patch.dict(sys.modules, {"zstandard": None}):
+        with pytest.raises(ImportError):
+            download_bulk_data_file(uri, file_type, tmp_path, compression=BulkFileCompression.ZSTD)
+
+
+def test_find_bulk_data_file_missing(file_type: ScryfallBulkFile, tmp_path: Path):
+    assert find_bulk_data_file(file_type, tmp_path) == tmp_path / f"{file_type}.json"
+
+
+@pytest.mark.parametrize("compress", [lambda b: b, gzip.compress])
+def test_open_bulk_data_file(compress, tmp_path: Path):
+    content = b'[{"name": "Black Lotus"}]'
+    # The format is detected from the file's contents, not its name
+    file = tmp_path / "cards"
+    file.write_bytes(compress(content))
+    with open_bulk_data_file(file) as f:
+        assert f.read() == content
+
+
+def test_open_bulk_data_file_zstd(tmp_path: Path):
+    zstandard = pytest.importorskip("zstandard")
+    content = b'[{"name": "Black Lotus"}]'
+    file = tmp_path / "cards"
+    file.write_bytes(zstandard.ZstdCompressor().compress(content))
+    with open_bulk_data_file(file) as f:
+        assert f.read() == content
@@ -1,11 +1,16 @@
+import json
+import pickle
 from datetime import date
+from unittest.mock import patch
 
+import pytest
 from beanie import PydanticObjectId
-from scooze.card import Card
+from scooze.card import Card, precompute_features
 from scooze.catalogs import (
     BorderColor,
     Color,
     Component,
+    CostSymbol,
     Finish,
     Frame,
     FrameEffect,
@@ -62,6 +67,85 @@ def test_card_hash(json_anaconda_7ed_foil, json_anaconda_portal):
     assert hash(a7) == hash(a7_clone)
 
 
+def test_card_hash_invalidated(json_anaconda_7ed_foil):
+    card = Card.from_json(json_anaconda_7ed_foil)
+    clone = Card.from_json(json_anaconda_7ed_foil)
+    assert hash(card) == hash(clone)
+    assert "_cached_hash" not in card.__dict__
+
+    clone.name = "Not Anaconda"
+    assert hash(card) != hash(clone)
+    assert card != clone
+    clone.name = card.name
+    assert hash(card) == hash(clone)
+    assert card == clone
+
+
+def test_card_hash_invalidated_by_parts(json_arlinn_the_packs_hope):
+    card = Card.from_json(json_arlinn_the_packs_hope)
+    clone = Card.from_json(json_arlinn_the_packs_hope)
+    assert hash(card) == hash(clone)
+    assert clone.total_words() == 62
+
+    clone.prices.usd = 1000.0
+    assert hash(card) != hash(clone)
+    clone.prices.usd = card.prices.usd
+    assert hash(card) == hash(clone)
+
+    clone.card_faces[0].oracle_text = "Draw a card."
+    assert hash(card) != hash(clone)
+    assert clone.total_words() < 62
+
+
+def test_card_caches_kept_when_other_cards_change(json_ancestral_recall, json_arlinn_the_packs_hope):
+    card = Card.from_json(json_ancestral_recall)
+    other = Card.from_json(json_arlinn_the_packs_hope)
+    card_hash = hash(card)
+    assert card.total_words() == 5
+    other.name = "Not Arlinn"
+    Card.from_json(json_arlinn_the_packs_hope)
+    with patch("scooze.card.count_words") as mock_count_words:
+        assert card.total_words() == 5
+        mock_count_words.assert_not_called()
+    assert card._cached_hash == card_hash
+
+
+def test_card_hash_invalidated_by_shared_part(json_anaconda_7ed_foil, json_anaconda_portal):
+    a7 = Card.from_json(json_anaconda_7ed_foil)
+    ap = Card.from_json(json_anaconda_portal)
+    ap.prices = a7.prices
+    a7_hash, ap_hash = hash(a7), hash(ap)
+    a7.prices.usd = 1000.0
+    assert hash(a7) != a7_hash
+    assert hash(ap) != ap_hash
+
+
+def test_card_hash_not_pickled(json_anaconda_7ed_foil):
+    card = Card.from_json(json_anaconda_7ed_foil)
+    hash(card)
+    clone = pickle.loads(pickle.dumps(card))
+    assert getattr(clone, "_cached_hash", None) is None
+    assert clone == card
+    assert hash(clone) == hash(card)
+
+
+def test_card_shares_repeated_values(json_anaconda_7ed_foil, json_anaconda_portal):
+    a7 = Card.from_json(json.dumps(json_anaconda_7ed_foil))
+    ap = Card.from_json(json.dumps(json_anaconda_portal))
+    assert a7.oracle_text is ap.oracle_text
+    assert a7.type_line is ap.type_line
+    assert a7.colors is ap.colors
+    assert a7.games is Card.from_json(json.dumps(json_anaconda_7ed_foil)).games
+
+
+def test_card_slots(json_anaconda_7ed_foil):
+    card = Card.from_json(json_anaconda_7ed_foil)
+    assert list(card.__dict__) == list(Card._fields)
+    assert card.__key__ == tuple(card.__dict__.values())
+    with pytest.raises(AttributeError):
+        card.not_a_field = None
+
+
 # endregion
 
 # endregion
@@ -1066,4 +1150,35 @@ def test_card_total_words_reversible(json_zndrsplt_eye_of_wisdom):
     assert card.total_words() == 32
 
 
+def test_total_words_cached(json_ancestral_recall):
+    card = Card.from_json(json_ancestral_recall)
+    assert card.total_words() == 5
+    with patch("scooze.card.count_words") as mock_count_words:
+        assert card.total_words() == 5
+        mock_count_words.assert_not_called()
+
+    card.oracle_text = "Draw a card."
+    assert card.total_words() == 3
+    assert "_features" not in card.__dict__
+
+
+def test_parsed_cost(json_arlinn_the_packs_hope):
+    card = Card.from_json(json_arlinn_the_packs_hope)
+    front, back = card.card_faces
+    assert card.parsed_cost() is card.parsed_cost()
+    assert front.mana_symbols() == {CostSymbol.GENERIC_2: 1, CostSymbol.RED: 1, CostSymbol.GREEN: 1}
+    assert front.parsed_cost().mana_value == 4
+    assert back.mana_symbols() == {}
+
+
+def test_precompute_features(json_arlinn_the_packs_hope, json_ancestral_recall):
+    cards = [Card.from_json(json_arlinn_the_packs_hope), Card.from_json(json_ancestral_recall)]
+    precompute_features(cards)
+    with patch("scooze.card.count_words") as mock_count_words, patch("scooze.card.parse_cost") as mock_parse_cost:
+        assert [card.total_words() for card in cards] == [62, 5]
+        assert cards[1].mana_symbols() == {CostSymbol.BLUE: 1}
+        mock_count_words.assert_not_called()
+        mock_parse_cost.assert_not_called()
+
+
 # endregion
@@ -0,0 +1,99 @@
+import math
+import sys
+from unittest.mock import patch
+
+import pytest
+from scooze.card import Card
+from scooze.cardtable import NO_CODE, RARITY_CODES, CardTable
+from scooze.catalogs import Color, Format, Legality, Rarity, ScryfallBulkFile
+
+np = pytest.importorskip("numpy")
+
+
+@pytest.fixture
+def cards(cards_json: list[str]) -> list[Card]:
+    return [Card.from_json(card_json) for card_json in cards_json]
+
+
+@pytest.fixture
+def table(cards: list[Card]) -> CardTable:
+    return CardTable(cards)
+
+
+def test_columns(cards: list[Card], table: CardTable):
+    assert len(table) == len(cards)
+    assert [None if math.isnan(cmc) else cmc for cmc in table.column("cmc")] == [card.cmc for card in cards]
+    assert list(table.column("rarity")) == [RARITY_CODES.get(card.rarity, NO_CODE) for card in cards]
+    assert [None if math.isnan(usd) else usd for usd in table.column("prices.usd")] == [
+        card.prices.usd if card.prices is not None else None for card in cards
+    ]
+    with pytest.raises(KeyError):
+        table.column("not a column")
+    with pytest.raises(KeyError):
+        table.column("legalities.not a format")
+
+
+def test_legal_in(cards: list[Card], table: CardTable):
+    indices = table.where(table.legal_in(Format.MODERN))
+    assert table.take(indices) == [card for card in cards if card.legalities[Format.MODERN] == Legality.LEGAL]
+
+    indices = table.where(table.legal_in(Format.VINTAGE, legalities=[Legality.RESTRICTED]))
+    assert "Ancestral Recall" in [card.name for card in table.take(indices)]
+
+
+def test_color_filters(cards: list[Card], table: CardTable):
+    mono_blue = table.where(table.color_identity_within([Color.BLUE]))
+    assert table.take(mono_blue) == [card for card in cards if card.color_identity <= {Color.BLUE}]
+
+    blue = table.where(table.has_colors([Color.BLUE]) & table.has_rarity(Rarity.RARE, Rarity.MYTHIC))
+    assert table.take(blue) == [
+        card for card in cards if Color.BLUE in (card.colors or ()) and card.rarity in (Rarity.RARE, Rarity.MYTHIC)
+    ]
+
+
+def test_group(cards: list[Card], table: CardTable):
+    groups = table.group("color_identity")
+    assert sum(len(indices) for indices in groups.values()) == len(cards)
+    for color_identity, indices in groups.items():
+        assert all(card.color_identity == color_identity for card in table.take(indices))
+
+    groups = table.group("rarity", indices=[0, 1, 2])
+    assert sorted(i for indices in groups.values() for i in indices) == [0, 1, 2]
+    for rarity, indices in groups.items():
+        assert all(card.rarity == rarity for card in table.take(indices))
+
+    with pytest.raises(KeyError):
+        table.group("name")
+
+
+def test_aggregate(cards: list[Card], table: CardTable):
+    modern = table.where(table.legal_in(Format.MODERN))
+    averages = table.aggregate("cmc", by="color_identity", indices=modern)
+    for color_identity, average in averages.items():
+        group = [card.cmc for card in table.take(modern) if card.color_identity == color_identity]
+        assert average == pytest.approx(sum(group) / len(group))
+
+    assert table.aggregate("cmc", func="max") == max(card.cmc for card in cards)
+    assert table.aggregate("cmc", func="min") == min(card.cmc for card in cards)
+    assert table.aggregate("prices.usd", func="count") == sum(
+        1 for card in cards if card.prices is not None and card.prices.usd is not None
+    )
+    assert table.aggregate("prices.usd", func="sum") == pytest.approx(
+        sum(card.prices.usd for card in cards if card.prices is not None and card.prices.usd is not None)
+    )
+    assert math.isnan(table.aggregate("cmc", indices=np.array([], dtype=np.intp), func="mean"))
+
+    with pytest.raises(ValueError):
+        table.aggregate("cmc", func="median")
+
+
+def test_from_bulk_file():
+    table = CardTable.from_bulk_file(ScryfallBulkFile.DEFAULT, "./data/test")
+    assert len(table) == 9
+    assert table.where(table.legal_in(Format.VINTAGE, legalities=[Legality.RESTRICTED])).size > 0
+
+
+def test_missing_numpy(cards: list[Card]):
+    with patch.dict(sys.modules, {"numpy": None}):
+        with pytest.raises(ImportError, match=r"pip install scooze\[cardtable\]"):
+            CardTable(cards)
@@ -0,0 +1,54 @@
+import pytest
+from scooze.catalogs import Color, CostSymbol
+from scooze.manacost import EMPTY_COST, SYMBOL_INFO, parse_cost, parse_costs
+
+
+def test_parse_cost():
+    parsed = parse_cost("{2}{W/U}{B/P}{G}")
+    assert parsed.symbols == {
+        CostSymbol.GENERIC_2: 1,
+        CostSymbol.HYBRID_WU: 1,
+        CostSymbol.PHYREXIAN_BLACK: 1,
+        CostSymbol.GREEN: 1,
+    }
+    assert parsed.mana_value == 5
+    assert parsed.colors == {Color.WHITE, Color.BLUE, Color.BLACK, Color.GREEN}
+
+
+def test_parse_cost_repeated_symbols():
+    parsed = parse_cost("{X}{R}{R}{2/R}")
+    assert parsed.symbols == {CostSymbol.GENERIC_X: 1, CostSymbol.RED: 2, CostSymbol.TWOBRID_RED: 1}
+    assert parsed.mana_value == 4
+    assert parsed.colors == {Color.RED}
+
+
+def test_parse_cost_empty():
+    assert parse_cost(None) is EMPTY_COST
+    assert parse_cost("") is EMPTY_COST
+    assert parse_cost("{0}").mana_value == 0
+
+
+def test_parse_cost_cached():
+    parse_cost.cache_clear()
+    assert parse_cost("{1}{U}") is parse_cost("{1}{U}")
+    assert parse_cost.cache_info().hits == 1
+
+
+def test_parse_cost_bad_symbol():
+    with pytest.raises(ValueError):
+        parse_cost("{not a symbol}")
+
+
+def test_symbol_info():
+    assert SYMBOL_INFO[CostSymbol.HALF_WHITE].mana_value == 0.5
+    assert SYMBOL_INFO[CostSymbol.HALF_WHITE].colors == {Color.WHITE}
+    assert SYMBOL_INFO[CostSymbol.GENERIC_PHYREXIAN].mana_value == 1
+    assert SYMBOL_INFO[CostSymbol.COLORLESS].colors == frozenset()
+    assert SYMBOL_INFO[CostSymbol.TAP].mana_value == 0
+
+
+def test_parse_costs():
+    costs = ["{U}", None, "{1}{G}", "{U}"]
+    parsed = parse_costs(costs)
+    assert parsed == [parse_cost(cost) for cost in costs]
+    assert parsed[0] is parsed[3]
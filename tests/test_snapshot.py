@@ -0,0 +1,74 @@
+import math
+from pathlib import Path
+
+import pytest
+from beanie import PydanticObjectId
+from scooze.card import Card
+from scooze.errors import SnapshotFormatError
+from scooze.snapshot import NULL_INT, CardSnapshot, build_snapshot
+
+
+@pytest.fixture
+def cards(cards_json: list[str]) -> list[Card]:
+    cards = [Card.from_json(card_json) for card_json in cards_json]
+    for card in cards:
+        card.scooze_id = PydanticObjectId()
+    return cards
+
+
+@pytest.fixture
+def snapshot_path(cards: list[Card], tmp_path: Path) -> Path:
+    path = tmp_path / "cards.snapshot"
+    assert build_snapshot(cards, path) == len(cards)
+    return path
+
+
+def test_read_cards(cards: list[Card], snapshot_path: Path):
+    with CardSnapshot(snapshot_path) as snapshot:
+        assert len(snapshot) == len(cards)
+        for card, result in zip(cards, snapshot):
+            assert result == card
+            assert result.scooze_id == card.scooze_id
+        assert snapshot[-1] == cards[-1]
+        assert snapshot[1:3] == cards[1:3]
+        with pytest.raises(IndexError):
+            snapshot[len(cards)]
+
+
+def test_columns(cards: list[Card], snapshot_path: Path):
+    with CardSnapshot(snapshot_path) as snapshot:
+        assert snapshot.column("name") == [card.name for card in cards]
+        assert snapshot.column("oracle_text") == [card.oracle_text for card in cards]
+        with snapshot.column("cmc") as cmcs:
+            assert [None if math.isnan(cmc) else cmc for cmc in cmcs] == [card.cmc for card in cards]
+        with snapshot.column("edhrec_rank") as ranks:
+            assert [None if rank == NULL_INT else rank for rank in ranks] == [card.edhrec_rank for card in cards]
+        assert snapshot.value("edhrec_rank", 0) == cards[0].edhrec_rank
+        with pytest.raises(KeyError):
+            snapshot.column("not a column")
+
+
+def test_find(cards: list[Card], snapshot_path: Path):
+    with CardSnapshot(snapshot_path) as snapshot:
+        positions = snapshot.find("name", "Ancestral Recall")
+        assert positions == [i for i, card in enumerate(cards) if card.name == "Ancestral Recall"]
+        assert snapshot[positions[0]].name == "Ancestral Recall"
+        assert snapshot.find("name", "Not a card name") == []
+        with pytest.raises(KeyError):
+            snapshot.find("cmc", "1")
+
+
+def test_empty(tmp_path: Path):
+    path = tmp_path / "cards.snapshot"
+    build_snapshot([], path)
+    with CardSnapshot(path) as snapshot:
+        assert len(snapshot) == 0
+        assert list(snapshot) == []
+
+
+@pytest.mark.parametrize("content", [b"", b"[]", b"SCZSNAP\x00" + bytes(16)])
+def test_not_a_snapshot(content: bytes, tmp_path: Path):
+    path = tmp_path / "cards.snapshot"
+    path.write_bytes(content)
+    with pytest.raises(SnapshotFormatError):
+        CardSnapshot(path)
@@ -1,11 +1,14 @@
+import pickle
 from collections import Counter
 from sys import maxsize
 
 import pytest
-from scooze.catalogs import Format
+from scooze.catalogs import Color, Format, Legality
 from scooze.utils import (
     CostSymbol,
     DictDiff,
+    HashableObject,
+    JsonNormalizer,
     cmdr_size,
     main_size,
     max_card_quantity,
@@ -681,6 +684,114 @@ def test_parse_symbols_with_hybrid(mana_cost_with_hybrid):
 
 # endregion
 
+# endregion
+
+# region HashableObject
+
+
+class Point(HashableObject):
+    def __init__(self, x: int, y: int):
+        self.x = x
+        self.y = y
+
+
+class SlottedPoint(HashableObject):
+    __slots__ = ("x",)
+
+    def __init__(self, x: int):
+        self.x = x
+
+
+class LabeledPoint(SlottedPoint):
+    def __init__(self, x: int, label: str):
+        super().__init__(x)
+        self.label = label
+
+
+def test_hashable_object_without_slots():
+    assert Point(1, 2) == Point(1, 2)
+    assert hash(Point(1, 2)) == hash(Point(1, 2))
+    assert Point(1, 2) != Point(2, 1)
+    assert hash(Point(1, 2)) != hash(Point(2, 1))
+    assert Point(1, 2).__dict__ == {"x": 1, "y": 2}
+
+
+def test_hashable_object_partly_slotted():
+    assert LabeledPoint(1, "a") == LabeledPoint(1, "a")
+    assert LabeledPoint(1, "a") != LabeledPoint(1, "b")
+    assert LabeledPoint(1, "a") != LabeledPoint(2, "a")
+    assert hash(LabeledPoint(1, "a")) != hash(LabeledPoint(1, "b"))
+    assert pickle.loads(pickle.dumps(LabeledPoint(1, "a"))) == LabeledPoint(1, "a")
+
+
+# endregion
+
+# region Enum normalization
+
+
+def test_to_enum_by_value():
+    assert JsonNormalizer.to_enum(Legality, "legal") is Legality.LEGAL
+    assert JsonNormalizer.to_enum(Legality, Legality.BANNED) is Legality.BANNED
+    assert JsonNormalizer.to_enum(Legality, None) is None
+
+
+def test_to_enum_by_name():
+    assert JsonNormalizer.to_enum(Legality, "NOT_LEGAL") is Legality.NOT_LEGAL
+    assert JsonNormalizer.to_enum(Legality, "Not_Legal") is Legality.NOT_LEGAL
+    with pytest.raises(KeyError):
+        JsonNormalizer.to_enum(Legality, "not a legality")
+
+
+def test_enum_lookup_tables():
+    assert Format.list() == [fmt.value for fmt in Format]
+    assert Format.list() is not Format.list()
+    assert Color.has_value("U")
+    assert Color.has_value(CostSymbol.BLUE)
+    assert not Color.has_value(CostSymbol.GENERIC_1)
+    assert not Color.has_value(["U"])
+    assert Color["blue"] is Color.BLUE
+
+
+def test_to_frozendict_interned():
+    legalities = JsonNormalizer.to_frozendict(
+        {"standard": "legal", "vintage": "restricted"}, convert_key_to_enum=Format, convert_value_to_enum=Legality
+    )
+    same_legalities = JsonNormalizer.to_frozendict(
+        {"standard": "legal", "vintage": "restricted"}, convert_key_to_enum=Format, convert_value_to_enum=Legality
+    )
+    assert same_legalities is legalities
+    assert list(legalities) == [Format.STANDARD, Format.VINTAGE]
+    # Plain strings aren't shared with the equal Enums
+    assert JsonNormalizer.to_frozendict({"standard": "legal", "vintage": "restricted"}) is not legalities
+    assert JsonNormalizer.to_frozendict({"cards": ["unhashable"]}) == {"cards": ["unhashable"]}
+
+
+def test_to_frozenset_interned():
+    colors = JsonNormalizer.to_frozenset(["W", "U"], convert_to_enum=Color)
+    assert JsonNormalizer.to_frozenset(["U", "W"], convert_to_enum=Color) is colors
+    assert all(isinstance(color, Color) for color in JsonNormalizer.to_frozenset(["W", "U"], convert_to_enum=Color))
+
+
+def test_interned_keeps_types():
+    ints = JsonNormalizer.to_frozenset([1])
+    bools = JsonNormalizer.to_frozenset([True])
+    assert JsonNormalizer.to_frozenset([1]) is ints
+    assert type(next(iter(ints))) is int
+    assert type(next(iter(bools))) is bool
+    prices = JsonNormalizer.to_frozendict({"usd": 1})
+    assert type(JsonNormalizer.to_frozendict({"usd": 1.0})["usd"]) is float
+    assert type(prices["usd"]) is int
+    strings = JsonNormalizer.to_frozenset(["U"])
+    assert JsonNormalizer.to_frozenset(["U"]) is strings
+    assert all(type(color) is Color for color in JsonNormalizer.to_frozenset(["U"], convert_to_enum=Color))
+
+
+def test_to_str_interned():
+    set_name = "".join(["Seventh ", "Edition"])
+    assert JsonNormalizer.to_str(set_name) is JsonNormalizer.to_str("".join(["Seventh ", "Edition"]))
+    assert JsonNormalizer.to_str(None) is None
+
+
 # endregion
 
 # endregion